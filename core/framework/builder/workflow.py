@@ -13,6 +13,7 @@
 You cannot skip steps or bypass validation.
 """
 
+import time
 from collections.abc import Callable
 from datetime import datetime
 from enum import StrEnum
@@ -66,6 +67,7 @@ class TestResult(BaseModel):
     actual_output: Any = None
     error: str | None = None
     execution_path: list[str] = Field(default_factory=list)
+    duration_ms: int = 0
 
 
 class BuildSession(BaseModel):
@@ -451,8 +453,19 @@ def run_test(
 
         executor_factory should return a configured GraphExecutor.
         """
+        import asyncio
+
+        return asyncio.run(self._run_test(test, executor_factory))
+
+    async def _run_test(
+        self,
+        test: TestCase,
+        executor_factory: Callable,
+    ) -> TestResult:
+        """Run a single test case and record its result in the session."""
         self._require_phase([BuildPhase.ADDING_NODES, BuildPhase.ADDING_EDGES, BuildPhase.TESTING])
         self.session.phase = BuildPhase.TESTING
+        start = time.perf_counter()
 
         try:
             # Build temporary graph for testing
@@ -460,14 +473,10 @@ def run_test(
             executor = executor_factory()
 
             # Run the test
-            import asyncio
-
-            result = asyncio.run(
-                executor.execute(
-                    graph=graph,
-                    goal=self.session.goal,
-                    input_data=test.input,
-                )
+            result = await executor.execute(
+                graph=graph,
+                goal=self.session.goal,
+                input_data=test.input,
             )
 
             # Check result
@@ -492,18 +501,58 @@ def run_test(
                 error=str(e),
             )
 
+        test_result.duration_ms = int((time.perf_counter() - start) * 1000)
         self.session.test_results.append(test_result)
         self._save_session()
 
         return test_result
 
-    def run_all_tests(self, executor_factory: Callable) -> list[TestResult]:
-        """Run all test cases."""
-        results = []
-        for test in self.session.test_cases:
-            result = self.run_test(test, executor_factory)
-            results.append(result)
-        return results
+    def run_all_tests(self, executor_factory: Callable, concurrency: int = 1) -> list[TestResult]:
+        """
+        Run all test cases on one event loop rather than one loop per test.
+
+        See arun_all_tests for the meaning of concurrency.
+        """
+        import asyncio
+
+        return asyncio.run(self.arun_all_tests(executor_factory, concurrency))
+
+    async def arun_all_tests(
+        self, executor_factory: Callable, concurrency: int = 1
+    ) -> list[TestResult]:
+        """
+        Run all test cases, up to concurrency of them at a time.
+
+        Test runs are dominated by waiting on LLM and tool calls, so running
+        several at once shortens a suite roughly by the concurrency factor.
+        Each test gets its own executor from executor_factory, but anything
+        the executors share (LLM providers, tool clients) must tolerate
+        concurrent use; leave concurrency at 1 if it does not.
+
+        With concurrency above 1, tests are started longest first by their
+        previous duration, so a slow test does not end up running alone
+        after the others finish.  At 1 they run in session order.
+
+        Returns:
+            Results in the order of the session's test cases
+        """
+        import asyncio
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def run_one(test: TestCase) -> TestResult:
+            async with semaphore:
+                return await self._run_test(test, executor_factory)
+
+        tests = self.session.test_cases
+        order = list(range(len(tests)))
+        if concurrency > 1:
+            last_duration = {r.test_id: r.duration_ms for r in self.session.test_results}
+            order.sort(key=lambda i: -last_duration.get(tests[i].id, 0))
+        results = await asyncio.gather(*(run_one(tests[i]) for i in order))
+
+        by_index = dict(zip(order, results, strict=True))
+        return [by_index[i] for i in range(len(tests))]
 
     # =========================================================================
     # APPROVAL
@@ -29,7 +29,7 @@
 
 from pydantic import BaseModel, Field, model_validator
 
-from framework.graph.safe_eval import safe_eval
+from framework.graph.safe_eval import expression_names, safe_eval
 
 logger = logging.getLogger(__name__)
 
@@ -182,20 +182,21 @@ def _evaluate_condition(
             # Safe evaluation using AST-based whitelist
             result = bool(safe_eval(self.condition_expr, context))
             # Log the evaluation for visibility
-            # Extract the variable names used in the expression for debugging
-            expr_vars = {
-                k: repr(context[k])
-                for k in context
-                if k not in ("output", "memory", "result", "true", "false")
-                and k in self.condition_expr
-            }
-            logger.info(
-                "  Edge %s: condition '%s' → %s  (vars: %s)",
-                self.id,
-                self.condition_expr,
-                result,
-                expr_vars or "none matched",
-            )
+            # Only the names the expression reads (from its cached AST) are
+            # looked up, rather than substring-matching every memory key
+            if logger.isEnabledFor(logging.INFO):
+                expr_vars = {
+                    k: repr(context[k])
+                    for k in sorted(expression_names(self.condition_expr))
+                    if k in context and k not in ("output", "memory", "result", "true", "false")
+                }
+                logger.info(
+                    "  Edge %s: condition '%s' → %s  (vars: %s)",
+                    self.id,
+                    self.condition_expr,
+                    result,
+                    expr_vars or "none matched",
+                )
             return result
         except Exception as e:
             logger.warning(f"      ⚠ Condition evaluation failed: {self.condition_expr}")
@@ -451,14 +451,15 @@ async def execute(self, ctx: NodeContext) -> NodeResult:
                         continue  # retry same iteration
 
                     # Non-transient or retries exhausted — existing crash handler
-                    import traceback
-
                     iter_latency_ms = int((time.time() - iter_start) * 1000)
                     latency_ms = int((time.time() - start_time) * 1000)
                     error_msg = f"LLM call failed: {e}"
-                    stack_trace = traceback.format_exc()
 
                     if ctx.runtime_logger:
+                        # Only format the traceback when it will be logged
+                        import traceback
+
+                        stack_trace = traceback.format_exc()
                         ctx.runtime_logger.log_step(
                             node_id=node_id,
                             node_type="event_loop",
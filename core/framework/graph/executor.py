@@ -1365,10 +1365,6 @@ async def execute(
             )
 
         except Exception as e:
-            import traceback
-
-            stack_trace = traceback.format_exc()
-
             self.runtime.report_problem(
                 severity="critical",
                 description=str(e),
@@ -1378,15 +1374,18 @@ async def execute(
                 narrative=f"Failed at step {steps}: {e}",
             )
 
-            # Log the crashing node to L2 with full stack trace
+            # Log the crashing node to L2 with full stack trace (formatted
+            # only here: it walks every frame and reads source lines)
             if self.runtime_logger and node_spec is not None:
+                import traceback
+
                 self.runtime_logger.ensure_node_logged(
                     node_id=node_spec.id,
                     node_name=node_spec.name,
                     node_type=node_spec.node_type,
                     success=False,
                     error=str(e),
-                    stacktrace=stack_trace,
+                    stacktrace=traceback.format_exc(),
                 )
 
             # Calculate quality metrics even for exceptions
@@ -1933,22 +1932,21 @@ async def execute_single_branch(
                 return branch, last_result
 
             except Exception as e:
-                import traceback
-
-                stack_trace = traceback.format_exc()
                 branch.status = "failed"
                 branch.error = str(e)
                 self.logger.error(f"      ✗ Branch {branch.node_id}: exception - {e}")
 
                 # Log the crashing branch node to L2 with full stack trace
                 if self.runtime_logger and node_spec is not None:
+                    import traceback
+
                     self.runtime_logger.ensure_node_logged(
                         node_id=node_spec.id,
                         node_name=node_spec.name,
                         node_type=node_spec.node_type,
                         success=False,
                         error=str(e),
-                        stacktrace=stack_trace,
+                        stacktrace=traceback.format_exc(),
                     )
 
                 return branch, e
@@ -1,4 +1,5 @@
 import ast
+import functools
 import operator
 from typing import Any
 
@@ -221,6 +222,32 @@ def visit_Index(self, node: ast.Index) -> Any:
         return self.visit(node.value)
 
 
+@functools.lru_cache(maxsize=256)
+def parse_expression(expr: str) -> ast.Expression:
+    """
+    Parse an expression string into an AST, caching the result.
+
+    Edge conditions are evaluated on every traversal but only ever come
+    from a handful of distinct strings, so the parse is done once per
+    expression. The returned tree is shared and must not be mutated.
+
+    Raises:
+        SyntaxError: If the expression is invalid Python.
+    """
+    try:
+        return ast.parse(expr, mode="eval")
+    except SyntaxError as e:
+        raise SyntaxError(f"Invalid syntax in expression: {e}") from e
+
+
+@functools.lru_cache(maxsize=256)
+def expression_names(expr: str) -> frozenset[str]:
+    """Return the variable names read by an expression (cached per expression)."""
+    return frozenset(
+        node.id for node in ast.walk(parse_expression(expr)) if isinstance(node, ast.Name)
+    )
+
+
 def safe_eval(expr: str, context: dict[str, Any] | None = None) -> Any:
     """
     Safely evaluate a python expression string.
@@ -243,10 +270,7 @@ def safe_eval(expr: str, context: dict[str, Any] | None = None) -> Any:
     full_context = context.copy()
     full_context.update(SAFE_FUNCTIONS)
 
-    try:
-        tree = ast.parse(expr, mode="eval")
-    except SyntaxError as e:
-        raise SyntaxError(f"Invalid syntax in expression: {e}") from e
+    tree = parse_expression(expr)
 
     visitor = SafeEvalVisitor(full_context)
     return visitor.visit(tree)
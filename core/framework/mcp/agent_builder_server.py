@@ -7,12 +7,17 @@
     uv run python -m framework.mcp.agent_builder_server
 """
 
+import functools
 import json
 import logging
 import os
+import re
 import sys
+from collections import deque
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Annotated
 
 # Project root resolution.  This file lives at core/framework/mcp/agent_builder_server.py,
@@ -36,12 +41,13 @@
     NodeSpec,
     SuccessCriterion,
 )
+from framework.graph.safe_eval import parse_expression  # noqa: E402
 
 # Testing framework imports
 from framework.testing.prompts import (  # noqa: E402
     PYTEST_TEST_FILE_HEADER,
 )
-from framework.utils.io import atomic_write  # noqa: E402
+from framework.utils.io import atomic_write, atomic_write_bytes, json_loads  # noqa: E402
 
 # Initialize MCP server
 mcp = FastMCP("agent-builder")
@@ -51,6 +57,31 @@
 SESSIONS_DIR = Path(".agent-builder-sessions")
 ACTIVE_SESSION_FILE = SESSIONS_DIR / ".active"
 
+# Edge condition names accepted by add_edge and stored in sessions/exports
+_EDGE_CONDITIONS: dict[str, EdgeCondition] = {
+    "always": EdgeCondition.ALWAYS,
+    "on_success": EdgeCondition.ON_SUCCESS,
+    "on_failure": EdgeCondition.ON_FAILURE,
+    "conditional": EdgeCondition.CONDITIONAL,
+    "llm_decide": EdgeCondition.LLM_DECIDE,
+}
+
+# Node types that were removed in favour of event_loop
+_REMOVED_NODE_TYPES = frozenset({"function", "llm_tool_use", "llm_generate"})
+
+# Router route names that auto-generate on_failure edges on export
+_FAILURE_ROUTE_NAMES = frozenset({"fail", "error", "escalate"})
+
+# Input keys a resume entry node may receive from the resumed invocation
+_EXTERNAL_INPUT_KEYS = frozenset({"input", "user_response", "user_input", "answer", "answers"})
+
+# Fields every success criterion and constraint passed to set_goal must carry
+_GOAL_ITEM_REQUIRED_FIELDS = ("id", "description")
+
+# Shared read-only default for .get() lookups in per-item loops; sequence
+# defaults use the empty tuple ``()`` for the same reason
+_EMPTY_MAPPING = MappingProxyType({})
+
 
 # Session storage
 class BuildSession:
@@ -66,6 +97,10 @@ def __init__(self, name: str, session_id: str | None = None):
         self.loop_config: dict = {}  # LoopConfig parameters for EventLoopNodes
         self.created_at = datetime.now().isoformat()
         self.last_modified = datetime.now().isoformat()
+        # Serialized read-only tool responses, dropped on every save
+        self.response_cache: dict[str, str] = {}
+        # (ordered, cyclic) node ids over forward edges, dropped on every save
+        self.topo_order: tuple[list[str], list[str]] | None = None
 
     def to_dict(self) -> dict:
         """Serialize session to dictionary."""
@@ -110,14 +145,7 @@ def from_dict(cls, data: dict) -> "BuildSession":
             # Convert condition string back to enum
             condition_str = e.get("condition")
             if isinstance(condition_str, str):
-                condition_map = {
-                    "always": EdgeCondition.ALWAYS,
-                    "on_success": EdgeCondition.ON_SUCCESS,
-                    "on_failure": EdgeCondition.ON_FAILURE,
-                    "conditional": EdgeCondition.CONDITIONAL,
-                    "llm_decide": EdgeCondition.LLM_DECIDE,
-                }
-                e["condition"] = condition_map.get(condition_str, EdgeCondition.ON_SUCCESS)
+                e["condition"] = _EDGE_CONDITIONS.get(condition_str, EdgeCondition.ON_SUCCESS)
             session.edges.append(EdgeSpec(**e))
 
         # Restore MCP servers
@@ -142,8 +170,10 @@ def _save_session(session: BuildSession):
     """Save session to disk."""
     _ensure_sessions_dir()
 
-    # Update last modified
+    # Update last modified; any cached responses describe the old state
     session.last_modified = datetime.now().isoformat()
+    session.response_cache.clear()
+    session.topo_order = None
 
     # Save session file
     session_file = SESSIONS_DIR / f"{session.id}.json"
@@ -161,8 +191,7 @@ def _load_session(session_id: str) -> BuildSession:
     if not session_file.exists():
         raise ValueError(f"Session '{session_id}' not found")
 
-    with open(session_file) as f:
-        data = json.load(f)
+    data = json_loads(session_file.read_bytes())
 
     return BuildSession.from_dict(data)
 
@@ -197,6 +226,64 @@ def get_session() -> BuildSession:
     return _session
 
 
+def _cached_response(session: BuildSession, name: str, build: Callable[[], str]) -> str:
+    """Return a read-only tool response, rebuilding it only after the session is saved.
+
+    Every tool that mutates the session calls _save_session(), which clears
+    the cache, so polling validate_graph/get_session_status between edits
+    serializes the result once.
+    """
+    response = session.response_cache.get(name)
+    if response is None:
+        response = session.response_cache[name] = build()
+    return response
+
+
+def _forward_topo_order(session: BuildSession) -> tuple[list[str], list[str]]:
+    """Return the nodes in topological order over forward edges, plus the leftovers.
+
+    Feedback edges (priority < 0) are ignored.  Nodes that never reach
+    indegree 0 sit on (or behind) a forward cycle and are returned as the
+    second list.  The result is computed once per saved graph revision, so
+    validate_graph, export_graph and test_graph share a single sort.
+    """
+    if session.topo_order is not None:
+        return session.topo_order
+
+    # Kahn's algorithm: each forward edge is visited once.  Children are
+    # listed in node order so ties break the same way on every call.
+    forward_dependencies: dict[str, list[str]] = {node.id: [] for node in session.nodes}
+    for edge in session.edges:
+        if edge.priority >= 0 and edge.target in forward_dependencies:
+            forward_dependencies[edge.target].append(edge.source)
+
+    forward_children: dict[str, list[str]] = {node_id: [] for node_id in forward_dependencies}
+    indegree: dict[str, int] = {}
+    for node_id, fwd_deps in forward_dependencies.items():
+        indegree[node_id] = len(fwd_deps)
+        for dep_id in fwd_deps:
+            if dep_id in forward_children:
+                forward_children[dep_id].append(node_id)
+
+    ready = deque(node_id for node_id, degree in indegree.items() if degree == 0)
+    ordered: list[str] = []
+    while ready:
+        node_id = ready.popleft()
+        ordered.append(node_id)
+        for child_id in forward_children[node_id]:
+            indegree[child_id] -= 1
+            if indegree[child_id] == 0:
+                ready.append(child_id)
+
+    cyclic: list[str] = []
+    if len(ordered) < len(indegree):
+        placed = set(ordered)
+        cyclic = [node_id for node_id in indegree if node_id not in placed]
+
+    session.topo_order = (ordered, cyclic)
+    return session.topo_order
+
+
 # =============================================================================
 # MCP TOOLS
 # =============================================================================
@@ -218,6 +305,29 @@ def create_session(name: Annotated[str, "Name for the agent being built"]) -> st
     )
 
 
+@functools.lru_cache(maxsize=256)
+def _read_session_summary(session_file: str, mtime_ns: int, size: int) -> dict | None:
+    """Parse a saved session into its list_sessions summary.
+
+    Cached on (path, mtime, size) so polling list_sessions only re-reads
+    session files that changed since the last call.
+    """
+    try:
+        with open(session_file, "rb") as f:
+            data = json_loads(f.read())
+        return {
+            "session_id": data["session_id"],
+            "name": data["name"],
+            "created_at": data.get("created_at"),
+            "last_modified": data.get("last_modified"),
+            "node_count": len(data.get("nodes", ())),
+            "edge_count": len(data.get("edges", ())),
+            "has_goal": data.get("goal") is not None,
+        }
+    except Exception:
+        return None  # Skip corrupted files
+
+
 @mcp.tool()
 def list_sessions() -> str:
     """List all saved agent building sessions."""
@@ -227,21 +337,12 @@ def list_sessions() -> str:
     if SESSIONS_DIR.exists():
         for session_file in SESSIONS_DIR.glob("*.json"):
             try:
-                with open(session_file) as f:
-                    data = json.load(f)
-                    sessions.append(
-                        {
-                            "session_id": data["session_id"],
-                            "name": data["name"],
-                            "created_at": data.get("created_at"),
-                            "last_modified": data.get("last_modified"),
-                            "node_count": len(data.get("nodes", [])),
-                            "edge_count": len(data.get("edges", [])),
-                            "has_goal": data.get("goal") is not None,
-                        }
-                    )
-            except Exception:
-                pass  # Skip corrupted files
+                stat = session_file.stat()
+            except OSError:
+                continue
+            summary = _read_session_summary(str(session_file), stat.st_mtime_ns, stat.st_size)
+            if summary is not None:
+                sessions.append(summary)
 
     # Check which session is currently active
     active_id = None
@@ -379,23 +480,16 @@ def set_goal(
         warnings.append("Consider adding constraints")
 
     # Validate required fields in criteria and constraints
-    for i, sc in enumerate(criteria_list):
-        if not isinstance(sc, dict):
-            errors.append(f"success_criteria[{i}] must be an object")
-        else:
-            if "id" not in sc:
-                errors.append(f"success_criteria[{i}] missing required field 'id'")
-            if "description" not in sc:
-                errors.append(f"success_criteria[{i}] missing required field 'description'")
-
-    for i, c in enumerate(constraint_list):
-        if not isinstance(c, dict):
-            errors.append(f"constraints[{i}] must be an object")
-        else:
-            if "id" not in c:
-                errors.append(f"constraints[{i}] missing required field 'id'")
-            if "description" not in c:
-                errors.append(f"constraints[{i}] missing required field 'description'")
+    for label, items in (("success_criteria", criteria_list), ("constraints", constraint_list)):
+        for i, item in enumerate(items):
+            if not isinstance(item, dict):
+                errors.append(f"{label}[{i}] must be an object")
+            else:
+                errors.extend(
+                    f"{label}[{i}] missing required field '{field}'"
+                    for field in _GOAL_ITEM_REQUIRED_FIELDS
+                    if field not in item
+                )
 
     # Return early if validation failed
     if errors:
@@ -665,7 +759,7 @@ def add_node(
         errors.append("Node must have a name")
 
     # Reject removed node types
-    if node_type in ("function", "llm_tool_use", "llm_generate"):
+    if node_type in _REMOVED_NODE_TYPES:
         errors.append(f"Node type '{node_type}' is no longer supported. Use 'event_loop' instead.")
 
     if node_type == "router" and not routes_dict:
@@ -746,14 +840,7 @@ def add_edge(
         return json.dumps({"valid": False, "errors": [f"Edge '{edge_id}' already exists"]})
 
     # Map condition string to enum
-    condition_map = {
-        "always": EdgeCondition.ALWAYS,
-        "on_success": EdgeCondition.ON_SUCCESS,
-        "on_failure": EdgeCondition.ON_FAILURE,
-        "conditional": EdgeCondition.CONDITIONAL,
-        "llm_decide": EdgeCondition.LLM_DECIDE,
-    }
-    edge_condition = condition_map.get(condition, EdgeCondition.ON_SUCCESS)
+    edge_condition = _EDGE_CONDITIONS.get(condition, EdgeCondition.ON_SUCCESS)
 
     edge = EdgeSpec(
         id=edge_id,
@@ -776,6 +863,11 @@ def add_edge(
         errors.append(f"Target node '{target}' not found")
     if edge_condition == EdgeCondition.CONDITIONAL and not condition_expr:
         errors.append(f"Conditional edge '{edge_id}' needs condition_expr")
+    if condition_expr:
+        try:
+            parse_expression(condition_expr)
+        except SyntaxError as e:
+            errors.append(f"Edge '{edge_id}' has an invalid condition_expr: {e}")
 
     # Feedback edge validation
     if priority < 0:
@@ -911,7 +1003,7 @@ def update_node(
     warnings = []
 
     # Reject removed node types
-    if node.node_type in ("function", "llm_tool_use", "llm_generate"):
+    if node.node_type in _REMOVED_NODE_TYPES:
         errors.append(
             f"Node type '{node.node_type}' is no longer supported. Use 'event_loop' instead."
         )
@@ -1040,19 +1132,42 @@ def delete_edge(
 
 
 @mcp.tool()
-def validate_graph() -> str:
+def validate_graph(
+    detailed: Annotated[
+        bool, "If false, only report whether the graph is valid (stops at the first error)"
+    ] = True,
+) -> str:
     """Validate the graph. Checks for unreachable nodes and context flow."""
     session = get_session()
+    if not detailed:
+        return _cached_response(
+            session,
+            "validate_graph:valid",
+            lambda: json.dumps({"valid": _validate_graph(session, detailed=False)["valid"]}),
+        )
+    return _cached_response(session, "validate_graph", lambda: json.dumps(_validate_graph(session)))
+
+
+def _validate_graph(session: BuildSession, *, detailed: bool = True) -> dict:
+    """Run graph validation and return the result as a dict.
+
+    Internal callers (export_graph, test_graph) use this directly instead of
+    round-tripping the validate_graph tool response through JSON.
+
+    With ``detailed=False`` only ``{"valid": ...}`` is returned, and
+    validation stops after the first group of checks that reports an
+    error instead of running the remaining groups.
+    """
     errors = []
     warnings = []
 
     if not session.goal:
         errors.append("No goal defined")
-        return json.dumps({"valid": False, "errors": errors})
+        return {"valid": False, "errors": errors}
 
     if not session.nodes:
         errors.append("No nodes defined")
-        return json.dumps({"valid": False, "errors": errors})
+        return {"valid": False, "errors": errors}
 
     # === DETECT PAUSE/RESUME ARCHITECTURE ===
     # Identify pause nodes (nodes marked as PAUSE in description)
@@ -1066,6 +1181,7 @@ def validate_graph() -> str:
     ]
 
     is_pause_resume_agent = len(pause_nodes) > 0 or len(resume_entry_points) > 0
+    nodes_by_id = {n.id: n for n in session.nodes}
 
     if is_pause_resume_agent:
         warnings.append(
@@ -1074,10 +1190,8 @@ def validate_graph() -> str:
         )
 
     # Find entry node (no incoming edges)
-    entry_candidates = []
-    for node in session.nodes:
-        if not any(e.target == node.id for e in session.edges):
-            entry_candidates.append(node.id)
+    edge_targets = {e.target for e in session.edges}
+    entry_candidates = [n.id for n in session.nodes if n.id not in edge_targets]
 
     if not entry_candidates:
         errors.append("No entry node found (all nodes have incoming edges)")
@@ -1086,16 +1200,19 @@ def validate_graph() -> str:
         warnings.append(f"Multiple entry candidates: {entry_candidates}")
 
     # Find terminal nodes (no outgoing edges)
-    terminal_candidates = []
-    for node in session.nodes:
-        if not any(e.source == node.id for e in session.edges):
-            terminal_candidates.append(node.id)
+    edge_sources = {e.source for e in session.edges}
+    terminal_candidates = [n.id for n in session.nodes if n.id not in edge_sources]
 
     if not terminal_candidates:
         warnings.append("No terminal nodes found")
 
     # Check reachability
     if entry_candidates:
+        # Adjacency built once so the walk touches each edge a single time
+        successors: dict[str, list[str]] = {}
+        for edge in session.edges:
+            successors.setdefault(edge.source, []).append(edge.target)
+
         reachable = set()
 
         # Start from ALL entry candidates (nodes without incoming edges).
@@ -1109,13 +1226,10 @@ def validate_graph() -> str:
             if current in reachable:
                 continue
             reachable.add(current)
-            for edge in session.edges:
-                if edge.source == current:
-                    to_visit.append(edge.target)
-            for node in session.nodes:
-                if node.id == current and node.routes:
-                    for tgt in node.routes.values():
-                        to_visit.append(tgt)
+            to_visit.extend(successors.get(current, ()))
+            current_node = nodes_by_id.get(current)
+            if current_node and current_node.routes:
+                to_visit.extend(current_node.routes.values())
 
         unreachable = [n.id for n in session.nodes if n.id not in reachable]
         if unreachable:
@@ -1131,71 +1245,93 @@ def validate_graph() -> str:
             else:
                 errors.append(f"Unreachable nodes: {unreachable}")
 
+    if errors and not detailed:
+        return {"valid": False}
+
     # === CONTEXT FLOW VALIDATION ===
     # Build dependency maps — separate forward edges from feedback edges.
     # Feedback edges (priority < 0) create cycles; they must not block the
     # topological sort.  Context they carry arrives on *revisits*, not on
     # the first execution of a node.
+    #
+    # The propagation works on parallel lists indexed by node position
+    # (node_index) rather than dicts keyed by node id; the id-keyed maps
+    # are kept only for error-message generation.
     feedback_edge_ids = {e.id for e in session.edges if e.priority < 0}
-    forward_dependencies: dict[str, list[str]] = {node.id: [] for node in session.nodes}
+    node_index = {node.id: i for i, node in enumerate(session.nodes)}
+    forward_deps_idx: list[list[int]] = [[] for _ in session.nodes]
+    feedback_deps_idx: list[list[int]] = [[] for _ in session.nodes]
     feedback_sources: dict[str, list[str]] = {node.id: [] for node in session.nodes}
     # Combined map kept for error-message generation (all deps)
     dependencies: dict[str, list[str]] = {node.id: [] for node in session.nodes}
 
     for edge in session.edges:
-        if edge.target not in forward_dependencies:
+        target_idx = node_index.get(edge.target)
+        if target_idx is None:
             continue
         dependencies[edge.target].append(edge.source)
+        # Sources that are not nodes contribute no context (and keep
+        # their target out of topo_order when the edge is forward)
+        source_idx = node_index.get(edge.source)
         if edge.id in feedback_edge_ids:
             feedback_sources[edge.target].append(edge.source)
-        else:
-            forward_dependencies[edge.target].append(edge.source)
-
-    # Build output map (node_id -> keys it produces)
-    node_outputs: dict[str, set[str]] = {node.id: set(node.output_keys) for node in session.nodes}
+            if source_idx is not None:
+                feedback_deps_idx[target_idx].append(source_idx)
+        elif source_idx is not None:
+            forward_deps_idx[target_idx].append(source_idx)
+
+    # Context sets are int bitmasks: each output key gets one bit, so the
+    # propagation below is a handful of integer ORs per edge instead of
+    # set unions over strings.
+    key_bits: dict[str, int] = {}
+    node_outputs: list[int] = [0] * len(session.nodes)
+    for node in session.nodes:
+        mask = 0
+        for key in node.output_keys:
+            bit = key_bits.get(key)
+            if bit is None:
+                bit = key_bits[key] = 1 << len(key_bits)
+            mask |= bit
+        node_outputs[node_index[node.id]] = mask
 
     # Compute available context for each node (what keys it can read)
-    # Using topological order on the forward-edge DAG
-    available_context: dict[str, set[str]] = {}
-    computed = set()
-    nodes_by_id = {n.id: n for n in session.nodes}
+    # Using topological order on the forward-edge DAG; None until computed
+    available_context: list[int | None] = [None] * len(session.nodes)
 
     # Initial context keys that will be provided at runtime
     # These are typically the inputs like lead_id, gtm_table_id, etc.
     # Entry nodes can only read from initial context
-    initial_context_keys: set[str] = set()
+    initial_context = 0
 
     # Compute in topological order (forward edges only — feedback edges
-    # don't block, since their context arrives on revisits)
-    remaining = {n.id for n in session.nodes}
-    max_iterations = len(session.nodes) * 2
-
-    for _ in range(max_iterations):
-        if not remaining:
-            break
+    # don't block, since their context arrives on revisits).
+    topo_order, cyclic = _forward_topo_order(session)
+    if cyclic:
+        warnings.append(
+            f"Context flow could not be computed for nodes {cyclic}: they are on "
+            "(or downstream of) a cycle of forward edges. Mark loop-back edges as "
+            "feedback edges (priority < 0)."
+        )
 
-        for node_id in list(remaining):
-            fwd_deps = forward_dependencies.get(node_id, [])
-
-            # Can compute if all FORWARD dependencies are computed
-            if all(d in computed for d in fwd_deps):
-                # Collect outputs from all forward dependencies
-                available = set(initial_context_keys)
-                for dep_id in fwd_deps:
-                    available.update(node_outputs.get(dep_id, set()))
-                    available.update(available_context.get(dep_id, set()))
-
-                # Also include context from already-computed feedback
-                # sources (bonus, not blocking)
-                for fb_src in feedback_sources.get(node_id, []):
-                    if fb_src in computed:
-                        available.update(node_outputs.get(fb_src, set()))
-                        available.update(available_context.get(fb_src, set()))
-
-                available_context[node_id] = available
-                computed.add(node_id)
-                remaining.remove(node_id)
-                break
+    # Single pass: every forward dependency precedes its target in
+    # topo_order, so its context is final by the time it is read.
+    for node_id in topo_order:
+        i = node_index[node_id]
+        # Collect outputs from all forward dependencies
+        available = initial_context
+        for dep in forward_deps_idx[i]:
+            available |= node_outputs[dep]
+            available |= available_context[dep]
+
+        # Also include context from already-computed feedback
+        # sources (bonus, not blocking)
+        for fb in feedback_deps_idx[i]:
+            fb_available = available_context[fb]
+            if fb_available is not None:
+                available |= node_outputs[fb]
+                available |= fb_available
+
+        available_context[i] = available
 
     # Check each node's input requirements
     context_errors = []
@@ -1204,17 +1340,22 @@ def validate_graph() -> str:
     feedback_only_inputs: dict[str, list[str]] = {}
 
     for node in session.nodes:
-        available = available_context.get(node.id, set())
+        i = node_index[node.id]
+        available = available_context[i] or 0
+        fb_provides: int | None = None
 
         for input_key in node.input_keys:
-            if input_key not in available:
+            bit = key_bits.get(input_key, 0)
+            if not available & bit:
                 # Check if this input is provided by a feedback source
-                fb_provides = set()
-                for fb_src in feedback_sources.get(node.id, []):
-                    fb_provides.update(node_outputs.get(fb_src, set()))
-                    fb_provides.update(available_context.get(fb_src, set()))
-
-                if input_key in fb_provides:
+                # (computed once per node, on the first missing key)
+                if fb_provides is None:
+                    fb_provides = 0
+                    for fb in feedback_deps_idx[i]:
+                        fb_provides |= node_outputs[fb]
+                        fb_provides |= available_context[fb] or 0
+
+                if fb_provides & bit:
                     # Input arrives via feedback edge — warn, don't error
                     if node.id not in feedback_only_inputs:
                         feedback_only_inputs[node.id] = []
@@ -1226,17 +1367,26 @@ def validate_graph() -> str:
 
     # Warn about feedback-only inputs (available on revisits, not first run)
     for node_id, fb_keys in feedback_only_inputs.items():
-        fb_srcs = feedback_sources.get(node_id, [])
+        fb_srcs = feedback_sources[node_id]
         context_warnings.append(
             f"Node '{node_id}' input(s) {fb_keys} are only provided via "
             f"feedback edge(s) from {fb_srcs}. These will be available on "
             f"revisits but not on the first execution."
         )
 
+    # Inverted index (output key -> producing node ids) for the suggestions below
+    output_to_producers: dict[str, list[str]] = {}
+    if missing_inputs:
+        for n in session.nodes:
+            for key in n.output_keys:
+                producers = output_to_producers.setdefault(key, [])
+                if not producers or producers[-1] != n.id:
+                    producers.append(n.id)
+
     # Generate helpful error messages
     for node_id, missing in missing_inputs.items():
         node = nodes_by_id.get(node_id)
-        deps = dependencies.get(node_id, [])
+        deps = dependencies[node_id]
 
         # Check if this is a resume entry point
         is_resume_entry = node_id in resume_entry_points
@@ -1256,12 +1406,11 @@ def validate_graph() -> str:
                 )
         else:
             # Check if this is a common external input key for resume nodes
-            external_input_keys = ["input", "user_response", "user_input", "answer", "answers"]
-            unproduced_external = [k for k in missing if k in external_input_keys]
+            unproduced_external = [k for k in missing if k in _EXTERNAL_INPUT_KEYS]
 
             if is_resume_entry and unproduced_external:
                 # Resume entry points can receive external inputs from resumed invocations
-                other_missing = [k for k in missing if k not in external_input_keys]
+                other_missing = [k for k in missing if k not in _EXTERNAL_INPUT_KEYS]
 
                 if unproduced_external:
                     context_warnings.append(
@@ -1274,7 +1423,7 @@ def validate_graph() -> str:
                     # Still need to check other keys
                     suggestions = []
                     for key in other_missing:
-                        producers = [n.id for n in session.nodes if key in n.output_keys]
+                        producers = output_to_producers.get(key, ())
                         if producers:
                             suggestions.append(
                                 f"'{key}' is produced by {producers} - ensure edge exists"
@@ -1293,7 +1442,7 @@ def validate_graph() -> str:
                 # Non-resume node or no external input keys - standard validation
                 suggestions = []
                 for key in missing:
-                    producers = [n.id for n in session.nodes if key in n.output_keys]
+                    producers = output_to_producers.get(key, ())
                     if producers:
                         suggestions.append(
                             f"'{key}' is produced by {producers} - add dependency edge"
@@ -1311,22 +1460,35 @@ def validate_graph() -> str:
     errors.extend(context_errors)
     warnings.extend(context_warnings)
 
+    if errors and not detailed:
+        return {"valid": False}
+
     # === EventLoopNode-specific validation ===
     from collections import defaultdict
 
-    # Detect fan-out: multiple ON_SUCCESS edges from same source
+    # Per-edge checks share one pass over the edges:
+    # - Detect fan-out: multiple ON_SUCCESS edges from same source
+    # - Feedback loop validation: targets should allow re-visits
     outgoing_success: dict[str, list[str]] = defaultdict(list)
+    feedback_edges = []
     for edge in session.edges:
         cond = edge.condition.value if hasattr(edge.condition, "value") else edge.condition
         if cond == "on_success":
             outgoing_success[edge.source].append(edge.target)
+        if edge.priority < 0:
+            feedback_edges.append(edge.id)
+            target_node = nodes_by_id.get(edge.target)
+            if target_node and target_node.max_node_visits <= 1:
+                warnings.append(
+                    f"Feedback edge '{edge.id}' targets '{edge.target}' "
+                    f"which has max_node_visits={target_node.max_node_visits}. "
+                    "Consider setting max_node_visits > 1."
+                )
 
     for source_id, targets in outgoing_success.items():
         if len(targets) > 1:
             # Client-facing fan-out: cannot target multiple client_facing nodes
-            cf_targets = [
-                t for t in targets if any(n.id == t and n.client_facing for n in session.nodes)
-            ]
+            cf_targets = [t for t in targets if t in nodes_by_id and nodes_by_id[t].client_facing]
             if len(cf_targets) > 1:
                 errors.append(
                     f"Fan-out from '{source_id}' targets multiple client_facing "
@@ -1335,39 +1497,31 @@ def validate_graph() -> str:
 
             # Output key overlap on parallel event_loop nodes
             el_targets = [
-                t
-                for t in targets
-                if any(n.id == t and n.node_type == "event_loop" for n in session.nodes)
+                t for t in targets if t in nodes_by_id and nodes_by_id[t].node_type == "event_loop"
             ]
             if len(el_targets) > 1:
                 seen_keys: dict[str, str] = {}
                 for nid in el_targets:
-                    node_obj = next((n for n in session.nodes if n.id == nid), None)
-                    if node_obj:
-                        for key in node_obj.output_keys:
-                            if key in seen_keys:
-                                errors.append(
-                                    f"Fan-out from '{source_id}': event_loop "
-                                    f"nodes '{seen_keys[key]}' and '{nid}' both "
-                                    f"write to output_key '{key}'. Parallel "
-                                    "nodes must have disjoint output_keys."
-                                )
-                            else:
-                                seen_keys[key] = nid
-
-    # Feedback loop validation: targets should allow re-visits
-    for edge in session.edges:
-        if edge.priority < 0:
-            target_node = next((n for n in session.nodes if n.id == edge.target), None)
-            if target_node and target_node.max_node_visits <= 1:
-                warnings.append(
-                    f"Feedback edge '{edge.id}' targets '{edge.target}' "
-                    f"which has max_node_visits={target_node.max_node_visits}. "
-                    "Consider setting max_node_visits > 1."
-                )
+                    for key in nodes_by_id[nid].output_keys:
+                        if key in seen_keys:
+                            errors.append(
+                                f"Fan-out from '{source_id}': event_loop "
+                                f"nodes '{seen_keys[key]}' and '{nid}' both "
+                                f"write to output_key '{key}'. Parallel "
+                                "nodes must have disjoint output_keys."
+                            )
+                        else:
+                            seen_keys[key] = nid
+
+    if errors and not detailed:
+        return {"valid": False}
 
-    # nullable_output_keys must be subset of output_keys
+    # Per-node checks and summary info share one pass over the nodes
+    event_loop_nodes = []
+    client_facing_nodes = []
+    cf_event_loop_count = 0
     for node in session.nodes:
+        # nullable_output_keys must be subset of output_keys
         if node.nullable_output_keys:
             invalid = [k for k in node.nullable_output_keys if k not in node.output_keys]
             if invalid:
@@ -1375,44 +1529,49 @@ def validate_graph() -> str:
                     f"Node '{node.id}': nullable_output_keys {invalid} "
                     f"must be a subset of output_keys {node.output_keys}"
                 )
+        if node.node_type == "event_loop":
+            event_loop_nodes.append(node.id)
+            if node.client_facing:
+                cf_event_loop_count += 1
+        if node.client_facing:
+            client_facing_nodes.append(node.id)
 
     # Warn if all event_loop nodes are client_facing (common misconfiguration)
-    el_nodes = [n for n in session.nodes if n.node_type == "event_loop"]
-    cf_el_nodes = [n for n in el_nodes if n.client_facing]
-    if len(el_nodes) > 1 and len(cf_el_nodes) == len(el_nodes):
+    if len(event_loop_nodes) > 1 and cf_event_loop_count == len(event_loop_nodes):
         warnings.append(
-            f"ALL {len(el_nodes)} event_loop nodes are client_facing=True. "
+            f"ALL {len(event_loop_nodes)} event_loop nodes are client_facing=True. "
             "This injects ask_user() on every node. Only nodes that need user "
             "interaction (intake, review, approval) should be client_facing. Set "
             "client_facing=False on autonomous processing nodes."
         )
 
-    # Collect summary info
-    event_loop_nodes = [n.id for n in session.nodes if n.node_type == "event_loop"]
-    client_facing_nodes = [n.id for n in session.nodes if n.client_facing]
-    feedback_edges = [e.id for e in session.edges if e.priority < 0]
-
-    return json.dumps(
-        {
-            "valid": len(errors) == 0,
-            "errors": errors,
-            "warnings": warnings,
-            "entry_node": entry_candidates[0] if entry_candidates else None,
-            "terminal_nodes": terminal_candidates,
-            "node_count": len(session.nodes),
-            "edge_count": len(session.edges),
-            "pause_resume_detected": is_pause_resume_agent,
-            "pause_nodes": pause_nodes,
-            "resume_entry_points": resume_entry_points,
-            "all_entry_points": entry_candidates,
-            "context_flow": {node_id: list(keys) for node_id, keys in available_context.items()}
-            if available_context
-            else None,
-            "event_loop_nodes": event_loop_nodes,
-            "client_facing_nodes": client_facing_nodes,
-            "feedback_edges": feedback_edges,
+    if not detailed:
+        return {"valid": not errors}
+
+    return {
+        "valid": len(errors) == 0,
+        "errors": errors,
+        "warnings": warnings,
+        "entry_node": entry_candidates[0] if entry_candidates else None,
+        "terminal_nodes": terminal_candidates,
+        "node_count": len(session.nodes),
+        "edge_count": len(session.edges),
+        "pause_resume_detected": is_pause_resume_agent,
+        "pause_nodes": pause_nodes,
+        "resume_entry_points": resume_entry_points,
+        "all_entry_points": entry_candidates,
+        "context_flow": {
+            node_id: [
+                key for key, bit in key_bits.items() if available_context[node_index[node_id]] & bit
+            ]
+            for node_id in topo_order
         }
-    )
+        if topo_order
+        else None,
+        "event_loop_nodes": event_loop_nodes,
+        "client_facing_nodes": client_facing_nodes,
+        "feedback_edges": feedback_edges,
+    }
 
 
 def _generate_readme(session: BuildSession, export_data: dict, all_tools: set) -> str:
@@ -1632,7 +1791,7 @@ def export_graph() -> str:
     session = get_session()
 
     # Validate first
-    validation = json.loads(validate_graph())
+    validation = _validate_graph(session)
     if not validation["valid"]:
         return json.dumps({"success": False, "errors": validation["errors"]})
 
@@ -1652,26 +1811,29 @@ def export_graph() -> str:
     if pause_nodes and resume_entry_points:
         # Strategy 1: Try to match by checking which resume node uses the pause node's outputs
         pause_to_resume = {}
+        nodes_by_id = {n.id: n for n in session.nodes}
+        # Input key sets of each resume node, built once for all pause nodes
+        resume_inputs = {
+            resume_node_id: frozenset(nodes_by_id[resume_node_id].input_keys)
+            for resume_node_id in resume_entry_points
+            if resume_node_id in nodes_by_id
+        }
         for pause_node_id in pause_nodes:
-            pause_node = next((n for n in session.nodes if n.id == pause_node_id), None)
+            pause_node = nodes_by_id.get(pause_node_id)
             if not pause_node:
                 continue
 
             # Find resume nodes that read the outputs of this pause node
-            for resume_node_id in resume_entry_points:
-                resume_node = next((n for n in session.nodes if n.id == resume_node_id), None)
-                if not resume_node:
-                    continue
-
+            for resume_node_id, input_keys in resume_inputs.items():
                 # Check if resume node reads pause node's outputs
-                shared_keys = set(pause_node.output_keys) & set(resume_node.input_keys)
-                if shared_keys:
+                if not input_keys.isdisjoint(pause_node.output_keys):
                     pause_to_resume[pause_node_id] = resume_node_id
                     break
 
         # Strategy 2: Fallback - pair sequentially if no match found
+        matched_resume = set(pause_to_resume.values())
         unmatched_pause = [p for p in pause_nodes if p not in pause_to_resume]
-        unmatched_resume = [r for r in resume_entry_points if r not in pause_to_resume.values()]
+        unmatched_resume = [r for r in resume_entry_points if r not in matched_resume]
         for pause_id, resume_id in zip(unmatched_pause, unmatched_resume, strict=False):
             pause_to_resume[pause_id] = resume_id
 
@@ -1705,11 +1867,7 @@ def export_graph() -> str:
                 if not edge_exists:
                     # Auto-generate edge from router route
                     # Use on_success for most routes, on_failure for "fail"/"error"/"escalate"
-                    condition = (
-                        "on_failure"
-                        if route_name in ["fail", "error", "escalate"]
-                        else "on_success"
-                    )
+                    condition = "on_failure" if route_name in _FAILURE_ROUTE_NAMES else "on_success"
                     edges_list.append(
                         {
                             "id": f"{node.id}_to_{target_node}",
@@ -1781,14 +1939,14 @@ def export_graph() -> str:
 
     # Write agent.json
     agent_json_path = exports_dir / "agent.json"
-    with atomic_write(agent_json_path) as f:
-        json.dump(export_data, f, indent=2, default=str)
+    agent_json_size = atomic_write_bytes(
+        agent_json_path, json.dumps(export_data, indent=2, default=str).encode("utf-8")
+    )
 
     # Generate README.md
     readme_content = _generate_readme(session, export_data, all_tools)
     readme_path = exports_dir / "README.md"
-    with atomic_write(readme_path) as f:
-        f.write(readme_content)
+    readme_size = atomic_write_bytes(readme_path, readme_content.encode("utf-8"))
 
     # Write mcp_servers.json if MCP servers are configured
     mcp_servers_path = None
@@ -1796,14 +1954,9 @@ def export_graph() -> str:
     if session.mcp_servers:
         mcp_config = {"servers": session.mcp_servers}
         mcp_servers_path = exports_dir / "mcp_servers.json"
-        with atomic_write(mcp_servers_path) as f:
-            json.dump(mcp_config, f, indent=2)
-
-        mcp_servers_size = mcp_servers_path.stat().st_size
-
-    # Get file sizes
-    agent_json_size = agent_json_path.stat().st_size
-    readme_size = readme_path.stat().st_size
+        mcp_servers_size = atomic_write_bytes(
+            mcp_servers_path, json.dumps(mcp_config, indent=2).encode("utf-8")
+        )
 
     files_written = {
         "agent_json": {
@@ -1827,11 +1980,11 @@ def export_graph() -> str:
             "success": True,
             "agent": export_data["agent"],
             "files_written": files_written,
-            "graph": graph_spec,
-            "goal": session.goal.model_dump(),
-            "required_tools": list(all_tools),
-            "node_count": len(session.nodes),
-            "edge_count": len(edges_list),
+            "graph": export_data["graph"],
+            "goal": export_data["goal"],
+            "required_tools": export_data["required_tools"],
+            "node_count": export_data["metadata"]["node_count"],
+            "edge_count": export_data["metadata"]["edge_count"],
             "mcp_servers_count": len(session.mcp_servers),
             "note": f"Agent exported to {exports_dir}. Files: agent.json, README.md"
             + (", mcp_servers.json" if session.mcp_servers else ""),
@@ -1864,7 +2017,7 @@ def import_from_export(
         return json.dumps({"success": False, "error": f"File not found: {agent_json_path}"})
 
     try:
-        data = json.loads(path.read_text())
+        data = json_loads(path.read_bytes())
     except json.JSONDecodeError as e:
         return json.dumps({"success": False, "error": f"Invalid JSON: {e}"})
 
@@ -1893,16 +2046,12 @@ def import_from_export(
         for e in edges_data:
             condition_str = e.get("condition")
             if isinstance(condition_str, str):
-                condition_map = {
-                    "always": EdgeCondition.ALWAYS,
-                    "on_success": EdgeCondition.ON_SUCCESS,
-                    "on_failure": EdgeCondition.ON_FAILURE,
-                    "conditional": EdgeCondition.CONDITIONAL,
-                    "llm_decide": EdgeCondition.LLM_DECIDE,
-                }
-                e["condition"] = condition_map.get(condition_str, EdgeCondition.ON_SUCCESS)
+                e["condition"] = _EDGE_CONDITIONS.get(condition_str, EdgeCondition.ON_SUCCESS)
             session.edges.append(EdgeSpec(**e))
     except (KeyError, TypeError, ValueError, ValidationError) as e:
+        # The session may be partially updated without being saved
+        session.response_cache.clear()
+        session.topo_order = None
         return json.dumps({"success": False, "error": f"Malformed agent.json: {e}"})
 
     # Persist updated session
@@ -1924,6 +2073,10 @@ def import_from_export(
 def get_session_status() -> str:
     """Get the current status of the build session."""
     session = get_session()
+    return _cached_response(session, "get_session_status", lambda: _session_status(session))
+
+
+def _session_status(session: BuildSession) -> str:
     return json.dumps(
         {
             "session_id": session.id,
@@ -2173,7 +2326,7 @@ def list_mcp_tools(
 
     for server_config in servers_to_query:
         try:
-            from framework.runner.mcp_client import MCPClient, MCPServerConfig
+            from framework.runner.mcp_client import MCPServerConfig, get_mcp_client
 
             mcp_config = MCPServerConfig(
                 name=server_config["name"],
@@ -2187,17 +2340,17 @@ def list_mcp_tools(
                 description=server_config.get("description", ""),
             )
 
-            with MCPClient(mcp_config) as client:
-                tools = client.list_tools()
+            # Shared client: repeated listings reuse the warm session
+            tools = get_mcp_client(mcp_config).list_tools()
 
-                all_tools[server_config["name"]] = [
-                    {
-                        "name": t.name,
-                        "description": t.description,
-                        "parameters": list(t.input_schema.get("properties", {}).keys()),
-                    }
-                    for t in tools
-                ]
+            all_tools[server_config["name"]] = [
+                {
+                    "name": t.name,
+                    "description": t.description,
+                    "parameters": list(t.input_schema.get("properties", {}).keys()),
+                }
+                for t in tools
+            ]
 
         except Exception as e:
             all_tools[server_config["name"]] = {"error": f"Failed to connect: {str(e)}"}
@@ -2226,6 +2379,11 @@ def remove_mcp_server(
         if server["name"] == name:
             session.mcp_servers.pop(i)
             _save_session(session)  # Auto-save
+
+            # Stop the server process list_mcp_tools may have left running
+            from framework.runner.mcp_client import close_cached_clients
+
+            close_cached_clients(name)
             return json.dumps(
                 {"success": True, "removed": name, "remaining_servers": len(session.mcp_servers)}
             )
@@ -2348,7 +2506,7 @@ def test_graph(
         return json.dumps({"success": False, "error": "No nodes defined"})
 
     # Validate graph first
-    validation = json.loads(validate_graph())
+    validation = _validate_graph(session)
     if not validation["valid"]:
         return json.dumps(
             {
@@ -2368,6 +2526,13 @@ def test_graph(
     entry_node = validation["entry_node"]
     terminal_nodes = validation["terminal_nodes"]
 
+    # Bucket edges by source once, highest priority first (stable, so ties
+    # keep definition order) instead of re-sorting at every step.
+    outgoing_by_source: dict[str, list[EdgeSpec]] = {}
+    for edge in sorted(session.edges, key=lambda e: -e.priority):
+        outgoing_by_source.setdefault(edge.source, []).append(edge)
+    nodes_by_id = {n.id: n for n in session.nodes}
+
     execution_trace = []
     current_node_id = entry_node
     steps = 0
@@ -2376,11 +2541,7 @@ def test_graph(
         steps += 1
 
         # Find current node
-        current_node = None
-        for n in session.nodes:
-            if n.id == current_node_id:
-                current_node = n
-                break
+        current_node = nodes_by_id.get(current_node_id)
 
         if current_node is None:
             execution_trace.append(
@@ -2423,10 +2584,7 @@ def test_graph(
             break
 
         # Find next node via edges (sorted by priority, highest first)
-        outgoing = sorted(
-            [e for e in session.edges if e.source == current_node_id],
-            key=lambda e: -e.priority,
-        )
+        outgoing = outgoing_by_source.get(current_node_id, ())
         next_node = None
         for edge in outgoing:
             # In dry run, follow success/always edges (highest priority first)
@@ -2477,6 +2635,17 @@ def test_graph(
 # =============================================================================
 
 
+# Patterns for parsing pytest output in run_tests/debug_test, compiled once
+_PYTEST_SUMMARY_RE = re.compile(r"=+ ([\d\w,\s]+) in [\d.]+s =+")
+_PYTEST_COUNT_RE = re.compile(r"(\d+) (passed|failed|skipped|error)")
+_PYTEST_RESULT_RE = re.compile(r"([\w/]+\.py)::(\w+)\s+(PASSED|FAILED|SKIPPED|ERROR)")
+_PYTEST_FAILURES_RE = re.compile(
+    r"=+ FAILURES =+(.+?)(?:=+ (?:short test summary|ERRORS|warnings) =+|$)", re.DOTALL
+)
+_PYTEST_FAILURE_HEADER_RE = re.compile(r"_+ (test_\w+) _+")
+_ERROR_MESSAGE_RE = re.compile(r"(AssertionError|Error|Exception):\s*(.+?)(?:\n|$)")
+
+
 def _get_agent_module_from_path(agent_path: str) -> str:
     """Extract agent module name from path like 'exports/my_agent' -> 'my_agent'."""
     path = Path(agent_path)
@@ -2769,7 +2938,6 @@ def run_tests(
     By default, tests run in parallel using pytest-xdist with auto-detected worker count.
     Returns pass/fail summary with detailed results parsed from pytest output.
     """
-    import re
     import subprocess
 
     path, err = _validate_agent_path(agent_path)
@@ -2868,38 +3036,24 @@ def run_tests(
     output = result.stdout + "\n" + result.stderr
 
     # Extract summary line (e.g., "5 passed, 2 failed in 1.23s")
-    summary_match = re.search(r"=+ ([\d\w,\s]+) in [\d.]+s =+", output)
+    summary_match = _PYTEST_SUMMARY_RE.search(output)
     summary_text = summary_match.group(1) if summary_match else "unknown"
 
-    # Parse passed/failed counts
-    passed = 0
-    failed = 0
-    skipped = 0
-    error = 0
-
-    passed_match = re.search(r"(\d+) passed", summary_text)
-    if passed_match:
-        passed = int(passed_match.group(1))
-
-    failed_match = re.search(r"(\d+) failed", summary_text)
-    if failed_match:
-        failed = int(failed_match.group(1))
-
-    skipped_match = re.search(r"(\d+) skipped", summary_text)
-    if skipped_match:
-        skipped = int(skipped_match.group(1))
-
-    error_match = re.search(r"(\d+) error", summary_text)
-    if error_match:
-        error = int(error_match.group(1))
+    # Parse passed/failed counts in one scan (first count per outcome wins)
+    counts: dict[str, int] = {}
+    for count, outcome in _PYTEST_COUNT_RE.findall(summary_text):
+        counts.setdefault(outcome, int(count))
+    passed = counts.get("passed", 0)
+    failed = counts.get("failed", 0)
+    skipped = counts.get("skipped", 0)
+    error = counts.get("error", 0)
 
     total = passed + failed + skipped + error
 
     # Extract individual test results
     test_results = []
     # Match lines like: "test_constraints.py::test_constraint_foo PASSED"
-    test_pattern = re.compile(r"([\w/]+\.py)::(\w+)\s+(PASSED|FAILED|SKIPPED|ERROR)")
-    for match in test_pattern.finditer(output):
+    for match in _PYTEST_RESULT_RE.finditer(output):
         test_results.append(
             {
                 "file": match.group(1),
@@ -2911,13 +3065,11 @@ def run_tests(
     # Extract failure details
     failures = []
     # Match FAILURES section
-    failure_section = re.search(
-        r"=+ FAILURES =+(.+?)(?:=+ (?:short test summary|ERRORS|warnings) =+|$)", output, re.DOTALL
-    )
+    failure_section = _PYTEST_FAILURES_RE.search(output)
     if failure_section:
         failure_text = failure_section.group(1)
         # Split by test name headers
-        failure_blocks = re.split(r"_+ (test_\w+) _+", failure_text)
+        failure_blocks = _PYTEST_FAILURE_HEADER_RE.split(failure_text)
         for i in range(1, len(failure_blocks), 2):
             if i + 1 < len(failure_blocks):
                 test_name = failure_blocks[i]
@@ -2962,7 +3114,6 @@ def debug_test(
     Re-runs the test with pytest -vvs to capture full output.
     Returns detailed failure information and suggestions.
     """
-    import re
     import subprocess
 
     # Derive agent_path from session if not provided
@@ -3078,7 +3229,7 @@ def debug_test(
 
     # Extract the assertion/error message
     error_message = None
-    error_match = re.search(r"(AssertionError|Error|Exception):\s*(.+?)(?:\n|$)", output)
+    error_match = _ERROR_MESSAGE_RE.search(output)
     if error_match:
         error_message = error_match.group(2).strip()
 
@@ -3098,6 +3249,51 @@ def debug_test(
     )
 
 
+@functools.lru_cache(maxsize=512)
+def _scan_test_file(test_file: str, mtime_ns: int, size: int) -> tuple[dict, ...]:
+    """Parse a test file into its list_tests entries.
+
+    Cached on (path, mtime, size) so repeated list_tests calls only re-read
+    and re-parse test files that changed since the last call. The returned
+    entries are shared and must not be mutated.
+    """
+    import ast
+
+    path = Path(test_file)
+    tree = ast.parse(path.read_bytes())
+
+    # Determine test type from filename
+    if "constraint" in path.name:
+        test_type = "constraint"
+    elif "success" in path.name:
+        test_type = "success_criteria"
+    elif "edge" in path.name:
+        test_type = "edge_case"
+    else:
+        test_type = "unknown"
+
+    # Find all function definitions that start with "test_"
+    tests = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
+            if node.name.startswith("test_"):
+                # Extract docstring
+                docstring = ast.get_docstring(node) or ""
+
+                tests.append(
+                    {
+                        "test_name": node.name,
+                        "file": path.name,
+                        "file_path": test_file,
+                        "line": node.lineno,
+                        "test_type": test_type,
+                        "is_async": isinstance(node, ast.AsyncFunctionDef),
+                        "description": docstring[:200] if docstring else None,
+                    }
+                )
+    return tuple(tests)
+
+
 @mcp.tool()
 def list_tests(
     goal_id: Annotated[str, "ID of the goal"],
@@ -3108,7 +3304,6 @@ def list_tests(
 
     Returns test names and their locations from {agent_path}/tests/test_*.py
     """
-    import ast
 
     # Derive agent_path from session if not provided
     if not agent_path and _session:
@@ -3138,37 +3333,8 @@ def list_tests(
     tests = []
     for test_file in sorted(tests_dir.glob("test_*.py")):
         try:
-            content = test_file.read_text()
-            tree = ast.parse(content)
-
-            # Find all async function definitions that start with "test_"
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef | ast.AsyncFunctionDef):
-                    if node.name.startswith("test_"):
-                        # Determine test type from filename
-                        if "constraint" in test_file.name:
-                            test_type = "constraint"
-                        elif "success" in test_file.name:
-                            test_type = "success_criteria"
-                        elif "edge" in test_file.name:
-                            test_type = "edge_case"
-                        else:
-                            test_type = "unknown"
-
-                        # Extract docstring
-                        docstring = ast.get_docstring(node) or ""
-
-                        tests.append(
-                            {
-                                "test_name": node.name,
-                                "file": test_file.name,
-                                "file_path": str(test_file),
-                                "line": node.lineno,
-                                "test_type": test_type,
-                                "is_async": isinstance(node, ast.AsyncFunctionDef),
-                                "description": docstring[:200] if docstring else None,
-                            }
-                        )
+            stat = test_file.stat()
+            tests.extend(_scan_test_file(str(test_file), stat.st_mtime_ns, stat.st_size))
         except SyntaxError as e:
             tests.append(
                 {
@@ -3490,7 +3656,7 @@ def _read_session_json(path: Path) -> dict | None:
     if not path.exists():
         return None
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return json_loads(path.read_bytes())
     except (json.JSONDecodeError, OSError):
         return None
 
@@ -3554,8 +3720,8 @@ def list_agent_sessions(
         if status and session_status != status:
             continue
 
-        timestamps = data.get("timestamps", {})
-        progress = data.get("progress", {})
+        timestamps = data.get("timestamps", _EMPTY_MAPPING)
+        progress = data.get("progress", _EMPTY_MAPPING)
         checkpoint_dir = state_path.parent / "checkpoints"
 
         summaries.append(
@@ -0,0 +1,59 @@
+"""Shared background event loop for running coroutines from synchronous code.
+
+Sync APIs that are called from inside a running event loop cannot use
+``asyncio.run()``.  Instead of starting a new thread and event loop for every
+such call, they submit the coroutine to one long-lived loop running in a
+daemon thread::
+
+    asyncio.run_coroutine_threadsafe(coro, get_background_loop()).result()
+"""
+
+import asyncio
+import atexit
+import threading
+
+_loop: asyncio.AbstractEventLoop | None = None
+_thread: threading.Thread | None = None
+_lock = threading.Lock()
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared background loop, starting its thread on first use."""
+    global _loop, _thread
+
+    with _lock:
+        if _loop is not None and _thread is not None and _thread.is_alive():
+            return _loop
+
+        loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def run() -> None:
+            asyncio.set_event_loop(loop)
+            loop.call_soon(started.set)
+            loop.run_forever()
+
+        thread = threading.Thread(target=run, name="background-event-loop", daemon=True)
+        thread.start()
+        started.wait()
+        _loop, _thread = loop, thread
+        return loop
+
+
+def stop_background_loop() -> None:
+    """Stop the shared loop and wait for its thread to exit."""
+    global _loop, _thread
+
+    with _lock:
+        loop, thread = _loop, _thread
+        _loop = _thread = None
+
+    if loop is None or thread is None:
+        return
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5)
+    if not thread.is_alive():
+        loop.close()
+
+
+atexit.register(stop_background_loop)
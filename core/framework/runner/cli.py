@@ -6,6 +6,8 @@
 import sys
 from pathlib import Path
 
+from framework.utils.io import json_dumps_indented
+
 
 def register_commands(subparsers: argparse._SubParsersAction) -> None:
     """Register runner commands with the main CLI."""
@@ -695,7 +697,7 @@ async def run_with_tui():
             print(f"Results written to {args.output}")
     else:
         if args.quiet:
-            print(json.dumps(output, indent=2, default=str))
+            print(json_dumps_indented(output, default=str))
         else:
             print()
             print("=" * 60)
@@ -720,7 +722,7 @@ async def run_with_tui():
                             shown = True
                             break
                         elif isinstance(value, (dict, list)):
-                            print(json.dumps(value, indent=2, default=str))
+                            print(json_dumps_indented(value, default=str))
                             shown = True
                             break
 
@@ -736,7 +738,7 @@ async def run_with_tui():
                         ]:
                             if isinstance(value, (dict, list)):
                                 print(f"\n{key}:")
-                                value_str = json.dumps(value, indent=2, default=str)
+                                value_str = json_dumps_indented(value, default=str)
                                 if len(value_str) > 300:
                                     value_str = value_str[:300] + "..."
                                 print(value_str)
@@ -981,7 +983,7 @@ def cmd_dispatch(args: argparse.Namespace) -> int:
             "results": result.results,
             "error": result.error,
         }
-        print(json.dumps(output, indent=2, default=str))
+        print(json_dumps_indented(output, default=str))
     else:
         print()
         print("=" * 60)
@@ -1034,9 +1036,7 @@ def _interactive_approval(request):
         for key, value in request.context.items():
             print(f"\n[{key}]:")
             if isinstance(value, (dict, list)):
-                import json
-
-                value_str = json.dumps(value, indent=2, default=str)
+                value_str = json_dumps_indented(value, default=str)
                 # Show more content for approval - up to 2000 chars
                 if len(value_str) > 2000:
                     value_str = value_str[:2000] + "\n... (truncated)"
@@ -2,20 +2,58 @@
 
 This module provides a client for connecting to MCP servers and invoking their tools.
 Supports both STDIO and HTTP transports using the official MCP Python SDK.
+
+On Python 3.12+ the background STDIO event loop uses asyncio's eager task
+factory: a tool call whose coroutine completes without suspending (e.g. one
+answered from a cache) finishes inside create_task() instead of waiting for
+the next loop iteration.
 """
 
 import asyncio
+import atexit
+import hashlib
+import importlib.util
+import itertools
+import json
 import logging
 import os
-from dataclasses import dataclass, field
+import shutil
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
 from typing import Any, Literal
 
 import httpx
 
+from framework.runner import mcp_stdio_pool
+from framework.runner.background_loop import get_background_loop
+from framework.runner.mcp_stdio_pool import StdioConnection
+from framework.utils.io import atomic_write, json_dumps_bytes, json_loads
+
 logger = logging.getLogger(__name__)
 
+# Connection pool for HTTP transport: keep connections alive between tool
+# calls, and multiplex over HTTP/2 when the optional h2 package is installed
+# (pip install "httpx[http2]").
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60.0)
+_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_JSON_HEADERS = {"content-type": "application/json"}
+# tools/call envelope with the constant fields pre-encoded; per call only the
+# id, tool name and arguments are serialized (see MCPClient._call_tool_http)
+_TOOL_CALL_PREFIX = (
+    b'{"jsonrpc":"2.0","id":%d,"method":"tools/call","params":{"name":%b,"arguments":'
+)
+_TOOL_CALL_SUFFIX = b"}}"
+
+# JSON-RPC error codes a server without batch support answers an array with
+_BATCH_UNSUPPORTED_CODES = frozenset({-32600, -32601})  # Invalid Request, Method not found
 
-@dataclass
+
+@dataclass(slots=True)
 class MCPServerConfig:
     """Configuration for an MCP server connection."""
 
@@ -36,7 +74,7 @@ class MCPServerConfig:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class MCPTool:
     """A tool available from an MCP server."""
 
@@ -46,6 +84,118 @@ class MCPTool:
     server_name: str
 
 
+class _ToolTable:
+    """
+    Discovered tools stored column-wise, with a name -> position index.
+
+    MCPTool objects are only built when list_tools() asks for them; name
+    checks go through ``index``.  A table is not modified after it is built,
+    so the caches share it between clients.
+    """
+
+    __slots__ = ("names", "descriptions", "schemas", "index")
+
+    def __init__(self, tools_list: Iterable[dict] = ()):
+        self.names: list[str] = []
+        self.descriptions: list[str] = []
+        self.schemas: list[dict[str, Any]] = []
+        self.index: dict[str, int] = {}
+        for tool_data in tools_list:
+            name = tool_data["name"]
+            description = tool_data.get("description", "")
+            schema = tool_data.get("inputSchema", {})
+            i = self.index.get(name)
+            if i is None:
+                self.index[name] = len(self.names)
+                self.names.append(name)
+                self.descriptions.append(description)
+                self.schemas.append(schema)
+            else:
+                # Later duplicates win, as they did for a name-keyed dict
+                self.descriptions[i] = description
+                self.schemas[i] = schema
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def to_tools(self, server_name: str) -> list[MCPTool]:
+        """Materialize the table as MCPTool objects, in discovery order."""
+        return [
+            MCPTool(name, description, schema, server_name)
+            for name, description, schema in zip(
+                self.names, self.descriptions, self.schemas, strict=True
+            )
+        ]
+
+
+# Process-wide cache of discovered tools, so a client that reconnects to the
+# same server skips the tools/list round-trip while the entry is fresh.
+TOOLS_CACHE_TTL_SECONDS = 300.0
+_TOOLS_CACHE: dict[tuple, tuple[float, _ToolTable]] = {}
+_TOOLS_CACHE_LOCK = threading.Lock()
+
+
+def _tools_cache_key(config: MCPServerConfig) -> tuple:
+    """Identify a server by name and the endpoint it is reached through."""
+    if config.transport == "stdio":
+        return (config.name, config.transport, config.command, tuple(config.args))
+    return (config.name, config.transport, config.url)
+
+
+# STDIO tool lists are also persisted across processes, one file per server
+# config.  An entry is reused only while its fingerprint (config plus the
+# mtimes of the server command and any file arguments) still matches and the
+# server reports the same name and version in its initialize() response.
+# HTTP connections skip that handshake, so their tool lists are not persisted.
+MCP_TOOLS_CACHE_DIR = Path.home() / ".hive" / "mcp_tools"
+DISK_TOOLS_CACHE_TTL_SECONDS = 24 * 60 * 60.0
+
+
+def _client_cache_key(config: MCPServerConfig) -> str:
+    """Hash every config field, so any change yields a separate entry."""
+    payload = json.dumps(asdict(config), sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def _config_fingerprint(config: MCPServerConfig) -> str:
+    """Fingerprint a config together with the files its server runs from."""
+    parts = [_client_cache_key(config), config.url or ""]
+    if config.transport == "stdio" and config.command:
+        base = Path(config.cwd) if config.cwd else Path.cwd()
+        candidates = [shutil.which(config.command) or config.command]
+        candidates.extend(str(base / arg) for arg in config.args)
+        for candidate in candidates:
+            try:
+                parts.append(f"{candidate}:{os.stat(candidate).st_mtime_ns}")
+            except (OSError, ValueError):
+                continue
+    return hashlib.sha1("\0".join(parts).encode()).hexdigest()
+
+
+def invalidate_tools_cache(name: str | None = None) -> None:
+    """
+    Drop cached tool lists, in memory and on disk.
+
+    Args:
+        name: Only drop entries for this server name; drops everything if None
+    """
+    with _TOOLS_CACHE_LOCK:
+        if name is None:
+            _TOOLS_CACHE.clear()
+        else:
+            for key in [k for k in _TOOLS_CACHE if k[0] == name]:
+                del _TOOLS_CACHE[key]
+
+    if not MCP_TOOLS_CACHE_DIR.is_dir():
+        return
+    for path in MCP_TOOLS_CACHE_DIR.glob("*.json"):
+        try:
+            if name is None or json_loads(path.read_bytes()).get("server_name") == name:
+                path.unlink()
+        except (OSError, ValueError, AttributeError):
+            continue
+
+
 class MCPClient:
     """
     Client for communicating with MCP servers.
@@ -66,9 +216,19 @@ def __init__(self, config: MCPServerConfig):
         self._read_stream = None
         self._write_stream = None
         self._stdio_context = None  # Context manager for stdio_client
+        # Task that entered the STDIO contexts and exits them once
+        # _stdio_closing is set (anyio needs enter and exit in one task)
+        self._stdio_task: asyncio.Task | None = None
+        self._stdio_closing: asyncio.Event | None = None
         self._http_client: httpx.Client | None = None
-        self._tools: dict[str, MCPTool] = {}
+        self._http_pool_key: tuple | None = None  # set when _http_client is shared
+        self._request_ids = itertools.count(2)
+        self._tools = _ToolTable()
         self._connected = False
+        # serverInfo name and version from the STDIO initialize() response
+        self._server_version: str | None = None
+        # tools/list request issued right after a fresh STDIO initialize()
+        self._tools_future: asyncio.Future | None = None
 
         # Background event loop for persistent STDIO connection
         self._loop = None
@@ -84,73 +244,92 @@ def _run_async(self, coro):
         Returns:
             Result of the coroutine
         """
+        # Sync callers usually have no running loop; asyncio._get_running_loop()
+        # returns None for that instead of raising and catching a RuntimeError
+        current_loop = asyncio._get_running_loop()
+
         # If we have a persistent loop (for STDIO), use it
         if self._loop is not None:
             # Check if loop is running AND not closed
             if self._loop.is_running() and not self._loop.is_closed():
+                if current_loop is self._loop:
+                    # Blocking on our own loop would deadlock
+                    coro.close()
+                    raise RuntimeError(
+                        "Sync MCPClient methods cannot be called from the client's own "
+                        "event loop; await alist_tools()/acall_tool() instead"
+                    )
                 future = asyncio.run_coroutine_threadsafe(coro, self._loop)
                 return future.result()
             # else: fall through to the standard approach below
             # This handles the case when STDIO loop exists but is stopped/closed
 
         # Standard approach: handle both sync and async contexts
-        try:
-            # Try to get the current event loop
-            asyncio.get_running_loop()
-            # If we're here, we're in an async context
-            # Create a new thread to run the coroutine
-            import threading
-
-            result = None
-            exception = None
-
-            def run_in_thread():
-                nonlocal result, exception
-                try:
-                    new_loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(new_loop)
-                    try:
-                        result = new_loop.run_until_complete(coro)
-                    finally:
-                        new_loop.close()
-                except Exception as e:
-                    exception = e
-
-            thread = threading.Thread(target=run_in_thread)
-            thread.start()
-            thread.join()
-
-            if exception:
-                raise exception
-            return result
-        except RuntimeError:
+        if current_loop is None:
             # No event loop running, we can use asyncio.run
             return asyncio.run(coro)
 
-    def connect(self) -> None:
-        """Connect to the MCP server."""
+        # We're in an async context: run the coroutine on the shared
+        # background loop instead of starting a thread and loop per call
+        return asyncio.run_coroutine_threadsafe(coro, get_background_loop()).result()
+
+    def connect(self, force_refresh: bool = False) -> None:
+        """
+        Connect to the MCP server.
+
+        Args:
+            force_refresh: Re-run tool discovery even if a cached tool list
+                for this server is still fresh
+        """
         if self._connected:
             return
 
+        cached_tools = None if force_refresh else self._cached_tools()
+        persisted = None
+        if cached_tools is None and not force_refresh:
+            persisted = self._load_persisted_tools()
+
         if self.config.transport == "stdio":
-            self._connect_stdio()
+            # Without a cached list, request tools as soon as the session is up
+            self._connect_stdio(prefetch_tools=cached_tools is None and persisted is None)
         elif self.config.transport == "http":
             self._connect_http()
         else:
             raise ValueError(f"Unsupported transport: {self.config.transport}")
 
+        # A persisted list is only trusted for the server version it came from
+        if persisted is not None and persisted[0] == self._server_version:
+            self._set_tools(persisted[1])
+            with _TOOLS_CACHE_LOCK:
+                _TOOLS_CACHE[_tools_cache_key(self.config)] = (time.monotonic(), self._tools)
+            logger.debug(f"Using persisted tool list for '{self.config.name}'")
+            cached_tools = self._tools
+
         # Discover tools
-        self._discover_tools()
+        if cached_tools is not None:
+            self._tools = cached_tools
+        else:
+            self._discover_tools()
         self._connected = True
 
-    def _connect_stdio(self) -> None:
-        """Connect to MCP server via STDIO transport using MCP SDK with persistent connection."""
+    def _connect_stdio(self, prefetch_tools: bool = False) -> None:
+        """Connect to MCP server via STDIO transport using MCP SDK with persistent connection.
+
+        With ``prefetch_tools`` a freshly started session sends tools/list from
+        the background loop straight after initialize(), instead of waiting for
+        connect() to hand the request back over from the calling thread.
+        """
         if not self.config.command:
             raise ValueError("command is required for STDIO transport")
 
-        try:
-            import threading
+        # Claim a warm server left behind by an earlier client, if any
+        conn = mcp_stdio_pool.acquire(_client_cache_key(self.config))
+        if conn is not None:
+            self._attach_stdio(conn)
+            logger.info(f"Connected to MCP server '{self.config.name}' via STDIO (pooled)")
+            return
 
+        try:
             from mcp import StdioServerParameters
 
             # Create server parameters
@@ -173,12 +352,16 @@ def _connect_stdio(self) -> None:
 
             def run_event_loop():
                 """Run event loop in background thread."""
-                self._loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(self._loop)
+                # The connection may be handed to another client (see
+                # mcp_stdio_pool), so this thread only uses its own reference.
+                loop = asyncio.new_event_loop()
+                self._loop = loop
+                asyncio.set_event_loop(loop)
                 loop_started.set()
 
                 # Initialize persistent connection
                 async def init_connection():
+                    closing = asyncio.Event()
                     try:
                         from mcp import ClientSession
                         from mcp.client.stdio import stdio_client
@@ -187,29 +370,56 @@ async def init_connection():
                         # Redirect server stderr to devnull to prevent raw
                         # output from leaking behind the TUI.
                         devnull = open(os.devnull, "w")  # noqa: SIM115
-                        self._stdio_context = stdio_client(server_params, errlog=devnull)
+                        stdio_context = stdio_client(server_params, errlog=devnull)
+                        self._stdio_context = stdio_context
                         (
                             self._read_stream,
                             self._write_stream,
-                        ) = await self._stdio_context.__aenter__()
+                        ) = await stdio_context.__aenter__()
 
                         # Create persistent session
-                        self._session = ClientSession(self._read_stream, self._write_stream)
-                        await self._session.__aenter__()
+                        session = ClientSession(self._read_stream, self._write_stream)
+                        self._session = session
+                        await session.__aenter__()
 
                         # Initialize session
-                        await self._session.initialize()
-
+                        init_result = await session.initialize()
+                        server_info = getattr(init_result, "serverInfo", None)
+                        if server_info is not None:
+                            self._server_version = f"{server_info.name} {server_info.version}"
+
+                        if prefetch_tools:
+                            self._tools_future = asyncio.ensure_future(
+                                self._list_tools_stdio_async()
+                            )
+
+                        self._stdio_task = asyncio.current_task()
+                        self._stdio_closing = closing
                         connection_ready.set()
                     except Exception as e:
                         connection_error.append(e)
                         connection_ready.set()
+                        return
+
+                    # Hold the connection open until _cleanup_stdio_async()
+                    # asks for it to be closed, then exit the contexts here.
+                    await closing.wait()
+                    await MCPClient._exit_stdio_contexts(session, stdio_context)
+                    devnull.close()
 
                 # Schedule connection initialization
-                self._loop.create_task(init_connection())
+                loop.create_task(init_connection())
 
-                # Run loop forever
-                self._loop.run_forever()
+                # Later tasks (tool calls submitted from other threads) start
+                # eagerly.  Installed after init_connection is scheduled: an
+                # eager task runs its first step immediately, and the loop is
+                # not running yet at this point.
+                if hasattr(asyncio, "eager_task_factory"):  # Python 3.12+
+                    loop.set_task_factory(asyncio.eager_task_factory)
+
+                # Run loop until _close_stdio() stops it, then release it
+                loop.run_forever()
+                _drain_and_close_loop(loop)
 
             self._loop_thread = threading.Thread(target=run_event_loop, daemon=True)
             self._loop_thread.start()
@@ -233,11 +443,8 @@ def _connect_http(self) -> None:
         if not self.config.url:
             raise ValueError("url is required for HTTP transport")
 
-        self._http_client = httpx.Client(
-            base_url=self.config.url,
-            headers=self.config.headers,
-            timeout=30.0,
-        )
+        self._http_pool_key = _http_pool_key(self.config)
+        self._http_client = _acquire_http_client(self._http_pool_key, self.config)
 
         # Test connection
         try:
@@ -250,25 +457,38 @@ def _connect_http(self) -> None:
             logger.warning(f"Health check failed for MCP server '{self.config.name}': {e}")
             # Continue anyway, server might not have health endpoint
 
+    def _cached_tools(self) -> _ToolTable | None:
+        """Return a still-fresh tool index from the in-memory cache."""
+        with _TOOLS_CACHE_LOCK:
+            cached = _TOOLS_CACHE.get(_tools_cache_key(self.config))
+        if cached is not None and time.monotonic() - cached[0] < TOOLS_CACHE_TTL_SECONDS:
+            logger.debug(f"Using cached tool list for '{self.config.name}'")
+            return cached[1]
+        return None
+
     def _discover_tools(self) -> None:
-        """Discover available tools from the MCP server."""
+        """Discover available tools from the MCP server and refresh the caches."""
+        cache_key = _tools_cache_key(self.config)
         try:
             if self.config.transport == "stdio":
-                tools_list = self._run_async(self._list_tools_stdio_async())
+                future = self._tools_future
+                if future is not None and future.done():
+                    # The prefetch has already been answered: read it here
+                    # rather than scheduling a coroutine on the loop to do so
+                    self._tools_future = None
+                    tools_list = future.result()
+                else:
+                    tools_list = self._run_async(self._collect_tools_stdio_async())
             else:
                 tools_list = self._list_tools_http()
 
-            self._tools = {}
-            for tool_data in tools_list:
-                tool = MCPTool(
-                    name=tool_data["name"],
-                    description=tool_data.get("description", ""),
-                    input_schema=tool_data.get("inputSchema", {}),
-                    server_name=self.config.name,
-                )
-                self._tools[tool.name] = tool
+            self._set_tools(tools_list)
 
-            tool_names = list(self._tools.keys())
+            with _TOOLS_CACHE_LOCK:
+                _TOOLS_CACHE[cache_key] = (time.monotonic(), self._tools)
+            self._persist_tools(tools_list)
+
+            tool_names = self._tools.names
             logger.info(
                 f"Discovered {len(self._tools)} tools from '{self.config.name}': {tool_names}"
             )
@@ -276,6 +496,67 @@ def _discover_tools(self) -> None:
             logger.error(f"Failed to discover tools from '{self.config.name}': {e}")
             raise
 
+    def _set_tools(self, tools_list: list[dict]) -> None:
+        """Build the tool index from tools/list entries."""
+        self._tools = _ToolTable(tools_list)
+
+    def _tools_cache_path(self) -> Path:
+        """Path of the persisted tool list for this server config."""
+        return MCP_TOOLS_CACHE_DIR / f"{_client_cache_key(self.config)}.json"
+
+    def _load_persisted_tools(self) -> tuple[str, list[dict]] | None:
+        """
+        Return the server version and tools/list entries persisted for this config.
+
+        The caller still has to compare the version with the one the server
+        reports once connected.
+        """
+        if self.config.transport != "stdio":
+            return None
+        try:
+            data = json_loads(self._tools_cache_path().read_bytes())
+        except (OSError, ValueError):
+            return None
+
+        if (
+            not isinstance(data, dict)
+            or data.get("fingerprint") != _config_fingerprint(self.config)
+            or time.time() - data.get("saved_at", 0) >= DISK_TOOLS_CACHE_TTL_SECONDS
+            or not isinstance(data.get("server_version"), str)
+            or not isinstance(data.get("tools"), list)
+        ):
+            return None
+        return data["server_version"], data["tools"]
+
+    def _persist_tools(self, tools_list: list[dict]) -> None:
+        """Save tools/list entries for later processes; failures are not fatal."""
+        if self._server_version is None:
+            return
+        path = self._tools_cache_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with atomic_write(path) as f:
+                json.dump(
+                    {
+                        "server_name": self.config.name,
+                        "fingerprint": _config_fingerprint(self.config),
+                        "server_version": self._server_version,
+                        "saved_at": time.time(),
+                        "tools": tools_list,
+                    },
+                    f,
+                    default=str,
+                )
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not persist tool list for '{self.config.name}': {e}")
+
+    async def _collect_tools_stdio_async(self) -> list[dict]:
+        """Return the prefetched tools/list result, or request it now."""
+        future, self._tools_future = self._tools_future, None
+        if future is not None:
+            return await future
+        return await self._list_tools_stdio_async()
+
     async def _list_tools_stdio_async(self) -> list[dict]:
         """List tools via STDIO protocol using persistent session."""
         if not self._session:
@@ -297,6 +578,20 @@ async def _list_tools_stdio_async(self) -> list[dict]:
 
         return tools_list
 
+    def _post_jsonrpc(self, payload: dict | list | bytes) -> Any:
+        """
+        POST a JSON-RPC payload to the MCP endpoint and return the decoded body.
+
+        Encoding and decoding go through orjson when it is installed, which
+        matters for tools that return large payloads.  A ``bytes`` payload is
+        sent as-is.
+        """
+        if not isinstance(payload, bytes):
+            payload = json_dumps_bytes(payload)
+        response = self._http_client.post("/mcp/v1", content=payload, headers=_JSON_HEADERS)
+        response.raise_for_status()
+        return json_loads(response.content)
+
     def _list_tools_http(self) -> list[dict]:
         """List tools via HTTP protocol."""
         if not self._http_client:
@@ -304,17 +599,14 @@ def _list_tools_http(self) -> list[dict]:
 
         try:
             # Use MCP over HTTP protocol
-            response = self._http_client.post(
-                "/mcp/v1",
-                json={
+            data = self._post_jsonrpc(
+                {
                     "jsonrpc": "2.0",
                     "id": 1,
                     "method": "tools/list",
                     "params": {},
-                },
+                }
             )
-            response.raise_for_status()
-            data = response.json()
 
             if "error" in data:
                 raise RuntimeError(f"MCP error: {data['error']}")
@@ -333,7 +625,21 @@ def list_tools(self) -> list[MCPTool]:
         if not self._connected:
             self.connect()
 
-        return list(self._tools.values())
+        return self._tools.to_tools(self.config.name)
+
+    async def alist_tools(self) -> list[MCPTool]:
+        """
+        Async variant of list_tools() for callers already in an event loop.
+
+        Connecting (and discovering tools) blocks, so it runs in a worker thread.
+
+        Returns:
+            List of MCPTool objects
+        """
+        if not self._connected:
+            await asyncio.to_thread(self.connect)
+
+        return self.list_tools()
 
     def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
         """
@@ -349,14 +655,78 @@ def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
         if not self._connected:
             self.connect()
 
-        if tool_name not in self._tools:
-            raise ValueError(f"Unknown tool: {tool_name}")
+        self._check_tool(tool_name)
 
         if self.config.transport == "stdio":
             return self._run_async(self._call_tool_stdio_async(tool_name, arguments))
         else:
             return self._call_tool_http(tool_name, arguments)
 
+    def _check_tool(self, tool_name: str) -> None:
+        """
+        Raise ValueError unless the server offers ``tool_name``.
+
+        The tool list may come from a cache that predates a server change, so
+        a name that is not in it triggers one fresh tools/list before failing.
+        """
+        if tool_name in self._tools.index:
+            return
+        self._discover_tools()
+        if tool_name not in self._tools.index:
+            raise ValueError(f"Unknown tool: {tool_name}")
+
+    def call_tools_batch(self, calls: list[tuple[str, dict[str, Any]]]) -> list[Any]:
+        """
+        Invoke several tools, sending them as one JSON-RPC batch over HTTP.
+
+        STDIO servers (and single calls) go through call_tool() one by one.
+        HTTP servers that reject batch requests are retried call by call.
+
+        Args:
+            calls: (tool_name, arguments) pairs
+
+        Returns:
+            Tool results, in the same order as ``calls``
+        """
+        if not self._connected:
+            self.connect()
+
+        for tool_name, _ in calls:
+            self._check_tool(tool_name)
+
+        if self.config.transport == "stdio" or len(calls) < 2:
+            return [self.call_tool(tool_name, arguments) for tool_name, arguments in calls]
+        return self._call_tools_http_batch(calls)
+
+    async def acall_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
+        """
+        Async variant of call_tool() for callers already in an event loop.
+
+        On the client's own STDIO loop the call is awaited directly; from any
+        other loop it is scheduled onto the STDIO loop and awaited without
+        blocking the caller's thread.
+
+        Args:
+            tool_name: Name of the tool to invoke
+            arguments: Tool arguments
+
+        Returns:
+            Tool result
+        """
+        if not self._connected:
+            await asyncio.to_thread(self.connect)
+
+        if tool_name not in self._tools.index:
+            await asyncio.to_thread(self._check_tool, tool_name)
+
+        if self.config.transport != "stdio":
+            return await asyncio.to_thread(self._call_tool_http, tool_name, arguments)
+
+        coro = self._call_tool_stdio_async(tool_name, arguments)
+        if self._loop is None or asyncio.get_running_loop() is self._loop:
+            return await coro
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self._loop))
+
     async def _call_tool_stdio_async(self, tool_name: str, arguments: dict[str, Any]) -> Any:
         """Call tool via STDIO protocol using persistent session."""
         if not self._session:
@@ -394,20 +764,11 @@ def _call_tool_http(self, tool_name: str, arguments: dict[str, Any]) -> Any:
             raise RuntimeError("HTTP client not initialized")
 
         try:
-            response = self._http_client.post(
-                "/mcp/v1",
-                json={
-                    "jsonrpc": "2.0",
-                    "id": 2,
-                    "method": "tools/call",
-                    "params": {
-                        "name": tool_name,
-                        "arguments": arguments,
-                    },
-                },
+            data = self._post_jsonrpc(
+                _TOOL_CALL_PREFIX % (next(self._request_ids), json_dumps_bytes(tool_name))
+                + json_dumps_bytes(arguments)
+                + _TOOL_CALL_SUFFIX
             )
-            response.raise_for_status()
-            data = response.json()
 
             if "error" in data:
                 raise RuntimeError(f"Tool execution error: {data['error']}")
@@ -416,12 +777,78 @@ def _call_tool_http(self, tool_name: str, arguments: dict[str, Any]) -> Any:
         except Exception as e:
             raise RuntimeError(f"Failed to call tool via HTTP: {e}") from e
 
+    def _call_tools_http_batch(self, calls: list[tuple[str, dict[str, Any]]]) -> list[Any]:
+        """Call tools via one HTTP JSON-RPC batch request."""
+        if not self._http_client:
+            raise RuntimeError("HTTP client not initialized")
+
+        try:
+            data = self._post_jsonrpc(
+                [
+                    {
+                        "jsonrpc": "2.0",
+                        "id": i,
+                        "method": "tools/call",
+                        "params": {
+                            "name": tool_name,
+                            "arguments": arguments,
+                        },
+                    }
+                    for i, (tool_name, arguments) in enumerate(calls)
+                ]
+            )
+        except Exception as e:
+            raise RuntimeError(f"Failed to call tools via HTTP: {e}") from e
+
+        # A single error object instead of an array: the whole batch was refused
+        if isinstance(data, dict):
+            error = data.get("error")
+            if isinstance(error, dict) and error.get("code") in _BATCH_UNSUPPORTED_CODES:
+                logger.debug(f"MCP server '{self.config.name}' does not support batch requests")
+                return [
+                    self._call_tool_http(tool_name, arguments) for tool_name, arguments in calls
+                ]
+            raise RuntimeError(f"Tool execution error: {error}")
+
+        responses = {item.get("id"): item for item in data}
+        results = []
+        for i, (tool_name, _) in enumerate(calls):
+            item = responses.get(i)
+            if item is None:
+                raise RuntimeError(f"No response for tool '{tool_name}' in batch")
+            if "error" in item:
+                raise RuntimeError(f"Tool execution error: {item['error']}")
+            results.append(item.get("result", {}).get("content", []))
+        return results
+
     _CLEANUP_TIMEOUT = 10
     _THREAD_JOIN_TIMEOUT = 12
 
     async def _cleanup_stdio_async(self) -> None:
         """Async cleanup for STDIO session and context managers.
 
+        anyio only lets a context be exited by the task that entered it, so
+        the task that opened the connection is told to close it and awaited.
+        Without such a task (e.g. the connection failed half-way) the
+        contexts are exited from here on a best-effort basis.
+        """
+        task, closing = self._stdio_task, self._stdio_closing
+        try:
+            if task is not None and closing is not None and not task.done():
+                closing.set()
+                await asyncio.wait({task})
+            else:
+                await self._exit_stdio_contexts(self._session, self._stdio_context)
+        finally:
+            self._session = None
+            self._stdio_context = None
+            self._stdio_task = None
+            self._stdio_closing = None
+
+    @staticmethod
+    async def _exit_stdio_contexts(session, stdio_context) -> None:
+        """Exit the STDIO session and context managers.
+
         Cleanup order is critical:
         - The session must be closed BEFORE the stdio_context because the session
           depends on the streams provided by stdio_context.
@@ -432,33 +859,93 @@ async def _cleanup_stdio_async(self) -> None:
         """
         # First: close session (depends on stdio_context streams)
         try:
-            if self._session:
-                await self._session.__aexit__(None, None, None)
+            if session:
+                await session.__aexit__(None, None, None)
         except asyncio.CancelledError:
             logger.warning(
                 "MCP session cleanup was cancelled; proceeding with best-effort shutdown"
             )
         except Exception as e:
             logger.warning(f"Error closing MCP session: {e}")
-        finally:
-            self._session = None
 
         # Second: close stdio_context (provides the underlying streams)
         try:
-            if self._stdio_context:
-                await self._stdio_context.__aexit__(None, None, None)
+            if stdio_context:
+                await stdio_context.__aexit__(None, None, None)
         except asyncio.CancelledError:
             logger.warning(
                 "STDIO context cleanup was cancelled; proceeding with best-effort shutdown"
             )
         except Exception as e:
             logger.warning(f"Error closing STDIO context: {e}")
-        finally:
-            self._stdio_context = None
+
+    def _attach_stdio(self, conn: StdioConnection) -> None:
+        """Adopt a live STDIO connection (see mcp_stdio_pool)."""
+        self._loop = conn.loop
+        self._loop_thread = conn.loop_thread
+        self._session = conn.session
+        self._stdio_context = conn.stdio_context
+        self._read_stream = conn.read_stream
+        self._write_stream = conn.write_stream
+        self._server_params = conn.server_params
+        self._server_version = conn.server_version
+        self._stdio_task = conn.task
+        self._stdio_closing = conn.closing
+
+    def _detach_stdio(self) -> StdioConnection:
+        """Hand the live STDIO connection over, leaving this client without one."""
+        conn = StdioConnection(
+            server_name=self.config.name,
+            loop=self._loop,
+            loop_thread=self._loop_thread,
+            session=self._session,
+            stdio_context=self._stdio_context,
+            read_stream=self._read_stream,
+            write_stream=self._write_stream,
+            server_params=getattr(self, "_server_params", None),
+            server_version=self._server_version,
+            task=self._stdio_task,
+            closing=self._stdio_closing,
+        )
+        self._stdio_task = None
+        self._stdio_closing = None
+        self._session = None
+        self._stdio_context = None
+        self._read_stream = None
+        self._write_stream = None
+        self._loop = None
+        self._loop_thread = None
+        self._tools_future = None
+        return conn
 
     def disconnect(self) -> None:
-        """Disconnect from the MCP server."""
-        # Clean up persistent STDIO connection
+        """Disconnect from the MCP server.
+
+        A healthy STDIO connection is parked in mcp_stdio_pool for reuse by
+        the next client for the same server instead of being shut down.
+        """
+        if self._loop is not None and self._session is not None:
+            conn = self._detach_stdio()
+            if conn.is_alive():
+                mcp_stdio_pool.release(
+                    _client_cache_key(self.config), conn, _close_stdio_connection
+                )
+            else:
+                self._attach_stdio(conn)
+
+        self._close_stdio()
+
+        # Clean up HTTP client (shared clients are closed once unused)
+        if self._http_client:
+            _release_http_client(self._http_pool_key, self._http_client)
+            self._http_client = None
+            self._http_pool_key = None
+
+        self._connected = False
+        logger.info(f"Disconnected from MCP server '{self.config.name}'")
+
+    def _close_stdio(self) -> None:
+        """Shut down the persistent STDIO connection, if this client holds one."""
         if self._loop is not None:
             cleanup_attempted = False
 
@@ -522,18 +1009,13 @@ def disconnect(self) -> None:
             # Setting None to None is safe and ensures clean state.
             self._session = None
             self._stdio_context = None
+            self._stdio_task = None
+            self._stdio_closing = None
             self._read_stream = None
             self._write_stream = None
             self._loop = None
             self._loop_thread = None
-
-        # Clean up HTTP client
-        if self._http_client:
-            self._http_client.close()
-            self._http_client = None
-
-        self._connected = False
-        logger.info(f"Disconnected from MCP server '{self.config.name}'")
+            self._tools_future = None
 
     def __enter__(self):
         """Context manager entry."""
@@ -543,3 +1025,197 @@ def __enter__(self):
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.disconnect()
+
+
+def _drain_and_close_loop(loop: asyncio.AbstractEventLoop, timeout: float = 2.0) -> None:
+    """Cancel the tasks left on a stopped loop, give them time to unwind, and close it."""
+    try:
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.wait(pending, timeout=timeout))
+        loop.run_until_complete(loop.shutdown_asyncgens())
+    except Exception as e:
+        logger.debug(f"Error draining MCP event loop: {e}")
+    finally:
+        loop.close()
+
+
+def _close_stdio_connection(conn: StdioConnection) -> None:
+    """Shut down a pooled STDIO connection that no client holds any more."""
+    client = MCPClient(MCPServerConfig(name=conn.server_name, transport="stdio"))
+    client._attach_stdio(conn)
+    client._close_stdio()
+
+
+# Process-wide cache of connected clients, so repeated lookups for the same
+# server reuse a warm session instead of spawning/initializing a new one.
+_CLIENT_CACHE: dict[str, MCPClient] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+# One lock per config, held while its client connects, so a slow server
+# start-up only blocks callers waiting for that same server
+_CLIENT_CONNECT_LOCKS: dict[str, threading.Lock] = {}
+_CACHE_STATS = {"hits": 0, "misses": 0}
+
+
+def _cached_client(key: str) -> MCPClient | None:
+    """Return the connected cached client for key, counting a hit; needs _CLIENT_CACHE_LOCK."""
+    client = _CLIENT_CACHE.get(key)
+    if client is not None and client._connected:
+        _CACHE_STATS["hits"] += 1
+        return client
+    return None
+
+
+def get_mcp_client(config: MCPServerConfig) -> MCPClient:
+    """
+    Get a connected client for a server, reusing a cached one when possible.
+
+    Cached clients stay connected until close_cached_clients() drops them
+    (at interpreter exit at the latest); callers must not disconnect them.
+
+    Args:
+        config: Server configuration
+
+    Returns:
+        A connected MCPClient shared with other callers using the same config
+    """
+    key = _client_cache_key(config)
+    with _CLIENT_CACHE_LOCK:
+        client = _cached_client(key)
+        if client is not None:
+            return client
+        connect_lock = _CLIENT_CONNECT_LOCKS.setdefault(key, threading.Lock())
+
+    with connect_lock:
+        # Another caller may have connected this server while we waited
+        with _CLIENT_CACHE_LOCK:
+            client = _cached_client(key)
+            if client is not None:
+                return client
+            _CACHE_STATS["misses"] += 1
+
+        client = MCPClient(config)
+        client.connect()
+        with _CLIENT_CACHE_LOCK:
+            _CLIENT_CACHE[key] = client
+        return client
+
+
+def get_cache_stats() -> dict[str, int]:
+    """Return client cache hit/miss counters and the number of cached clients."""
+    with _CLIENT_CACHE_LOCK:
+        return {**_CACHE_STATS, "size": len(_CLIENT_CACHE)}
+
+
+def close_cached_clients(name: str | None = None) -> None:
+    """
+    Disconnect and drop cached clients.
+
+    Args:
+        name: Only drop clients for this server name; drops everything if None
+    """
+    with _CLIENT_CACHE_LOCK:
+        keys = [k for k, c in _CLIENT_CACHE.items() if name is None or c.config.name == name]
+        clients = [_CLIENT_CACHE.pop(k) for k in keys]
+
+    for client in clients:
+        try:
+            if name is not None:
+                # The server is going away: stop it instead of parking it for reuse
+                client._close_stdio()
+            client.disconnect()
+        except Exception as e:
+            logger.warning(f"Error disconnecting cached MCP client '{client.config.name}': {e}")
+
+
+atexit.register(close_cached_clients)
+
+
+# httpx clients shared by every MCPClient that reaches the same URL with the
+# same headers, so their keep-alive connections are reused across clients.
+# A client whose last user disconnected is closed once it has been idle for
+# HTTP_POOL_IDLE_SECONDS (checked on the next acquire or release) or at exit.
+HTTP_POOL_IDLE_SECONDS = 60.0
+
+
+@dataclass(slots=True)
+class _HttpPoolEntry:
+    client: httpx.Client
+    users: int = 0
+    idle_since: float = 0.0
+
+
+_HTTP_POOLS: dict[tuple, _HttpPoolEntry] = {}
+_HTTP_POOLS_LOCK = threading.Lock()
+
+
+def _http_pool_key(config: MCPServerConfig) -> tuple:
+    return (config.url, frozenset(config.headers.items()))
+
+
+def _acquire_http_client(key: tuple, config: MCPServerConfig) -> httpx.Client:
+    """Return the shared httpx client for key, creating it if needed."""
+    with _HTTP_POOLS_LOCK:
+        expired = _pop_idle_http_pools()
+        entry = _HTTP_POOLS.get(key)
+        if entry is None:
+            entry = _HTTP_POOLS[key] = _HttpPoolEntry(
+                httpx.Client(
+                    base_url=config.url,
+                    headers=config.headers,
+                    timeout=_HTTP_TIMEOUT,
+                    # Pool settings live on the transport (a client-level
+                    # limits/http2 would be ignored once a transport is given);
+                    # retries=1 retries a failed connection attempt once.
+                    transport=httpx.HTTPTransport(
+                        limits=_HTTP_LIMITS, http2=_HTTP2_AVAILABLE, retries=1
+                    ),
+                )
+            )
+        entry.users += 1
+        client = entry.client
+
+    for idle in expired:
+        idle.close()
+    return client
+
+
+def _release_http_client(key: tuple | None, client: httpx.Client) -> None:
+    """Drop one user of a shared client; clients not in the pool are closed now."""
+    with _HTTP_POOLS_LOCK:
+        entry = _HTTP_POOLS.get(key) if key is not None else None
+        pooled = entry is not None and entry.client is client
+        if pooled:
+            entry.users -= 1
+            if entry.users == 0:
+                entry.idle_since = time.monotonic()
+        expired = _pop_idle_http_pools()
+
+    if not pooled:
+        expired.append(client)
+    for idle in expired:
+        idle.close()
+
+
+def _pop_idle_http_pools() -> list[httpx.Client]:
+    """Remove and return clients unused for HTTP_POOL_IDLE_SECONDS (lock held)."""
+    cutoff = time.monotonic() - HTTP_POOL_IDLE_SECONDS
+    expired = [
+        key for key, entry in _HTTP_POOLS.items() if entry.users == 0 and entry.idle_since <= cutoff
+    ]
+    return [_HTTP_POOLS.pop(key).client for key in expired]
+
+
+def close_http_pools() -> None:
+    """Close every shared httpx client."""
+    with _HTTP_POOLS_LOCK:
+        clients = [entry.client for entry in _HTTP_POOLS.values()]
+        _HTTP_POOLS.clear()
+
+    for client in clients:
+        client.close()
+
+
+atexit.register(close_http_pools)
@@ -0,0 +1,159 @@
+"""Pool of idle STDIO MCP server connections.
+
+Starting a STDIO MCP server (process spawn, interpreter start-up, session
+``initialize()``) dominates the cost of MCPClient.connect().  When a STDIO
+client disconnects, its still-running server process, session and background
+event loop are parked here instead of being torn down, so the next client
+for the same server configuration can claim the warm connection.
+
+Idle connections are closed after IDLE_TTL_SECONDS by a daemon reaper
+thread, when more than MAX_IDLE_PER_SERVER are parked for one server, and
+at interpreter exit.
+"""
+
+import asyncio
+import atexit
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+IDLE_TTL_SECONDS = 120.0
+MAX_IDLE_PER_SERVER = 2
+
+
+@dataclass
+class StdioConnection:
+    """A live STDIO connection detached from the MCPClient that opened it."""
+
+    server_name: str
+    loop: asyncio.AbstractEventLoop
+    loop_thread: threading.Thread
+    session: Any
+    stdio_context: Any
+    read_stream: Any
+    write_stream: Any
+    server_params: Any = None
+    # serverInfo "name version" from the session's initialize() response
+    server_version: str | None = None
+    # Task holding the connection open, and the event that tells it to close
+    task: Any = None
+    closing: Any = None
+    released_at: float = 0.0
+
+    def is_alive(self) -> bool:
+        """Whether the connection's event loop is still serving requests."""
+        return (
+            self.session is not None
+            and self.loop.is_running()
+            and not self.loop.is_closed()
+            and self.loop_thread.is_alive()
+        )
+
+
+# key -> parked connections (oldest first), each with the callable that closes it
+_idle: dict[str, list[tuple[StdioConnection, Callable[[StdioConnection], None]]]] = {}
+_lock = threading.Lock()
+_reaper: threading.Thread | None = None
+
+
+def acquire(key: str) -> StdioConnection | None:
+    """
+    Claim a parked connection for a server configuration.
+
+    Args:
+        key: Server configuration key
+
+    Returns:
+        The most recently parked live connection, or None if there is none
+    """
+    dead = []
+    conn = None
+    with _lock:
+        entries = _idle.get(key)
+        while entries:
+            candidate, close = entries.pop()
+            if candidate.is_alive():
+                conn = candidate
+                break
+            dead.append((candidate, close))
+        if not entries:
+            _idle.pop(key, None)
+
+    for candidate, close in dead:
+        _close(candidate, close)
+    return conn
+
+
+def release(key: str, conn: StdioConnection, close: Callable[[StdioConnection], None]) -> None:
+    """
+    Park a connection for reuse.
+
+    Args:
+        key: Server configuration key
+        conn: The detached connection
+        close: Called to shut the connection down when it is evicted
+    """
+    global _reaper
+
+    evicted = None
+    conn.released_at = time.monotonic()
+    with _lock:
+        entries = _idle.setdefault(key, [])
+        entries.append((conn, close))
+        if len(entries) > MAX_IDLE_PER_SERVER:
+            evicted = entries.pop(0)
+        if _reaper is None or not _reaper.is_alive():
+            _reaper = threading.Thread(target=_reap_forever, name="mcp-stdio-reaper", daemon=True)
+            try:
+                _reaper.start()
+            except RuntimeError:
+                # Interpreter shutdown: close_idle() runs from atexit anyway
+                _reaper = None
+
+    if evicted is not None:
+        _close(*evicted)
+
+
+def close_idle() -> None:
+    """Close every parked connection."""
+    with _lock:
+        entries = [entry for parked in _idle.values() for entry in parked]
+        _idle.clear()
+
+    for conn, close in entries:
+        _close(conn, close)
+
+
+def _close(conn: StdioConnection, close: Callable[[StdioConnection], None]) -> None:
+    try:
+        close(conn)
+    except Exception as e:
+        logger.warning(f"Error closing pooled MCP connection '{conn.server_name}': {e}")
+
+
+def _reap_forever() -> None:
+    """Close connections that have been idle longer than IDLE_TTL_SECONDS."""
+    while True:
+        time.sleep(max(IDLE_TTL_SECONDS / 4, 1.0))
+        cutoff = time.monotonic() - IDLE_TTL_SECONDS
+        expired = []
+        with _lock:
+            for key in list(_idle):
+                keep = []
+                for entry in _idle[key]:
+                    (expired if entry[0].released_at <= cutoff else keep).append(entry)
+                if keep:
+                    _idle[key] = keep
+                else:
+                    del _idle[key]
+
+        for conn, close in expired:
+            _close(conn, close)
+
+
+atexit.register(close_idle)
@@ -4,6 +4,7 @@
 
 import asyncio
 import json
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -56,6 +57,7 @@ def __init__(
         self,
         llm: LLMProvider | None = None,
         model: str = "claude-haiku-4-5-20251001",
+        llm_factory: Callable[..., LLMProvider] | None = None,
     ):
         """
         Initialize the orchestrator.
@@ -63,6 +65,9 @@ def __init__(
         Args:
             llm: LLM provider for routing decisions (auto-creates if None)
             model: Model to use for routing
+            llm_factory: Builds the provider when llm is None, called with
+                model, api_key, api_base and any extra LLM kwargs from the
+                config (defaults to LiteLLMProvider)
         """
         self._agents: dict[str, RegisteredAgent] = {}
         self._llm = llm
@@ -72,9 +77,13 @@ def __init__(
         # Auto-create LLM - LiteLLM auto-detects provider and API key from model name
         if self._llm is None:
             from framework.config import get_api_base, get_api_key, get_llm_extra_kwargs
-            from framework.llm.litellm import LiteLLMProvider
 
-            self._llm = LiteLLMProvider(
+            if llm_factory is None:
+                from framework.llm.litellm import LiteLLMProvider
+
+                llm_factory = LiteLLMProvider
+
+            self._llm = llm_factory(
                 model=self._model,
                 api_key=get_api_key(),
                 api_base=get_api_base(),
@@ -87,7 +87,7 @@ class EventType(StrEnum):
     ESCALATION_REQUESTED = "escalation_requested"
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentEvent:
     """An event in the agent system."""
 
@@ -5,11 +5,14 @@
 This CLI provides the interactive approval workflow.
 """
 
-import json
+import contextlib
+import functools
 import os
+import signal
 import subprocess
 import tempfile
 from collections.abc import Callable
+from shutil import which
 
 from framework.testing.approval_types import (
     ApprovalAction,
@@ -19,6 +22,17 @@
 )
 from framework.testing.test_case import Test
 from framework.testing.test_storage import TestStorage
+from framework.utils.io import json_dumps_indented
+
+# Editors tried, in order, when $EDITOR is not installed
+_FALLBACK_EDITORS = ("nano", "vi", "notepad")
+
+# BatchApprovalResult counter for each action that saves the test
+_ACTION_COUNT_KEYS = {
+    ApprovalAction.APPROVE: "approved",
+    ApprovalAction.MODIFY: "modified",
+    ApprovalAction.REJECT: "rejected",
+}
 
 
 def interactive_approval(
@@ -91,6 +105,10 @@ def batch_approval(
         "skipped": 0,
         "errors": 0,
     }
+    # Changed tests are saved together after the loop; a test named by
+    # several requests is loaded once and carries every change.
+    dirty: dict[str, Test] = {}
+    saved: list[tuple[int, ApprovalRequest]] = []
 
     for req in requests:
         # Validate request
@@ -103,7 +121,7 @@ def batch_approval(
             continue
 
         # Load test
-        test = storage.load_test(goal_id, req.test_id)
+        test = dirty.get(req.test_id) or storage.load_test(goal_id, req.test_id)
         if not test:
             results.append(
                 ApprovalResult.error_result(
@@ -129,7 +147,8 @@ def batch_approval(
 
             # Save if not skipped
             if req.action != ApprovalAction.SKIP:
-                storage.update_test(test)
+                dirty[test.id] = test
+                saved.append((len(results), req))
 
             results.append(
                 ApprovalResult.success_result(
@@ -141,6 +160,15 @@ def batch_approval(
             results.append(ApprovalResult.error_result(req.test_id, req.action, str(e)))
             counts["errors"] += 1
 
+    if dirty:
+        try:
+            storage.update_tests_bulk(list(dirty.values()))
+        except Exception as e:
+            for i, req in saved:
+                results[i] = ApprovalResult.error_result(req.test_id, req.action, str(e))
+                counts[_ACTION_COUNT_KEYS[req.action]] -= 1
+                counts["errors"] += 1
+
     return BatchApprovalResult(
         goal_id=goal_id,
         total=len(requests),
@@ -168,11 +196,11 @@ def _display_test(test: Test, index: int, total: int) -> None:
 
     if test.input:
         print("\nInput:")
-        print(json.dumps(test.input, indent=2))
+        print(json_dumps_indented(test.input))
 
     if test.expected_output:
         print("\nExpected Output:")
-        print(json.dumps(test.expected_output, indent=2))
+        print(json_dumps_indented(test.expected_output))
 
     print("\nTest Code:")
     print("-" * 40)
@@ -254,43 +282,64 @@ def _edit_test_code(code: str) -> str:
 
     Uses $EDITOR environment variable, falls back to vim/nano.
     """
-    editor = os.environ.get("EDITOR", "vim")
+    editor = _resolve_editor(os.environ.get("EDITOR", "vim"))
 
-    # Try to find an available editor
-    if not _command_exists(editor):
-        for fallback in ["nano", "vi", "notepad"]:
-            if _command_exists(fallback):
-                editor = fallback
-                break
+    with contextlib.ExitStack() as stack:
+        # Create temp file with code; removed on exit, including Ctrl-C
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
+            f.write(code)
+        stack.callback(_remove_quietly, f.name)
 
-    # Create temp file with code
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-        f.write(code)
-        temp_path = f.name
-
-    try:
-        # Open editor
-        subprocess.run([editor, temp_path], check=True)
+        try:
+            returncode = _run_editor(editor, f.name)
+        except FileNotFoundError:
+            print(f"Editor '{editor}' not found, keeping original code")
+            return code
+        if returncode != 0:
+            print("Editor failed, keeping original code")
+            return code
 
         # Read edited code
-        with open(temp_path) as f:
-            return f.read()
-    except subprocess.CalledProcessError:
-        print("Editor failed, keeping original code")
-        return code
-    except FileNotFoundError:
-        print(f"Editor '{editor}' not found, keeping original code")
-        return code
-    finally:
-        # Clean up temp file
+        with open(f.name) as edited:
+            return edited.read()
+
+
+def _run_editor(editor: str, path: str) -> int:
+    """Run the editor on path in the foreground and return its exit code."""
+    if hasattr(os, "posix_spawnp"):
+        # Lighter than subprocess.Popen: no pipes or pre-exec bookkeeping
+        pid = os.posix_spawnp(editor, [editor, path], os.environ)
         try:
-            os.unlink(temp_path)
-        except OSError:
-            pass
+            _, status = os.waitpid(pid, 0)
+        except BaseException:
+            # Ctrl-C: editors like vim ignore SIGINT, so stop and reap the
+            # editor before its file is removed, as subprocess.run would
+            os.kill(pid, signal.SIGTERM)
+            os.waitpid(pid, 0)
+            raise
+        return os.waitstatus_to_exitcode(status)
+    return subprocess.run([editor, path]).returncode
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
 
 
-def _command_exists(cmd: str) -> bool:
-    """Check if a command exists in PATH."""
-    from shutil import which
+@functools.lru_cache(maxsize=8)
+def _resolve_editor(preferred: str) -> str:
+    """Return the preferred editor if installed, else the first available fallback."""
+    if _command_exists(preferred):
+        return preferred
+    for fallback in _FALLBACK_EDITORS:
+        if _command_exists(fallback):
+            return fallback
+    return preferred
+
 
+@functools.lru_cache(maxsize=64)
+def _command_exists(cmd: str) -> bool:
+    """Check if a command exists in PATH (memoized: PATH is scanned once per name)."""
     return which(cmd) is not None
@@ -7,11 +7,77 @@
 - EDGE_CASE: New scenario discovered → add new test only
 """
 
+import array
+import functools
 import re
 from typing import Any
 
 from framework.testing.test_result import ErrorCategory, TestResult
 
+try:
+    import re2
+except ImportError:  # optional linear-time engine; stdlib re is always available
+    re2 = None
+
+# Distinct error texts whose result each categorizer remembers; reruns of a
+# failing test usually fail with the same text
+_TEXT_CACHE_SIZE = 500
+
+# Runtime log levels whose messages are included in the error text
+_ERROR_LOG_LEVELS = frozenset(("ERROR", "CRITICAL", "WARNING"))
+
+# Fix suggestion and iteration guidance per category; built once rather than
+# on every lookup
+_FIX_SUGGESTIONS = {
+    ErrorCategory.LOGIC_ERROR: (
+        "Review and update success_criteria or constraints in the Goal definition. "
+        "The goal specification may not accurately describe the desired behavior."
+    ),
+    ErrorCategory.IMPLEMENTATION_ERROR: (
+        "Fix the code in agent nodes/edges. "
+        "There's a bug in the implementation that needs to be corrected."
+    ),
+    ErrorCategory.EDGE_CASE: (
+        "Add a new test for this edge case scenario. "
+        "This is a valid scenario that wasn't covered by existing tests."
+    ),
+}
+
+_ITERATION_GUIDANCE = {
+    ErrorCategory.LOGIC_ERROR: {
+        "stage": "Goal",
+        "action": "Update success_criteria or constraints",
+        "restart_required": True,
+        "description": (
+            "The goal definition is incorrect. Update the success criteria "
+            "or constraints, then restart the full Goal → Agent → Eval flow."
+        ),
+    },
+    ErrorCategory.IMPLEMENTATION_ERROR: {
+        "stage": "Agent",
+        "action": "Fix nodes/edges implementation",
+        "restart_required": False,
+        "description": (
+            "There's a code bug. Fix the agent implementation, then re-run Eval (skip Goal stage)."
+        ),
+    },
+    ErrorCategory.EDGE_CASE: {
+        "stage": "Eval",
+        "action": "Add new test only",
+        "restart_required": False,
+        "description": (
+            "This is a new scenario. Add a test for it and continue in the Eval stage."
+        ),
+    },
+}
+
+_UNKNOWN_GUIDANCE = {
+    "stage": "Unknown",
+    "action": "Review manually",
+    "restart_required": False,
+    "description": "Unable to determine category. Manual review required.",
+}
+
 
 class ErrorCategorizer:
     """
@@ -80,11 +146,26 @@ class ErrorCategorizer:
 
     def __init__(self):
         """Initialize categorizer with compiled patterns."""
-        self._logic_patterns = [re.compile(p, re.IGNORECASE) for p in self.LOGIC_ERROR_PATTERNS]
-        self._impl_patterns = [
-            re.compile(p, re.IGNORECASE) for p in self.IMPLEMENTATION_ERROR_PATTERNS
+        # Categories in priority order: logic errors take precedence (wrong
+        # goal definition), then implementation errors (code bugs), then
+        # edge cases (new scenarios)
+        self._categories = [
+            (ErrorCategory.LOGIC_ERROR, _pattern_set(tuple(self.LOGIC_ERROR_PATTERNS))),
+            (
+                ErrorCategory.IMPLEMENTATION_ERROR,
+                _pattern_set(tuple(self.IMPLEMENTATION_ERROR_PATTERNS)),
+            ),
+            (ErrorCategory.EDGE_CASE, _pattern_set(tuple(self.EDGE_CASE_PATTERNS))),
         ]
-        self._edge_patterns = [re.compile(p, re.IGNORECASE) for p in self.EDGE_CASE_PATTERNS]
+        self._counter = _category_counter(tuple(patterns for _, patterns in self._categories))
+
+        self._match_category = functools.lru_cache(maxsize=_TEXT_CACHE_SIZE)(self._match_category)
+        self._count_matches = functools.lru_cache(maxsize=_TEXT_CACHE_SIZE)(self._count_matches)
+
+    def clear_cache(self) -> None:
+        """Forget the results remembered for recently seen error texts."""
+        self._match_category.cache_clear()
+        self._count_matches.cache_clear()
 
     def categorize(self, result: TestResult) -> ErrorCategory | None:
         """
@@ -100,26 +181,7 @@ def categorize(self, result: TestResult) -> ErrorCategory | None:
             return None
 
         # Combine error sources for analysis
-        error_text = self._get_error_text(result)
-
-        # Check patterns in priority order
-        # Logic errors take precedence (wrong goal definition)
-        for pattern in self._logic_patterns:
-            if pattern.search(error_text):
-                return ErrorCategory.LOGIC_ERROR
-
-        # Then implementation errors (code bugs)
-        for pattern in self._impl_patterns:
-            if pattern.search(error_text):
-                return ErrorCategory.IMPLEMENTATION_ERROR
-
-        # Then edge cases (new scenarios)
-        for pattern in self._edge_patterns:
-            if pattern.search(error_text):
-                return ErrorCategory.EDGE_CASE
-
-        # Default to implementation error (most common)
-        return ErrorCategory.IMPLEMENTATION_ERROR
+        return self._match_category(self._get_error_text(result))
 
     def categorize_with_confidence(self, result: TestResult) -> tuple[ErrorCategory | None, float]:
         """
@@ -134,45 +196,45 @@ def categorize_with_confidence(self, result: TestResult) -> tuple[ErrorCategory
         if result.passed:
             return None, 1.0
 
-        error_text = self._get_error_text(result)
-
         # Count pattern matches for each category
-        logic_matches = sum(1 for p in self._logic_patterns if p.search(error_text))
-        impl_matches = sum(1 for p in self._impl_patterns if p.search(error_text))
-        edge_matches = sum(1 for p in self._edge_patterns if p.search(error_text))
-
-        total_matches = logic_matches + impl_matches + edge_matches
+        counts = self._count_matches(self._get_error_text(result))
+        total_matches = sum(counts)
 
         if total_matches == 0:
             # No pattern matches, default to implementation with low confidence
             return ErrorCategory.IMPLEMENTATION_ERROR, 0.3
 
-        # Calculate confidence based on match dominance
-        if logic_matches >= impl_matches and logic_matches >= edge_matches:
-            confidence = logic_matches / total_matches if total_matches > 0 else 0.5
-            return ErrorCategory.LOGIC_ERROR, min(0.9, 0.5 + confidence * 0.4)
+        # Calculate confidence based on match dominance; max() keeps the first
+        # of equal counts, so ties go to the higher-priority category
+        best = max(range(len(counts)), key=counts.__getitem__)
+        confidence = counts[best] / total_matches
+        return self._categories[best][0], min(0.9, 0.5 + confidence * 0.4)
 
-        if impl_matches >= logic_matches and impl_matches >= edge_matches:
-            confidence = impl_matches / total_matches if total_matches > 0 else 0.5
-            return ErrorCategory.IMPLEMENTATION_ERROR, min(0.9, 0.5 + confidence * 0.4)
+    def _match_category(self, error_text: str) -> ErrorCategory:
+        """First category, in priority order, with a matching pattern."""
+        lowered = _fold_case(error_text)
+        for category, patterns in self._categories:
+            if patterns.matches(lowered):
+                return category
 
-        confidence = edge_matches / total_matches if total_matches > 0 else 0.5
-        return ErrorCategory.EDGE_CASE, min(0.9, 0.5 + confidence * 0.4)
+        # Default to implementation error (most common)
+        return ErrorCategory.IMPLEMENTATION_ERROR
+
+    def _count_matches(self, error_text: str) -> tuple[int, int, int]:
+        """Number of matching patterns per category, in priority order."""
+        logic, impl, edge = self._counter.count(_fold_case(error_text))
+        return logic, impl, edge
 
     def _get_error_text(self, result: TestResult) -> str:
         """Extract all error text from a result for analysis."""
-        parts = []
-
-        if result.error_message:
-            parts.append(result.error_message)
-
-        if result.stack_trace:
-            parts.append(result.stack_trace)
+        parts = [part for part in (result.error_message, result.stack_trace) if part]
 
         # Include log messages
-        for log in result.runtime_logs:
-            if log.get("level") in ("ERROR", "CRITICAL", "WARNING"):
-                parts.append(str(log.get("msg", "")))
+        parts.extend(
+            str(log.get("msg", ""))
+            for log in result.runtime_logs
+            if log.get("level") in _ERROR_LOG_LEVELS
+        )
 
         return " ".join(parts)
 
@@ -186,21 +248,7 @@ def get_fix_suggestion(self, category: ErrorCategory) -> str:
         Returns:
             Human-readable fix suggestion
         """
-        suggestions = {
-            ErrorCategory.LOGIC_ERROR: (
-                "Review and update success_criteria or constraints in the Goal definition. "
-                "The goal specification may not accurately describe the desired behavior."
-            ),
-            ErrorCategory.IMPLEMENTATION_ERROR: (
-                "Fix the code in agent nodes/edges. "
-                "There's a bug in the implementation that needs to be corrected."
-            ),
-            ErrorCategory.EDGE_CASE: (
-                "Add a new test for this edge case scenario. "
-                "This is a valid scenario that wasn't covered by existing tests."
-            ),
-        }
-        return suggestions.get(category, "Review the test and agent implementation.")
+        return _FIX_SUGGESTIONS.get(category, "Review the test and agent implementation.")
 
     def get_iteration_guidance(self, category: ErrorCategory) -> dict[str, Any]:
         """
@@ -211,40 +259,140 @@ def get_iteration_guidance(self, category: ErrorCategory) -> dict[str, Any]:
         - action: What action to take
         - restart_required: Whether full 3-step flow restart is needed
         """
-        guidance = {
-            ErrorCategory.LOGIC_ERROR: {
-                "stage": "Goal",
-                "action": "Update success_criteria or constraints",
-                "restart_required": True,
-                "description": (
-                    "The goal definition is incorrect. Update the success criteria "
-                    "or constraints, then restart the full Goal → Agent → Eval flow."
-                ),
-            },
-            ErrorCategory.IMPLEMENTATION_ERROR: {
-                "stage": "Agent",
-                "action": "Fix nodes/edges implementation",
-                "restart_required": False,
-                "description": (
-                    "There's a code bug. Fix the agent implementation, "
-                    "then re-run Eval (skip Goal stage)."
-                ),
-            },
-            ErrorCategory.EDGE_CASE: {
-                "stage": "Eval",
-                "action": "Add new test only",
-                "restart_required": False,
-                "description": (
-                    "This is a new scenario. Add a test for it and continue in the Eval stage."
-                ),
-            },
-        }
-        return guidance.get(
-            category,
-            {
-                "stage": "Unknown",
-                "action": "Review manually",
-                "restart_required": False,
-                "description": "Unable to determine category. Manual review required.",
-            },
+        # Copy so callers can modify the result without touching the shared table
+        return dict(_ITERATION_GUIDANCE.get(category, _UNKNOWN_GUIDANCE))
+
+
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]()|\\")
+
+
+class _PatternSet:
+    """
+    One category's patterns, matched case-insensitively.
+
+    The caller case-folds the text once (see _fold_case()); literal patterns
+    are then plain substring checks and the rest are searched as lowercased
+    case-sensitive regexes.  sre already finds a regex's literal prefix
+    quickly, but each occurrence of a common prefix ("no", "request") starts
+    a ``.*`` scan, so a regex is skipped unless the text contains a later
+    literal that its matches require.  That gives the same result as
+    IGNORECASE at a fraction of the cost (and, once the literals are gone,
+    the few remaining regexes search faster on their own than as one
+    alternation).
+    """
+
+    __slots__ = ("literals", "regexes")
+
+    def __init__(self, patterns: tuple[str, ...]):
+        self.literals = tuple(p.lower() for p in patterns if not _REGEX_METACHARACTERS & set(p))
+        self.regexes = [
+            (_required_suffix_literal(lowered), _compile_lowered(lowered))
+            for lowered in (
+                _lowercase_pattern(p) for p in patterns if _REGEX_METACHARACTERS & set(p)
+            )
+        ]
+
+    def matches(self, lowered: str) -> bool:
+        """Whether any pattern matches; ``lowered`` is the text after _fold_case()."""
+        return any(literal in lowered for literal in self.literals) or any(
+            literal in lowered and r.search(lowered) for literal, r in self.regexes
         )
+
+
+class _CategoryCounter:
+    """
+    Every category's patterns flattened into one table, for counting matches.
+
+    Each table entry carries the index of its category (looked up in a
+    compact ``array`` of category indexes), so the per-category match counts
+    come out of a single loop over all patterns instead of one pass per
+    category.
+    """
+
+    __slots__ = ("size", "literals", "literal_categories", "regexes")
+
+    def __init__(self, pattern_sets: tuple[_PatternSet, ...]):
+        self.size = len(pattern_sets)
+        self.literals = [literal for ps in pattern_sets for literal in ps.literals]
+        self.literal_categories = array.array(
+            "B", [i for i, ps in enumerate(pattern_sets) for _ in ps.literals]
+        )
+        self.regexes = [
+            (i, literal, r) for i, ps in enumerate(pattern_sets) for literal, r in ps.regexes
+        ]
+
+    def count(self, lowered: str) -> list[int]:
+        """Number of matching patterns per category; ``lowered`` as for _PatternSet.matches()."""
+        counts = [0] * self.size
+        categories = self.literal_categories
+        for i, literal in enumerate(self.literals):
+            if literal in lowered:
+                counts[categories[i]] += 1
+        for category, literal, r in self.regexes:
+            if literal in lowered and r.search(lowered):
+                counts[category] += 1
+        return counts
+
+
+@functools.cache
+def _pattern_set(patterns: tuple[str, ...]) -> _PatternSet:
+    """Compile a pattern list once per process; every categorizer shares the result."""
+    return _PatternSet(patterns)
+
+
+@functools.cache
+def _category_counter(pattern_sets: tuple[_PatternSet, ...]) -> _CategoryCounter:
+    """Build the flattened counting table once per combination of pattern sets."""
+    return _CategoryCounter(pattern_sets)
+
+
+def _compile_lowered(pattern: str) -> Any:
+    """
+    Compile a lowercased, case-sensitive pattern, with RE2 when it is installed.
+
+    RE2 matches in linear time, so a ``.*`` pattern cannot backtrack
+    quadratically over a long stack trace.  Patterns with escapes stay on
+    ``re``, whose ``\\s`` also matches ``\\v`` and the ASCII separator
+    characters that RE2's does not.
+    """
+    if re2 is not None and "\\" not in pattern:
+        try:
+            return re2.compile(pattern)
+        except Exception:  # syntax RE2 does not support
+            pass
+    return re.compile(pattern)
+
+
+# Characters that IGNORECASE matches to an ASCII letter but str.lower() does
+# not lower to one (İ would also lower to two characters)
+_FOLD_TO_ASCII = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s"})
+
+
+def _fold_case(text: str) -> str:
+    """Lowercase text so lowercased ASCII patterns match it as IGNORECASE would."""
+    if text.isascii():
+        return text.lower()
+    return text.translate(_FOLD_TO_ASCII).lower()
+
+
+def _lowercase_pattern(pattern: str) -> str:
+    """Lowercase a regex pattern, leaving escapes such as ``\\S`` and ``\\W`` intact."""
+    return re.sub(
+        r"\\.|[^\\]+",
+        lambda m: m.group() if m.group().startswith("\\") else m.group().lower(),
+        pattern,
+    )
+
+
+def _required_suffix_literal(pattern: str) -> str:
+    """
+    Longest literal after the first that every match of the pattern contains.
+
+    Only patterns made of literals, ``.*``, ``\\s*`` and optional (``x?``)
+    characters are analysed; for anything else, or a pattern with a single
+    literal, "" (contained in any text) is returned.
+    """
+    pieces = re.split(r"\.\*|\\s\*|\\?.\?", pattern)
+    if any(_REGEX_METACHARACTERS & set(piece) for piece in pieces):
+        return ""
+    return max(pieces[1:], key=len, default="")
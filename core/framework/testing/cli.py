@@ -10,10 +10,19 @@
 
 import argparse
 import ast
+import functools
 import os
 import subprocess
+import sys
 from pathlib import Path
 
+# Test file run by test-run for each --type filter
+_TYPE_TO_FILE = {
+    "constraint": "test_constraints.py",
+    "success": "test_success_criteria.py",
+    "edge_case": "test_edge_cases.py",
+}
+
 
 def register_testing_commands(subparsers: argparse._SubParsersAction) -> None:
     """Register testing CLI commands."""
@@ -103,6 +112,19 @@ def register_testing_commands(subparsers: argparse._SubParsersAction) -> None:
     stats_parser.set_defaults(func=cmd_test_stats)
 
 
+@functools.cache
+def _project_root() -> Path:
+    """Project root (parent of core/), resolved once per process."""
+    return Path(__file__).parent.parent.parent.parent.resolve()
+
+
+def _pytest_env() -> dict[str, str]:
+    """Environment for pytest subprocesses, with the project root on PYTHONPATH."""
+    env = os.environ.copy()
+    env["PYTHONPATH"] = f"{_project_root()}:{env.get('PYTHONPATH', '')}"
+    return env
+
+
 def cmd_test_run(args: argparse.Namespace) -> int:
     """Run tests for an agent using pytest subprocess."""
     agent_path = Path(args.agent_path)
@@ -123,13 +145,8 @@ def cmd_test_run(args: argparse.Namespace) -> int:
     if args.type == "all":
         cmd.append(str(tests_dir))
     else:
-        type_to_file = {
-            "constraint": "test_constraints.py",
-            "success": "test_success_criteria.py",
-            "edge_case": "test_edge_cases.py",
-        }
-        if args.type in type_to_file:
-            test_file = tests_dir / type_to_file[args.type]
+        if args.type in _TYPE_TO_FILE:
+            test_file = tests_dir / _TYPE_TO_FILE[args.type]
             if test_file.exists():
                 cmd.append(str(test_file))
             else:
@@ -149,12 +166,7 @@ def cmd_test_run(args: argparse.Namespace) -> int:
 
     cmd.append("--tb=short")
 
-    # Set PYTHONPATH to project root
-    env = os.environ.copy()
-    pythonpath = env.get("PYTHONPATH", "")
-    # Find project root (parent of core/)
-    project_root = Path(__file__).parent.parent.parent.parent.resolve()
-    env["PYTHONPATH"] = f"{project_root}:{pythonpath}"
+    env = _pytest_env()
 
     print(f"Running: {' '.join(cmd)}\n")
 
@@ -208,11 +220,7 @@ def cmd_test_debug(args: argparse.Namespace) -> int:
         "--tb=long",  # Full traceback
     ]
 
-    # Set PYTHONPATH to project root
-    env = os.environ.copy()
-    pythonpath = env.get("PYTHONPATH", "")
-    project_root = Path(__file__).parent.parent.parent.parent.resolve()
-    env["PYTHONPATH"] = f"{project_root}:{pythonpath}"
+    env = _pytest_env()
 
     print(f"Running: {' '.join(cmd)}\n")
 
@@ -237,6 +245,16 @@ def _scan_test_files(tests_dir: Path) -> list[dict]:
     tests = []
 
     for test_file in sorted(tests_dir.glob("test_*.py")):
+        # Determine test type from filename
+        if "constraint" in test_file.name:
+            test_type = "constraint"
+        elif "success" in test_file.name:
+            test_type = "success"
+        elif "edge" in test_file.name:
+            test_type = "edge_case"
+        else:
+            test_type = "unknown"
+
         try:
             content = test_file.read_text()
             tree = ast.parse(content)
@@ -244,16 +262,6 @@ def _scan_test_files(tests_dir: Path) -> list[dict]:
             for node in ast.walk(tree):
                 if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
                     if node.name.startswith("test_"):
-                        # Determine test type from filename
-                        if "constraint" in test_file.name:
-                            test_type = "constraint"
-                        elif "success" in test_file.name:
-                            test_type = "success"
-                        elif "edge" in test_file.name:
-                            test_type = "edge_case"
-                        else:
-                            test_type = "unknown"
-
                         docstring = ast.get_docstring(node) or ""
 
                         tests.append(
@@ -297,8 +305,6 @@ def cmd_test_list(args: argparse.Namespace) -> int:
         print(f"No tests found in {tests_dir}")
         return 0
 
-    print(f"Tests in {tests_dir}:\n")
-
     # Group by type
     by_type: dict[str, list] = {}
     for t in tests:
@@ -307,17 +313,21 @@ def cmd_test_list(args: argparse.Namespace) -> int:
             by_type[ttype] = []
         by_type[ttype].append(t)
 
+    # Build the whole listing and write it once
+    out = [f"Tests in {tests_dir}:\n\n"]
     for test_type, type_tests in sorted(by_type.items()):
-        print(f"  [{test_type.upper()}] ({len(type_tests)} tests)")
+        out.append(f"  [{test_type.upper()}] ({len(type_tests)} tests)\n")
         for t in type_tests:
             async_marker = "async " if t["is_async"] else ""
             desc = f" - {t['description']}" if t.get("description") else ""
-            print(f"    {async_marker}{t['test_name']}{desc}")
-            print(f"        {t['file']}:{t['line']}")
-        print()
+            out.append(
+                f"    {async_marker}{t['test_name']}{desc}\n        {t['file']}:{t['line']}\n"
+            )
+        out.append("\n")
 
-    print(f"Total: {len(tests)} tests")
-    print(f"\nRun with: pytest {tests_dir} -v")
+    out.append(f"Total: {len(tests)} tests\n")
+    out.append(f"\nRun with: pytest {tests_dir} -v\n")
+    sys.stdout.write("".join(out))
 
     return 0
 
@@ -340,12 +350,14 @@ def cmd_test_stats(args: argparse.Namespace) -> int:
     print(f"Test Statistics for {agent_path}:\n")
     print(f"  Total tests: {len(tests)}")
 
-    # Count by type
+    # Count by type and by file in one pass
     by_type: dict[str, int] = {}
+    by_file: dict[str, int] = {}
     async_count = 0
     for t in tests:
         ttype = t["test_type"]
         by_type[ttype] = by_type.get(ttype, 0) + 1
+        by_file[t["file"]] = by_file.get(t["file"], 0) + 1
         if t["is_async"]:
             async_count += 1
 
@@ -359,8 +371,7 @@ def cmd_test_stats(args: argparse.Namespace) -> int:
     test_files = list(tests_dir.glob("test_*.py"))
     print(f"\n  Test files ({len(test_files)}):")
     for f in sorted(test_files):
-        count = sum(1 for t in tests if t["file"] == f.name)
-        print(f"    {f.name} ({count} tests)")
+        print(f"    {f.name} ({by_file.get(f.name, 0)} tests)")
 
     print(f"\nRun all tests: pytest {tests_dir} -v")
 
@@ -9,14 +9,25 @@
 - Fix suggestions
 """
 
+from collections import OrderedDict
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
 from framework.testing.categorizer import ErrorCategorizer
 from framework.testing.test_case import Test
 from framework.testing.test_result import ErrorCategory, TestResult
 from framework.testing.test_storage import TestStorage
+from framework.utils.io import json_dumps_bytes, json_loads
+
+# Keys of get_failure_summary()'s by_category, one per ErrorCategory
+_FAILURE_BUCKETS = (*(category.value for category in ErrorCategory), "uncategorized")
+
+# Runs kept in DebugTool's runtime cache before the oldest is dropped
+RUNTIME_CACHE_SIZE = 64
+
+# Analyses kept in {base_path}/debug_cache before the least recently written are removed
+DEBUG_CACHE_SIZE = 1000
 
 
 class DebugInfo(BaseModel):
@@ -78,6 +89,8 @@ def __init__(
         self.test_storage = test_storage
         self.runtime_storage = runtime_storage
         self.categorizer = ErrorCategorizer()
+        self._runtime_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._debug_cache_dir = test_storage.base_path / "debug_cache"
 
     def analyze(
         self,
@@ -88,6 +101,9 @@ def analyze(
         """
         Get detailed debug info for a failed test.
 
+        Without a run_id the analysis is cached on disk, and reused by later
+        sessions until the test or its latest result is rewritten.
+
         Args:
             goal_id: Goal ID containing the test
             test_id: ID of the test to analyze
@@ -96,53 +112,109 @@ def analyze(
         Returns:
             DebugInfo with comprehensive debug data
         """
-        # Load test
+        # Runtime runs can still be in progress, so only cache analyses without one
+        fingerprint = None if run_id else self.test_storage.get_fingerprint(goal_id, test_id)
+        if fingerprint:
+            cached = self._load_cached_debug_info(test_id, fingerprint)
+            if cached:
+                return cached
+
         test = self.test_storage.load_test(goal_id, test_id)
+        result = self.test_storage.get_latest_result(test_id) if test else None
+        debug_info = self._build_debug_info(
+            goal_id, test_id, test, result, self._runtime_data(run_id)
+        )
+
+        if fingerprint and test and result:
+            self._cache_debug_info(test_id, fingerprint, debug_info)
+        return debug_info
+
+    def analyze_many(
+        self,
+        goal_id: str,
+        test_ids: list[str],
+        run_id: str | None = None,
+    ) -> list[DebugInfo]:
+        """
+        Get debug info for several tests of a goal.
+
+        Same result as calling analyze() for each test, but the tests and
+        their latest results are each loaded in one batch.
+
+        Args:
+            goal_id: Goal ID containing the tests
+            test_ids: IDs of the tests to analyze
+            run_id: Optional Runtime run ID for detailed logs
+
+        Returns:
+            DebugInfo for each test, in the order of test_ids
+        """
+        tests = self.test_storage.load_tests(goal_id, test_ids)
+        results = self.test_storage.get_latest_results(
+            [test_id for test_id, test in tests.items() if test]
+        )
+        # The run is the same for every test: load its data once
+        runtime_data = self._runtime_data(run_id)
+        return [
+            self._build_debug_info(
+                goal_id, test_id, tests[test_id], results.get(test_id), runtime_data
+            )
+            for test_id in test_ids
+        ]
+
+    def _build_debug_info(
+        self,
+        goal_id: str,
+        test_id: str,
+        test: Test | None,
+        result: TestResult | None,
+        runtime_data: dict[str, Any] | None,
+    ) -> DebugInfo:
+        """
+        Debug info for a loaded test and its latest result.
+
+        Every field comes from an already-validated Test/TestResult, so the
+        model is built with model_construct() rather than re-validated.
+        """
         if not test:
-            return DebugInfo(
+            return DebugInfo.model_construct(
                 test_id=test_id,
                 test_name="unknown",
                 error_message=f"Test {test_id} not found in goal {goal_id}",
             )
 
-        # Load latest result
-        result = self.test_storage.get_latest_result(test_id)
-
-        # Build debug info
-        debug_info = DebugInfo(
-            test_id=test_id,
-            test_name=test.test_name,
-            input=test.input,
-            expected=test.expected_output,
-        )
+        fields: dict[str, Any] = {
+            "test_id": test_id,
+            "test_name": test.test_name,
+            "input": test.input,
+            "expected": test.expected_output,
+        }
 
+        error_category = None
         if result:
-            debug_info.actual = result.actual_output
-            debug_info.passed = result.passed
-            debug_info.error_message = result.error_message
-            debug_info.stack_trace = result.stack_trace
-            debug_info.logs = result.runtime_logs
+            fields["actual"] = result.actual_output
+            fields["passed"] = result.passed
+            fields["error_message"] = result.error_message
+            fields["stack_trace"] = result.stack_trace
+            fields["logs"] = result.runtime_logs
 
-            # Set category
+            # Set category, categorizing if not already done
             if result.error_category:
-                debug_info.error_category = result.error_category.value
+                error_category = result.error_category
             elif not result.passed:
-                # Categorize if not already done
-                category = self.categorizer.categorize(result)
-                if category:
-                    debug_info.error_category = category.value
+                error_category = self.categorizer.categorize(result)
 
         # Get runtime data if available
-        if run_id and self.runtime_storage:
-            debug_info.runtime_data = self._get_runtime_data(run_id)
+        if runtime_data is not None:
+            fields["runtime_data"] = runtime_data
 
         # Generate fix suggestions
-        if debug_info.error_category:
-            category = ErrorCategory(debug_info.error_category)
-            debug_info.suggested_fix = self.categorizer.get_fix_suggestion(category)
-            debug_info.iteration_guidance = self.categorizer.get_iteration_guidance(category)
+        if error_category:
+            fields["error_category"] = error_category.value
+            fields["suggested_fix"] = self.categorizer.get_fix_suggestion(error_category)
+            fields["iteration_guidance"] = self.categorizer.get_iteration_guidance(error_category)
 
-        return debug_info
+        return DebugInfo.model_construct(**fields)
 
     def analyze_result(
         self,
@@ -161,83 +233,116 @@ def analyze_result(
         Returns:
             DebugInfo with debug data
         """
-        debug_info = DebugInfo(
-            test_id=test.id,
-            test_name=test.test_name,
-            input=test.input,
-            expected=test.expected_output,
-            actual=result.actual_output,
-            passed=result.passed,
-            error_message=result.error_message,
-            stack_trace=result.stack_trace,
-            logs=result.runtime_logs,
+        return self._build_debug_info(
+            test.goal_id, test.id, test, result, self._runtime_data(run_id)
         )
 
-        # Categorize
-        if result.error_category:
-            debug_info.error_category = result.error_category.value
-        elif not result.passed:
-            category = self.categorizer.categorize(result)
-            if category:
-                debug_info.error_category = category.value
-
-        # Runtime data
-        if run_id and self.runtime_storage:
-            debug_info.runtime_data = self._get_runtime_data(run_id)
-
-        # Fix suggestions
-        if debug_info.error_category:
-            category = ErrorCategory(debug_info.error_category)
-            debug_info.suggested_fix = self.categorizer.get_fix_suggestion(category)
-            debug_info.iteration_guidance = self.categorizer.get_iteration_guidance(category)
-
-        return debug_info
-
     def get_failure_summary(
         self,
         goal_id: str,
+        include_ids: bool = True,
+        sample_size: int = 10,
     ) -> dict[str, Any]:
         """
         Get summary of all failures for a goal.
 
+        Args:
+            goal_id: Goal whose failed tests are summarized
+            include_ids: List every failed test ID per category. Pass False
+                for large suites to get {"count": int, "sample_ids": [...]}
+                per category instead, with at most sample_size IDs each.
+            sample_size: IDs kept per category when include_ids is False
+
         Returns:
             Dict with failure counts by category and test IDs
         """
-        tests = self.test_storage.get_tests_by_goal(goal_id)
-
-        failures_by_category: dict[str, list[str]] = {
-            "logic_error": [],
-            "implementation_error": [],
-            "edge_case": [],
-            "uncategorized": [],
-        }
-
-        for test in tests:
-            if test.last_result == "failed":
-                result = self.test_storage.get_latest_result(test.id)
-                if result and result.error_category:
-                    failures_by_category[result.error_category.value].append(test.id)
-                else:
-                    failures_by_category["uncategorized"].append(test.id)
+        failed_ids = [test.id for test in self.test_storage.get_failed_tests_by_goal(goal_id)]
+        counts = dict.fromkeys(_FAILURE_BUCKETS, 0)
+        ids_by_category: dict[str, list[str]] = {key: [] for key in _FAILURE_BUCKETS}
+
+        results = self.test_storage.get_latest_results(failed_ids)
+        for test_id in failed_ids:
+            result = results[test_id]
+            if result and result.error_category:
+                key = result.error_category.value
+            else:
+                key = "uncategorized"
+            counts[key] += 1
+            if include_ids or len(ids_by_category[key]) < sample_size:
+                ids_by_category[key].append(test_id)
+
+        by_category: dict[str, Any] = ids_by_category
+        if not include_ids:
+            by_category = {
+                key: {"count": counts[key], "sample_ids": ids_by_category[key]}
+                for key in _FAILURE_BUCKETS
+            }
 
         return {
             "goal_id": goal_id,
-            "total_failures": sum(len(ids) for ids in failures_by_category.values()),
-            "by_category": failures_by_category,
-            "iteration_suggestions": self._get_iteration_suggestions(failures_by_category),
+            "total_failures": len(failed_ids),
+            "by_category": by_category,
+            "iteration_suggestions": self._get_iteration_suggestions(counts),
         }
 
+    def _load_cached_debug_info(self, test_id: str, fingerprint: str) -> DebugInfo | None:
+        """Cached analysis of a test, or None if absent, unreadable or made for other files."""
+        try:
+            entry = json_loads((self._debug_cache_dir / f"{test_id}.json").read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("fingerprint") != fingerprint:
+            return None
+        try:
+            return DebugInfo.model_validate(entry["info"])
+        except (KeyError, ValidationError):
+            # Damaged entry, or written before a DebugInfo field change
+            return None
+
+    def _cache_debug_info(self, test_id: str, fingerprint: str, debug_info: DebugInfo) -> None:
+        """Write an analysis to the disk cache, trimming the cache to DEBUG_CACHE_SIZE."""
+        entry = {"fingerprint": fingerprint, "info": debug_info.model_dump(mode="json")}
+        try:
+            self._debug_cache_dir.mkdir(exist_ok=True)
+            path = self._debug_cache_dir / f"{test_id}.json"
+            is_new = not path.exists()
+            path.write_bytes(json_dumps_bytes(entry))
+            if is_new:
+                entries = list(self._debug_cache_dir.iterdir())
+                if len(entries) > DEBUG_CACHE_SIZE:
+                    entries.sort(key=lambda p: p.stat().st_mtime_ns)
+                    for stale in entries[: len(entries) - DEBUG_CACHE_SIZE]:
+                        stale.unlink(missing_ok=True)
+        except OSError:
+            # The cache is an optimization; analysis results are still returned
+            pass
+
+    def _runtime_data(self, run_id: str | None) -> dict[str, Any] | None:
+        """Runtime data for run_id, or None without a run ID or Runtime storage."""
+        if run_id and self.runtime_storage:
+            return self._get_runtime_data(run_id)
+        return None
+
+    def clear_runtime_cache(self) -> None:
+        """Forget cached Runtime data, e.g. after a run has been updated."""
+        self._runtime_cache.clear()
+
     def _get_runtime_data(self, run_id: str) -> dict[str, Any]:
-        """Extract runtime data from Runtime storage."""
+        """Extract runtime data from Runtime storage, memoized per run ID."""
         if not self.runtime_storage:
             return {}
 
+        cached = self._runtime_cache.get(run_id)
+        if cached is not None:
+            self._runtime_cache.move_to_end(run_id)
+            return cached
+
         try:
             run = self.runtime_storage.load_run(run_id)
             if not run:
                 return {"error": f"Run {run_id} not found"}
 
-            return {
+            data = {
                 "execution_path": run.metrics.nodes_executed if hasattr(run, "metrics") else [],
                 "decisions": [
                     d.model_dump() if hasattr(d, "model_dump") else str(d)
@@ -252,35 +357,41 @@ def _get_runtime_data(self, run_id: str) -> dict[str, Any]:
         except Exception as e:
             return {"error": f"Failed to load runtime data: {e}"}
 
+        # Only successful loads are cached; a missing run may still be written
+        self._runtime_cache[run_id] = data
+        if len(self._runtime_cache) > RUNTIME_CACHE_SIZE:
+            self._runtime_cache.popitem(last=False)
+        return data
+
     def _get_iteration_suggestions(
         self,
-        failures_by_category: dict[str, list[str]],
+        failure_counts: dict[str, int],
     ) -> list[str]:
-        """Generate iteration suggestions based on failure categories."""
+        """Generate iteration suggestions based on failure counts per category."""
         suggestions = []
 
-        if failures_by_category["logic_error"]:
+        if failure_counts["logic_error"]:
             suggestions.append(
-                f"Found {len(failures_by_category['logic_error'])} logic errors. "
+                f"Found {failure_counts['logic_error']} logic errors. "
                 "Review and update Goal success_criteria/constraints, then restart "
                 "the full Goal → Agent → Eval flow."
             )
 
-        if failures_by_category["implementation_error"]:
+        if failure_counts["implementation_error"]:
             suggestions.append(
-                f"Found {len(failures_by_category['implementation_error'])} implementation errors. "
+                f"Found {failure_counts['implementation_error']} implementation errors. "
                 "Fix agent node/edge code and re-run Eval."
             )
 
-        if failures_by_category["edge_case"]:
+        if failure_counts["edge_case"]:
             suggestions.append(
-                f"Found {len(failures_by_category['edge_case'])} edge cases. "
+                f"Found {failure_counts['edge_case']} edge cases. "
                 "These are new scenarios - add tests for them."
             )
 
-        if failures_by_category["uncategorized"]:
+        if failure_counts["uncategorized"]:
             suggestions.append(
-                f"Found {len(failures_by_category['uncategorized'])} uncategorized failures. "
+                f"Found {failure_counts['uncategorized']} uncategorized failures. "
                 "Manual review required."
             )
 
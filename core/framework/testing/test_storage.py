@@ -5,13 +5,22 @@
 storing tests as JSON files with indexes for efficient querying.
 """
 
+import functools
 import json
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import TypeVar
 
 from framework.testing.test_case import ApprovalStatus, Test, TestType
 from framework.testing.test_result import TestResult
 
+# Upper bound on threads reading files for one batch load
+_READ_WORKERS = 8
+
+_M = TypeVar("_M", Test, TestResult)
+
 
 class TestStorage:
     """
@@ -27,6 +36,7 @@ class TestStorage:
         by_approval/{status}.json  # Tests by approval status
         by_type/{test_type}.json   # Tests by type
         by_criteria/{criteria_id}.json  # Tests by parent criteria
+        failed_by_goal/{goal_id}.json   # Tests of this goal whose last run failed
       results/
         {test_id}/
           {timestamp}.json         # Test run results
@@ -49,6 +59,7 @@ def _ensure_dirs(self) -> None:
             self.base_path / "indexes" / "by_approval",
             self.base_path / "indexes" / "by_type",
             self.base_path / "indexes" / "by_criteria",
+            self.base_path / "indexes" / "failed_by_goal",
             self.base_path / "results",
             self.base_path / "suites",
         ]
@@ -59,28 +70,21 @@ def _ensure_dirs(self) -> None:
 
     def save_test(self, test: Test) -> None:
         """Save a test to storage."""
-        # Ensure goal directory exists
-        goal_dir = self.base_path / "tests" / test.goal_id
-        goal_dir.mkdir(parents=True, exist_ok=True)
-
-        # Save full test
-        test_path = goal_dir / f"{test.id}.json"
-        with open(test_path, "w", encoding="utf-8") as f:
-            f.write(test.model_dump_json(indent=2))
+        self._write_test(test)
 
         # Update indexes
         self._add_to_index("by_goal", test.goal_id, test.id)
         self._add_to_index("by_approval", test.approval_status.value, test.id)
         self._add_to_index("by_type", test.test_type.value, test.id)
         self._add_to_index("by_criteria", test.parent_criteria_id, test.id)
+        self._update_failed_index(test)
 
     def load_test(self, goal_id: str, test_id: str) -> Test | None:
         """Load a test from storage."""
         test_path = self.base_path / "tests" / goal_id / f"{test_id}.json"
         if not test_path.exists():
             return None
-        with open(test_path, encoding="utf-8") as f:
-            return Test.model_validate_json(f.read())
+        return Test.model_validate_json(test_path.read_bytes())
 
     def delete_test(self, goal_id: str, test_id: str) -> bool:
         """Delete a test from storage."""
@@ -96,6 +100,7 @@ def delete_test(self, goal_id: str, test_id: str) -> bool:
             self._remove_from_index("by_approval", test.approval_status.value, test_id)
             self._remove_from_index("by_type", test.test_type.value, test_id)
             self._remove_from_index("by_criteria", test.parent_criteria_id, test_id)
+            self._remove_from_index("failed_by_goal", test.goal_id, test_id)
 
         test_path.unlink()
 
@@ -126,17 +131,105 @@ def update_test(self, test: Test) -> None:
         # Save
         self.save_test(test)
 
+    def save_tests(self, tests: Iterable[Test]) -> None:
+        """
+        Save several tests.
+
+        Same result as calling save_test() for each test in order, but
+        every index file touched by the batch is read and written once
+        instead of once per test.
+        """
+        self._save_tests_bulk(tests, update=False)
+
+    def update_tests_bulk(self, tests: list[Test]) -> None:
+        """
+        Update several existing tests.
+
+        Same result as calling update_test() for each test in order, but
+        every index file touched by the batch is read and written once
+        instead of once per test.
+        """
+        self._save_tests_bulk(tests, update=True)
+
+    def _save_tests_bulk(self, tests: Iterable[Test], update: bool) -> None:
+        """Write tests, batching their index changes into one write per index file."""
+        indexes: dict[tuple[str, str], list[str]] = {}
+        dirty: set[tuple[str, str]] = set()
+
+        def index(index_type: str, key: str) -> list[str]:
+            values = indexes.get((index_type, key))
+            if values is None:
+                if index_type == "failed_by_goal":
+                    values = self._get_failed_index(key)
+                else:
+                    values = self._get_index(index_type, key)
+                indexes[(index_type, key)] = values
+            return values
+
+        def add(index_type: str, key: str, value: str) -> None:
+            values = index(index_type, key)
+            if value not in values:
+                values.append(value)
+                dirty.add((index_type, key))
+
+        def remove(index_type: str, key: str, value: str) -> None:
+            values = index(index_type, key)
+            if value in values:
+                values.remove(value)
+                dirty.add((index_type, key))
+
+        for test in tests:
+            if update:
+                old_test = self.load_test(test.goal_id, test.id)
+                if old_test and old_test.approval_status != test.approval_status:
+                    remove("by_approval", old_test.approval_status.value, test.id)
+                    add("by_approval", test.approval_status.value, test.id)
+                test.updated_at = datetime.now()
+
+            self._write_test(test)
+
+            add("by_goal", test.goal_id, test.id)
+            add("by_approval", test.approval_status.value, test.id)
+            add("by_type", test.test_type.value, test.id)
+            add("by_criteria", test.parent_criteria_id, test.id)
+            if test.last_result == "failed":
+                add("failed_by_goal", test.goal_id, test.id)
+            else:
+                remove("failed_by_goal", test.goal_id, test.id)
+
+        for index_type, key in dirty:
+            self._write_index(index_type, key, indexes[(index_type, key)])
+
+    def _write_test(self, test: Test) -> None:
+        """Write the full test file."""
+        # Ensure goal directory exists
+        goal_dir = self.base_path / "tests" / test.goal_id
+        goal_dir.mkdir(parents=True, exist_ok=True)
+
+        test_path = goal_dir / f"{test.id}.json"
+        with open(test_path, "w", encoding="utf-8") as f:
+            f.write(test.model_dump_json(indent=2))
+
     # === QUERY OPERATIONS ===
 
+    def load_tests(self, goal_id: str, test_ids: Iterable[str]) -> dict[str, Test | None]:
+        """Load several tests of a goal in one batch; missing tests map to None."""
+        goal_dir = self.base_path / "tests" / goal_id
+        return _load_batch(Test, {test_id: goal_dir / f"{test_id}.json" for test_id in test_ids})
+
     def get_tests_by_goal(self, goal_id: str) -> list[Test]:
         """Get all tests for a goal."""
         test_ids = self._get_index("by_goal", goal_id)
-        tests = []
-        for test_id in test_ids:
-            test = self.load_test(goal_id, test_id)
-            if test:
-                tests.append(test)
-        return tests
+        return [test for test in self.load_tests(goal_id, test_ids).values() if test]
+
+    def get_failed_tests_by_goal(self, goal_id: str) -> list[Test]:
+        """Get the tests of a goal whose last run failed, without loading the others."""
+        test_ids = self._get_failed_index(goal_id)
+        return [
+            test
+            for test in self.load_tests(goal_id, test_ids).values()
+            if test and test.last_result == "failed"
+        ]
 
     def get_tests_by_approval_status(self, status: ApprovalStatus) -> list[str]:
         """Get test IDs by approval status."""
@@ -188,8 +281,31 @@ def get_latest_result(self, test_id: str) -> TestResult | None:
         latest_path = self.base_path / "results" / test_id / "latest.json"
         if not latest_path.exists():
             return None
-        with open(latest_path, encoding="utf-8") as f:
-            return TestResult.model_validate_json(f.read())
+        return TestResult.model_validate_json(latest_path.read_bytes())
+
+    def get_latest_results(self, test_ids: Iterable[str]) -> dict[str, TestResult | None]:
+        """Get the most recent result for several tests in one batch; None if never run."""
+        results_dir = self.base_path / "results"
+        return _load_batch(
+            TestResult, {test_id: results_dir / test_id / "latest.json" for test_id in test_ids}
+        )
+
+    def get_fingerprint(self, goal_id: str, test_id: str) -> str | None:
+        """
+        Cheap version stamp of a test and its latest result.
+
+        Built from file stats only, it changes whenever either file is
+        rewritten. None if the test has no stored result.
+        """
+        paths = (
+            self.base_path / "tests" / goal_id / f"{test_id}.json",
+            self.base_path / "results" / test_id / "latest.json",
+        )
+        try:
+            stats = [path.stat() for path in paths]
+        except FileNotFoundError:
+            return None
+        return "-".join(f"{st.st_mtime_ns}:{st.st_size}" for st in stats)
 
     def get_result_history(self, test_id: str, limit: int = 10) -> list[TestResult]:
         """Get result history for a test, most recent first."""
@@ -202,12 +318,7 @@ def get_result_history(self, test_id: str, limit: int = 10) -> list[TestResult]:
             [f for f in results_dir.glob("*.json") if f.name != "latest.json"], reverse=True
         )[:limit]
 
-        results = []
-        for f in result_files:
-            with open(f, encoding="utf-8") as file:
-                results.append(TestResult.model_validate_json(file.read()))
-
-        return results
+        return [TestResult.model_validate_json(f.read_bytes()) for f in result_files]
 
     # === INDEX OPERATIONS ===
 
@@ -219,23 +330,53 @@ def _get_index(self, index_type: str, key: str) -> list[str]:
         with open(index_path, encoding="utf-8") as f:
             return json.load(f)
 
+    def _write_index(self, index_type: str, key: str, values: list[str]) -> None:
+        """Replace the values of an index."""
+        index_path = self.base_path / "indexes" / index_type / f"{key}.json"
+        with open(index_path, "w", encoding="utf-8") as f:
+            json.dump(values, f)
+
     def _add_to_index(self, index_type: str, key: str, value: str) -> None:
         """Add a value to an index."""
-        index_path = self.base_path / "indexes" / index_type / f"{key}.json"
         values = self._get_index(index_type, key)
         if value not in values:
             values.append(value)
-            with open(index_path, "w", encoding="utf-8") as f:
-                json.dump(values, f)
+            self._write_index(index_type, key, values)
 
     def _remove_from_index(self, index_type: str, key: str, value: str) -> None:
         """Remove a value from an index."""
-        index_path = self.base_path / "indexes" / index_type / f"{key}.json"
         values = self._get_index(index_type, key)
         if value in values:
             values.remove(value)
-            with open(index_path, "w", encoding="utf-8") as f:
-                json.dump(values, f)
+            self._write_index(index_type, key, values)
+
+    def _get_failed_index(self, goal_id: str) -> list[str]:
+        """
+        Get the failed-tests index of a goal.
+
+        Stores written before the index existed have no index file; the
+        first call builds it from the goal's tests.
+        """
+        index_path = self.base_path / "indexes" / "failed_by_goal" / f"{goal_id}.json"
+        if index_path.exists():
+            with open(index_path, encoding="utf-8") as f:
+                return json.load(f)
+
+        tests = self.load_tests(goal_id, self._get_index("by_goal", goal_id)).values()
+        values = [test.id for test in tests if test and test.last_result == "failed"]
+        self._write_index("failed_by_goal", goal_id, values)
+        return values
+
+    def _update_failed_index(self, test: Test) -> None:
+        """Add or remove a saved test in its goal's failed-tests index."""
+        values = self._get_failed_index(test.goal_id)
+        failed = test.last_result == "failed"
+        if failed != (test.id in values):
+            if failed:
+                values.append(test.id)
+            else:
+                values.remove(test.id)
+            self._write_index("failed_by_goal", test.goal_id, values)
 
     # === UTILITY ===
 
@@ -259,3 +400,29 @@ def get_stats(self) -> dict:
             },
             "storage_path": str(self.base_path),
         }
+
+
+def _read_if_exists(path: Path) -> bytes | None:
+    """File contents, or None if the file does not exist."""
+    try:
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+@functools.cache
+def _read_pool() -> ThreadPoolExecutor:
+    """Process-wide pool for batch reads, so each batch does not start its own threads."""
+    return ThreadPoolExecutor(max_workers=_READ_WORKERS, thread_name_prefix="test-storage-read")
+
+
+def _load_batch(model: type[_M], paths: dict[str, Path]) -> dict[str, _M | None]:
+    """Read and validate one JSON file per key, reading the files concurrently."""
+    if len(paths) > 1:
+        contents = list(_read_pool().map(_read_if_exists, paths.values()))
+    else:
+        contents = [_read_if_exists(path) for path in paths.values()]
+    return {
+        key: model.model_validate_json(data) if data is not None else None
+        for key, data in zip(paths, contents, strict=True)
+    }
@@ -1,5 +1,17 @@
 """Utility functions for the Hive framework."""
 
-from framework.utils.io import atomic_write
+from framework.utils.io import (
+    atomic_write,
+    atomic_write_bytes,
+    json_dumps_bytes,
+    json_dumps_indented,
+    json_loads,
+)
 
-__all__ = ["atomic_write"]
+__all__ = [
+    "atomic_write",
+    "atomic_write_bytes",
+    "json_dumps_bytes",
+    "json_dumps_indented",
+    "json_loads",
+]
@@ -1,6 +1,14 @@
+import json
 import os
+from collections.abc import Callable
 from contextlib import contextmanager
 from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is always available
+    orjson = None
 
 
 @contextmanager
@@ -15,3 +23,78 @@ def atomic_write(path: Path, mode: str = "w", encoding: str = "utf-8"):
     except BaseException:
         tmp_path.unlink(missing_ok=True)
         raise
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> int:
+    """Atomically write an already-encoded payload, returning its size in bytes.
+
+    Skips the buffered/text I/O layers: the payload goes straight to the
+    temp file descriptor, so callers that already hold the full content
+    get one write syscall and don't need a ``stat`` afterwards.
+    """
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return len(data)
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON, using orjson when it is installed.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+    the stdlib exception either way. Documents orjson rejects but the stdlib
+    accepts (NaN/Infinity literals, integers wider than 64 bits) fall back to
+    json.loads.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def json_dumps_bytes(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, using orjson when it is installed.
+
+    Meant for request bodies, which go on the wire as bytes anyway. Values
+    orjson cannot serialize fall back to the stdlib encoder.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:  # orjson.JSONEncodeError
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def json_dumps_indented(obj: Any, default: Callable[[Any], Any] | None = None) -> str:
+    """Serialize to 2-space-indented JSON for display, using orjson when it is installed.
+
+    Unlike ``json.dumps(obj, indent=2)`` non-ASCII text is kept as-is rather
+    than \\u-escaped. ``default`` converts values the stdlib cannot
+    serialize, as in ``json.dumps``; datetimes and dataclasses are passed
+    to it too, rather than using orjson's native encoding, so the output
+    matches the stdlib's. Values orjson cannot serialize (non-string keys,
+    integers wider than 64 bits) fall back to the stdlib encoder.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2
+        if default is not None:
+            option |= orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        try:
+            return orjson.dumps(obj, default=default, option=option).decode()
+        except TypeError:  # orjson.JSONEncodeError
+            pass
+    return json.dumps(obj, indent=2, default=default, ensure_ascii=False)
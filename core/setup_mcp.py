@@ -71,27 +71,19 @@ def main():
     script_dir = Path(__file__).parent.absolute()
     os.chdir(script_dir)
 
-    # Step 1: Install framework package
-    log_step("Step 1: Installing framework package...")
+    # Step 1: Install framework package and MCP dependencies in one pip run,
+    # so pip starts once and resolves them together
+    log_step("Step 1: Installing framework package and MCP dependencies...")
     if not run_command(
-        [sys.executable, "-m", "pip", "install", "-e", "."], "Failed to install framework package"
+        [sys.executable, "-m", "pip", "install", "-e", ".", "mcp", "fastmcp"],
+        "Failed to install framework package and MCP dependencies",
     ):
         sys.exit(1)
-    log_success("Framework package installed")
+    log_success("Framework package and MCP dependencies installed")
     logger.info("")
 
-    # Step 2: Install MCP dependencies
-    log_step("Step 2: Installing MCP dependencies...")
-    if not run_command(
-        [sys.executable, "-m", "pip", "install", "mcp", "fastmcp"],
-        "Failed to install MCP dependencies",
-    ):
-        sys.exit(1)
-    log_success("MCP dependencies installed")
-    logger.info("")
-
-    # Step 3: Verify/create MCP configuration
-    log_step("Step 3: Verifying MCP server configuration...")
+    # Step 2: Verify/create MCP configuration
+    log_step("Step 2: Verifying MCP server configuration...")
     mcp_config_path = script_dir / ".mcp.json"
 
     if mcp_config_path.exists():
@@ -120,8 +112,8 @@ def main():
         log_success("Created .mcp.json")
     logger.info("")
 
-    # Step 4: Test MCP server
-    log_step("Step 4: Testing MCP server...")
+    # Step 3: Test MCP server
+    log_step("Step 3: Testing MCP server...")
     try:
         # Try importing the MCP server module
         subprocess.run(
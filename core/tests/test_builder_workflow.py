@@ -0,0 +1,85 @@
+"""Tests for running a GraphBuilder session's test cases."""
+
+import asyncio
+from types import SimpleNamespace
+
+from framework.builder import workflow
+from framework.builder.workflow import BuildPhase, GraphBuilder
+
+
+def _builder(tmp_path, test_ids: list[str]) -> GraphBuilder:
+    """Build a session in the testing phase holding the given test cases."""
+    builder = GraphBuilder("agent", storage_path=tmp_path)
+    builder.session.phase = BuildPhase.TESTING
+    builder.session.test_cases = [
+        workflow.TestCase(id=i, description=i, input={"id": i}) for i in test_ids
+    ]
+    return builder
+
+
+class _RecordingExecutor:
+    """Executor stub that records the order tests start in."""
+
+    def __init__(self, started: list[str]):
+        self.started = started
+
+    async def execute(self, graph, goal, input_data):
+        self.started.append(input_data["id"])
+        return SimpleNamespace(success=True, output={}, path=[])
+
+
+def test_longest_first_only_with_concurrency(tmp_path):
+    """Previous durations reorder test starts only when tests run concurrently."""
+    builder = _builder(tmp_path, ["fast", "slow", "medium"])
+    previous = [
+        workflow.TestResult(test_id="fast", passed=True, duration_ms=10),
+        workflow.TestResult(test_id="slow", passed=True, duration_ms=300),
+        workflow.TestResult(test_id="medium", passed=True, duration_ms=100),
+    ]
+    builder.session.test_results = list(previous)
+
+    started: list[str] = []
+    results = builder.run_all_tests(lambda: _RecordingExecutor(started))
+    assert started == ["fast", "slow", "medium"]
+    assert [r.test_id for r in builder.session.test_results[3:]] == ["fast", "slow", "medium"]
+    assert [r.test_id for r in results] == ["fast", "slow", "medium"]
+
+    started.clear()
+    builder.session.test_results = list(previous)
+    results = builder.run_all_tests(lambda: _RecordingExecutor(started), concurrency=2)
+    assert started == ["slow", "medium", "fast"]
+    assert [r.test_id for r in results] == ["fast", "slow", "medium"]
+
+
+class _OverlapExecutor:
+    """Executor stub that tracks how many executions overlap."""
+
+    def __init__(self, state: dict[str, int]):
+        self.state = state
+
+    async def execute(self, graph, goal, input_data):
+        if input_data["id"] == "broken":
+            raise RuntimeError("executor crashed")
+        self.state["active"] += 1
+        self.state["peak"] = max(self.state["peak"], self.state["active"])
+        await asyncio.sleep(0.02 * len(input_data["id"]))
+        self.state["active"] -= 1
+        return SimpleNamespace(success=True, output={"result": input_data["id"]}, path=["n"])
+
+
+def test_run_all_tests_bounds_concurrency(tmp_path):
+    """At most concurrency tests run at once; results keep session order."""
+    test_ids = ["a", "bbbbb", "cc", "dddd", "broken", "e"]
+    builder = _builder(tmp_path, test_ids)
+    state = {"active": 0, "peak": 0}
+
+    results = builder.run_all_tests(lambda: _OverlapExecutor(state), concurrency=2)
+
+    assert state["peak"] == 2
+    assert [r.test_id for r in results] == test_ids
+    assert all(r.duration_ms >= 10 for r in results if r.test_id != "broken")
+
+    broken = results[test_ids.index("broken")]
+    assert broken.passed is False
+    assert broken.error == "executor crashed"
+    assert all(r.passed for r in results if r.test_id != "broken")
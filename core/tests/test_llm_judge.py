@@ -177,6 +177,23 @@ def test_parse_json_in_plain_code_block(self):
         assert result["passes"] is True
         assert result["explanation"] == "Passed"
 
+    def test_parse_json_surrounded_by_chatter(self):
+        """Test parsing a JSON object with text (and braces) around it."""
+        provider = MockLLMProvider(
+            response_content=(
+                'Verdict:\n```json\n{"passes": true, "explanation": "Valid json {ok}"}\n```\n'
+                "Let me know if {anything} else is needed."
+            )
+        )
+        judge = LLMJudge(llm_provider=provider)
+
+        result = judge.evaluate(
+            constraint="test", source_document="doc", summary="sum", criteria="crit"
+        )
+
+        assert result["passes"] is True
+        assert result["explanation"] == "Valid json {ok}"
+
     def test_parse_response_with_whitespace(self):
         """Test parsing response with extra whitespace."""
         provider = MockLLMProvider(
@@ -307,6 +324,19 @@ def test_anthropic_client_lazy_loaded(self):
             # Client should not be loaded yet
             assert judge._client is None
 
+    def test_anthropic_client_shared_across_judges(self, monkeypatch):
+        """Test that judges reuse one fallback Anthropic client."""
+        import framework.testing.llm_judge as llm_judge
+
+        monkeypatch.setattr(llm_judge, "_anthropic_client", None)
+        anthropic = MagicMock()
+        with patch.dict("sys.modules", {"anthropic": anthropic}):
+            first = LLMJudge()._get_client()
+            second = LLMJudge()._get_client()
+
+        assert first is second
+        anthropic.Anthropic.assert_called_once()
+
     def test_anthropic_import_error_handling(self):
         """Test handling when anthropic package is not installed."""
         judge = LLMJudge()
@@ -399,6 +429,169 @@ def test_provider_reuse_across_judges(self):
         # Both judges should use the same provider
         assert len(shared_provider.complete_calls) == 2
 
+    @pytest.mark.asyncio
+    async def test_batch_evaluate_returns_results_in_order(self):
+        """Test pattern: evaluating a suite's summaries concurrently."""
+
+        class EchoProvider(MockLLMProvider):
+            def complete(self, messages, **kwargs):
+                super().complete(messages, **kwargs)
+                constraint = messages[0]["content"].split("CONSTRAINT: ")[1].split("\n")[0]
+                return LLMResponse(
+                    content=f'{{"passes": true, "explanation": "{constraint}"}}',
+                    model="mock-model",
+                )
+
+        provider = EchoProvider()
+        judge = LLMJudge(llm_provider=provider)
+        items = [
+            {"constraint": f"c{i}", "source_document": "d", "summary": "s", "criteria": "cr"}
+            for i in range(5)
+        ]
+
+        results = await judge.batch_evaluate(items, concurrency=2)
+
+        assert [r["explanation"] for r in results] == ["c0", "c1", "c2", "c3", "c4"]
+        assert len(provider.complete_calls) == 5
+
+    @pytest.mark.asyncio
+    async def test_batch_evaluate_paces_calls_to_target_rpm(self):
+        """Test pattern: keeping a suite under a provider's requests-per-minute limit."""
+        import time
+
+        provider = MockLLMProvider()
+        judge = LLMJudge(llm_provider=provider)
+        items = [{"constraint": "c", "source_document": "d", "summary": "s", "criteria": "cr"}] * 4
+
+        start = time.monotonic()
+        results = await judge.batch_evaluate(items, target_rpm=60 * 20)
+
+        assert time.monotonic() - start >= 0.15  # three 50ms gaps between four starts
+        assert all(r["passes"] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_batch_evaluate_via_message_batches(self, monkeypatch):
+        """Test pattern: submitting a suite's evaluations as one Message Batch."""
+        from types import SimpleNamespace
+
+        from framework.testing import llm_judge
+
+        monkeypatch.setattr(llm_judge, "BATCH_POLL_SECONDS", 0)
+        monkeypatch.setattr(llm_judge, "BATCH_MIN_SIZE", 3)
+
+        def entry(custom_id, text=None):
+            message = SimpleNamespace(content=[SimpleNamespace(text=text)])
+            result = SimpleNamespace(type="succeeded" if text else "errored", message=message)
+            return SimpleNamespace(custom_id=custom_id, result=result)
+
+        client = MagicMock()
+        client.messages.batches.create.return_value = SimpleNamespace(
+            id="b1", processing_status="in_progress"
+        )
+        client.messages.batches.retrieve.return_value = SimpleNamespace(
+            id="b1", processing_status="ended"
+        )
+        client.messages.batches.results.return_value = [
+            entry("1", '{"passes": false, "explanation": "second"}'),
+            entry("0", '{"passes": true, "explanation": "first"}'),
+            entry("2"),
+        ]
+        judge = LLMJudge()
+        judge._get_client = MagicMock(return_value=client)
+        items = [
+            {"constraint": f"c{i}", "source_document": "d", "summary": "s", "criteria": "cr"}
+            for i in range(3)
+        ]
+
+        results = await judge.batch_evaluate(items, use_batch_api=True)
+        assert await judge.batch_evaluate(items, latency_budget_ms=10**9) == results
+
+        assert [r["explanation"] for r in results[:2]] == ["first", "second"]
+        assert results[0]["passes"] is True
+        assert "LLM judge error" in results[2]["explanation"]
+        requests = client.messages.batches.create.call_args.kwargs["requests"]
+        assert [r["custom_id"] for r in requests] == ["0", "1", "2"]
+        client.messages.create.assert_not_called()
+
+        monkeypatch.setattr(llm_judge, "BATCH_MIN_SIZE", 4)
+        judge._get_client = MagicMock(return_value=MagicMock())
+        too_few = await judge.batch_evaluate(items, latency_budget_ms=10**9)
+        assert judge._get_client.return_value.messages.batches.create.call_count == 0
+        assert len(too_few) == 3
+
+    @pytest.mark.asyncio
+    async def test_message_batch_uses_anthropic_fallback_model(self, monkeypatch):
+        """With ANTHROPIC_API_KEY set, batches use the fallback provider's model."""
+        from types import SimpleNamespace
+
+        from framework.llm import anthropic as anthropic_provider
+        from framework.testing import llm_judge
+
+        monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+        monkeypatch.setattr(anthropic_provider, "_get_api_key_from_credential_store", lambda: "k")
+        client = MagicMock()
+        client.messages.batches.create.return_value = SimpleNamespace(
+            id="b1", processing_status="ended"
+        )
+        client.messages.batches.results.return_value = []
+        monkeypatch.setattr(llm_judge, "_get_shared_anthropic_client", lambda: client)
+        judge = LLMJudge()
+        items = [{"constraint": "c", "source_document": "d", "summary": "s", "criteria": "cr"}]
+
+        await judge.batch_evaluate(items, use_batch_api=True)
+
+        requests = client.messages.batches.create.call_args.kwargs["requests"]
+        provider = judge._get_fallback_provider()
+        assert isinstance(provider, anthropic_provider.AnthropicProvider)
+        assert requests[0]["params"]["model"] == provider.model
+
+    @pytest.mark.asyncio
+    async def test_latency_budget_keeps_non_anthropic_fallback(self, monkeypatch):
+        """A long latency budget does not move a non-Anthropic judge onto Message Batches."""
+        from framework.testing import llm_judge
+
+        monkeypatch.setattr(llm_judge, "BATCH_MIN_SIZE", 2)
+        client = MagicMock()
+        monkeypatch.setattr(llm_judge, "_get_shared_anthropic_client", lambda: client)
+        provider = MockLLMProvider()
+        judge = LLMJudge()
+        items = [{"constraint": "c", "source_document": "d", "summary": "s", "criteria": "cr"}] * 2
+
+        with patch.object(judge, "_create_fallback_provider", return_value=provider):
+            results = await judge.batch_evaluate(items, latency_budget_ms=10**9)
+
+        assert all(r["passes"] for r in results)
+        assert len(provider.complete_calls) == 2
+        client.messages.batches.create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_batch_evaluate_reports_provider_construction_error(self):
+        """A fallback provider that fails to build yields an error verdict per item."""
+        judge = LLMJudge()
+        items = [{"constraint": "c", "source_document": "d", "summary": "s", "criteria": "cr"}] * 2
+
+        with patch.object(
+            judge, "_create_fallback_provider", side_effect=ModuleNotFoundError("no provider")
+        ):
+            results = await judge.batch_evaluate(items)
+            single = judge.evaluate(**items[0])
+
+        assert results == [single, single]
+        assert single == {"passes": False, "explanation": "LLM judge error: no provider"}
+
+    def test_fallback_provider_created_once(self):
+        """Test that the environment-selected provider is built once per judge."""
+        provider = MockLLMProvider()
+        judge = LLMJudge()
+
+        with patch.object(judge, "_create_fallback_provider", return_value=provider) as create:
+            for i in range(3):
+                judge.evaluate(constraint=f"c{i}", source_document="d", summary="s", criteria="cr")
+
+        create.assert_called_once()
+        assert len(provider.complete_calls) == 3
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,446 @@
+"""Tests for MCPClient tool discovery and client caching.
+
+These tests use the HTTP transport, or a STDIO client whose session start-up
+is stubbed, with the network calls patched out, so no MCP server is required.
+"""
+
+import pytest
+
+from framework.runner import mcp_client
+from framework.runner.mcp_client import MCPClient, MCPServerConfig
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches(tmp_path, monkeypatch):
+    monkeypatch.setattr(mcp_client, "MCP_TOOLS_CACHE_DIR", tmp_path / "mcp_tools")
+    mcp_client.invalidate_tools_cache()
+    yield
+    mcp_client.invalidate_tools_cache()
+    mcp_client.close_cached_clients()
+
+
+def _http_client(monkeypatch, calls: list[str], name: str = "tools") -> MCPClient:
+    """Build an HTTP client whose health check and tools/list are stubbed."""
+    client = MCPClient(MCPServerConfig(name=name, transport="http", url="http://mcp.test"))
+
+    def list_tools_http():
+        calls.append(name)
+        return [{"name": "search", "description": "Search", "inputSchema": {}}]
+
+    monkeypatch.setattr(client, "_connect_http", lambda: None)
+    monkeypatch.setattr(client, "_list_tools_http", list_tools_http)
+    return client
+
+
+def test_reconnect_reuses_cached_tool_list(monkeypatch):
+    """A second client for the same server skips tools/list while the cache is fresh."""
+    calls: list[str] = []
+
+    first = _http_client(monkeypatch, calls)
+    first.connect()
+    second = _http_client(monkeypatch, calls)
+    second.connect()
+
+    assert calls == ["tools"]
+    assert [t.name for t in second.list_tools()] == ["search"]
+
+
+def test_force_refresh_and_invalidate_rediscover(monkeypatch):
+    """force_refresh and invalidate_tools_cache both trigger a new tools/list call."""
+    calls: list[str] = []
+
+    _http_client(monkeypatch, calls).connect()
+    _http_client(monkeypatch, calls).connect(force_refresh=True)
+    assert calls == ["tools", "tools"]
+
+    mcp_client.invalidate_tools_cache("tools")
+    _http_client(monkeypatch, calls).connect()
+    assert calls == ["tools", "tools", "tools"]
+
+
+def test_expired_entry_is_rediscovered(monkeypatch):
+    """Entries older than the in-memory and on-disk TTLs are not reused."""
+    calls: list[str] = []
+
+    _http_client(monkeypatch, calls).connect()
+    monkeypatch.setattr(mcp_client, "TOOLS_CACHE_TTL_SECONDS", 0.0)
+    monkeypatch.setattr(mcp_client, "DISK_TOOLS_CACHE_TTL_SECONDS", 0.0)
+    _http_client(monkeypatch, calls).connect()
+
+    assert calls == ["tools", "tools"]
+
+
+def _stdio_client(
+    monkeypatch, calls: list[str], version: str = "tools 1.0", tools: list[str] = ("search",)
+) -> MCPClient:
+    """Build a STDIO client whose session start-up and tools/list are stubbed."""
+    client = MCPClient(MCPServerConfig(name="tools", transport="stdio", command="tools"))
+
+    def connect_stdio(prefetch_tools=False):
+        client._server_version = version
+
+    async def collect_tools_stdio_async():
+        calls.append("tools")
+        return [{"name": name} for name in tools]
+
+    monkeypatch.setattr(client, "_connect_stdio", connect_stdio)
+    monkeypatch.setattr(client, "_collect_tools_stdio_async", collect_tools_stdio_async)
+    return client
+
+
+def test_tool_list_is_persisted_across_processes(monkeypatch):
+    """A fresh process (empty in-memory cache) reads the tool list from disk."""
+    calls: list[str] = []
+
+    _stdio_client(monkeypatch, calls).connect()
+    mcp_client._TOOLS_CACHE.clear()
+    client = _stdio_client(monkeypatch, calls)
+    client.connect()
+
+    assert calls == ["tools"]
+    assert [t.name for t in client.list_tools()] == ["search"]
+
+    mcp_client.invalidate_tools_cache("tools")
+    _stdio_client(monkeypatch, calls).connect()
+    assert calls == ["tools", "tools"]
+
+
+def test_persisted_tool_list_is_tied_to_server_version(monkeypatch):
+    """An upgraded server (new initialize() serverInfo) is asked for its tools again."""
+    calls: list[str] = []
+
+    _stdio_client(monkeypatch, calls).connect()
+    mcp_client._TOOLS_CACHE.clear()
+    client = _stdio_client(monkeypatch, calls, version="tools 2.0", tools=["search", "fetch"])
+    client.connect()
+
+    assert calls == ["tools", "tools"]
+    assert [t.name for t in client.list_tools()] == ["search", "fetch"]
+
+
+def test_http_tool_list_is_not_persisted(monkeypatch):
+    """Without an initialize() handshake there is no server version to key a disk entry on."""
+    calls: list[str] = []
+
+    _http_client(monkeypatch, calls).connect()
+    mcp_client._TOOLS_CACHE.clear()
+    _http_client(monkeypatch, calls).connect()
+
+    assert calls == ["tools", "tools"]
+
+
+def test_unknown_tool_rediscovers_once(monkeypatch):
+    """A tool missing from a cached list is looked up again before being rejected."""
+    calls: list[str] = []
+    _http_client(monkeypatch, calls).connect()
+
+    client = _http_client(monkeypatch, calls)
+    client.connect()
+    monkeypatch.setattr(
+        client, "_list_tools_http", lambda: calls.append("tools") or [{"name": "fetch"}]
+    )
+    monkeypatch.setattr(client, "_call_tool_http", lambda tool_name, arguments: tool_name)
+
+    assert client.call_tool("fetch", {}) == "fetch"
+    assert calls == ["tools", "tools"]
+
+    with pytest.raises(ValueError, match="Unknown tool: missing"):
+        client.call_tool("missing", {})
+    assert calls == ["tools", "tools", "tools"]
+
+
+def test_get_mcp_client_reuses_connected_client(monkeypatch):
+    """get_mcp_client returns the same warm client for an identical config."""
+    connects: list[str] = []
+    monkeypatch.setattr(MCPClient, "_connect_http", lambda self: connects.append(self.config.url))
+    monkeypatch.setattr(MCPClient, "_list_tools_http", lambda self: [])
+    before = mcp_client.get_cache_stats()
+
+    config = MCPServerConfig(name="tools", transport="http", url="http://mcp.test")
+    first = mcp_client.get_mcp_client(config)
+    second = mcp_client.get_mcp_client(
+        MCPServerConfig(name="tools", transport="http", url="http://mcp.test")
+    )
+    other = mcp_client.get_mcp_client(
+        MCPServerConfig(name="tools", transport="http", url="http://other.test")
+    )
+
+    assert first is second
+    assert other is not first
+    assert connects == ["http://mcp.test", "http://other.test"]
+    stats = mcp_client.get_cache_stats()
+    assert stats["hits"] - before["hits"] == 1
+    assert stats["misses"] - before["misses"] == 2
+    assert stats["size"] == 2
+
+
+def test_get_mcp_client_connects_outside_the_cache_lock(monkeypatch):
+    """A slow server start-up blocks only callers waiting for that same server."""
+    import threading
+
+    release = threading.Event()
+    connects: list[str] = []
+
+    def connect_http(self):
+        connects.append(self.config.url)
+        if self.config.url == "http://slow.test":
+            assert release.wait(5)
+
+    monkeypatch.setattr(MCPClient, "_connect_http", connect_http)
+    monkeypatch.setattr(MCPClient, "_list_tools_http", lambda self: [])
+    slow = MCPServerConfig(name="slow", transport="http", url="http://slow.test")
+    results: list[MCPClient] = []
+    threads = [
+        threading.Thread(target=lambda: results.append(mcp_client.get_mcp_client(slow)))
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+
+    fast = MCPServerConfig(name="fast", transport="http", url="http://fast.test")
+    assert mcp_client.get_mcp_client(fast)._connected
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(results) == 2 and results[0] is results[1]
+    assert connects.count("http://slow.test") == 1
+
+
+def test_close_cached_clients_by_name(monkeypatch):
+    """Closing one server's clients leaves the others cached."""
+    monkeypatch.setattr(MCPClient, "_connect_http", lambda self: None)
+    monkeypatch.setattr(MCPClient, "_list_tools_http", lambda self: [])
+    tools = mcp_client.get_mcp_client(
+        MCPServerConfig(name="tools", transport="http", url="http://mcp.test")
+    )
+    other = mcp_client.get_mcp_client(
+        MCPServerConfig(name="other", transport="http", url="http://other.test")
+    )
+
+    mcp_client.close_cached_clients("tools")
+
+    assert not tools._connected
+    assert other._connected
+    assert mcp_client.get_cache_stats()["size"] == 1
+
+
+def _stdio_client_on_current_loop(monkeypatch) -> MCPClient:
+    """Build a 'connected' STDIO client whose persistent loop is the running loop."""
+    import asyncio
+
+    client = MCPClient(MCPServerConfig(name="tools", transport="stdio", command="tools"))
+    client._loop = asyncio.get_running_loop()
+    client._connected = True
+    client._tools = mcp_client._ToolTable([{"name": "search"}])
+
+    async def call_tool_stdio_async(tool_name, arguments):
+        return f"{tool_name}:{arguments['q']}"
+
+    monkeypatch.setattr(client, "_call_tool_stdio_async", call_tool_stdio_async)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_acall_tool_awaits_directly_on_own_loop(monkeypatch):
+    """acall_tool on the STDIO loop awaits the session call without a thread hop."""
+    client = _stdio_client_on_current_loop(monkeypatch)
+
+    assert await client.acall_tool("search", {"q": "x"}) == "search:x"
+
+    with pytest.raises(RuntimeError, match="acall_tool"):
+        client.call_tool("search", {"q": "x"})
+
+
+@pytest.mark.asyncio
+async def test_async_methods_connect_off_the_event_loop(monkeypatch):
+    """alist_tools and acall_tool run the blocking connect() in a worker thread."""
+    import threading
+
+    connect_threads: list[threading.Thread] = []
+
+    def connect(self, force_refresh=False):
+        connect_threads.append(threading.current_thread())
+        self._tools = mcp_client._ToolTable([{"name": "search"}])
+        self._connected = True
+
+    monkeypatch.setattr(MCPClient, "connect", connect)
+    monkeypatch.setattr(MCPClient, "_call_tool_http", lambda self, tool_name, arguments: "ok")
+    config = MCPServerConfig(name="tools", transport="http", url="http://mcp.test")
+
+    assert [t.name for t in await MCPClient(config).alist_tools()] == ["search"]
+    assert await MCPClient(config).acall_tool("search", {}) == "ok"
+    assert len(connect_threads) == 2
+    assert threading.main_thread() not in connect_threads
+
+
+def _mock_http_client(handler) -> MCPClient:
+    """Build a 'connected' HTTP client whose requests are answered by handler."""
+    import httpx
+
+    client = MCPClient(MCPServerConfig(name="tools", transport="http", url="http://mcp.test"))
+    client._http_client = httpx.Client(
+        base_url="http://mcp.test", transport=httpx.MockTransport(handler)
+    )
+    client._connected = True
+    client._tools = mcp_client._ToolTable([{"name": "search"}, {"name": "fetch"}])
+    return client
+
+
+def test_call_tools_batch_sends_one_request():
+    """HTTP calls are sent as one JSON-RPC array and returned in input order."""
+    import json
+
+    import httpx
+
+    requests = []
+
+    def handler(request):
+        payload = json.loads(request.content)
+        requests.append(payload)
+        return httpx.Response(
+            200,
+            json=[
+                {"jsonrpc": "2.0", "id": item["id"], "result": {"content": item["params"]["name"]}}
+                for item in reversed(payload)
+            ],
+        )
+
+    client = _mock_http_client(handler)
+
+    assert client.call_tools_batch([("search", {}), ("fetch", {})]) == ["search", "fetch"]
+    assert len(requests) == 1
+
+
+def test_call_tools_batch_falls_back_when_batch_unsupported():
+    """A server that refuses arrays gets one request per call instead."""
+    import json
+
+    import httpx
+
+    requests = []
+
+    def handler(request):
+        payload = json.loads(request.content)
+        requests.append(payload)
+        if isinstance(payload, list):
+            return httpx.Response(
+                200, json={"jsonrpc": "2.0", "id": None, "error": {"code": -32600}}
+            )
+        return httpx.Response(200, json={"result": {"content": payload["params"]["name"]}})
+
+    client = _mock_http_client(handler)
+
+    assert client.call_tools_batch([("search", {}), ("fetch", {})]) == ["search", "fetch"]
+    assert len(requests) == 3
+
+
+def test_stdio_pool_reuses_and_evicts(monkeypatch):
+    """Parked connections are handed out newest first; extras and dead ones are closed."""
+    from types import SimpleNamespace
+
+    from framework.runner import mcp_stdio_pool
+
+    monkeypatch.setattr(mcp_stdio_pool, "MAX_IDLE_PER_SERVER", 2)
+    closed = []
+
+    def conn(name, alive=True):
+        return SimpleNamespace(server_name=name, released_at=0.0, is_alive=lambda: alive)
+
+    try:
+        for name in ("a", "b", "c"):
+            mcp_stdio_pool.release("key", conn(name), lambda c: closed.append(c.server_name))
+        assert closed == ["a"]
+
+        assert mcp_stdio_pool.acquire("key").server_name == "c"
+        mcp_stdio_pool.release("key", conn("dead", alive=False), lambda c: closed.append("dead"))
+        assert mcp_stdio_pool.acquire("key").server_name == "b"
+        assert closed == ["a", "dead"]
+        assert mcp_stdio_pool.acquire("key") is None
+    finally:
+        mcp_stdio_pool.close_idle()
+
+
+@pytest.mark.asyncio
+async def test_run_async_from_event_loop_reuses_background_loop():
+    """Sync calls made inside a running loop share one background loop thread."""
+    import threading
+
+    client = MCPClient(MCPServerConfig(name="tools", transport="http", url="http://mcp.test"))
+
+    async def current_thread():
+        return threading.get_ident()
+
+    first = client._run_async(current_thread())
+    second = client._run_async(current_thread())
+
+    assert first == second != threading.get_ident()
+
+
+def test_call_tool_http_sends_valid_envelope():
+    """The pre-encoded tools/call envelope is valid JSON with a fresh id per call."""
+    import json
+
+    import httpx
+
+    requests = []
+
+    def handler(request):
+        payload = json.loads(request.content)
+        requests.append(payload)
+        return httpx.Response(200, json={"result": {"content": payload["params"]["arguments"]}})
+
+    client = _mock_http_client(handler)
+
+    assert client.call_tool("search", {"q": 'ü "x"'}) == {"q": 'ü "x"'}
+    client.call_tool("fetch", {})
+
+    assert requests[0]["jsonrpc"] == "2.0"
+    assert requests[0]["method"] == "tools/call"
+    assert requests[0]["params"]["name"] == "search"
+    assert requests[0]["id"] != requests[1]["id"]
+
+
+def test_http_clients_share_one_pool_per_endpoint(monkeypatch):
+    """Clients for the same URL and headers share one httpx client until idle."""
+    monkeypatch.setattr(MCPClient, "_list_tools_http", lambda self: [])
+    monkeypatch.setattr(mcp_client, "HTTP_POOL_IDLE_SECONDS", 0.0)
+    try:
+        first = MCPClient(MCPServerConfig(name="a", transport="http", url="http://127.0.0.1:9"))
+        second = MCPClient(MCPServerConfig(name="b", transport="http", url="http://127.0.0.1:9"))
+        first.connect()
+        second.connect()
+        shared = first._http_client
+        assert second._http_client is shared
+
+        first.disconnect()
+        assert not shared.is_closed
+        second.disconnect()
+        assert shared.is_closed
+        assert mcp_client._HTTP_POOLS == {}
+    finally:
+        mcp_client.close_http_pools()
+
+
+def test_resolved_prefetch_skips_event_loop(monkeypatch):
+    """A tools/list prefetch that already finished is read without _run_async."""
+    import asyncio
+
+    client = MCPClient(MCPServerConfig(name="tools", transport="stdio", command="tools"))
+    loop = asyncio.new_event_loop()
+    try:
+        future = loop.create_future()
+        future.set_result([{"name": "search"}])
+        client._tools_future = future
+
+        def run_async(coro):
+            coro.close()
+            raise AssertionError("prefetched tools went through the event loop")
+
+        monkeypatch.setattr(client, "_run_async", run_async)
+        client._discover_tools()
+    finally:
+        loop.close()
+
+    assert client._tools.names == ["search"]
+    assert client._tools_future is None
@@ -99,3 +99,185 @@ def test_agent_builder_server_exported(self):
 
         assert agent_builder_server is not None
         assert isinstance(agent_builder_server.mcp, FastMCP)
+
+
+class TestValidateGraph:
+    """Tests for agent_builder_server.validate_graph context-flow analysis."""
+
+    @pytest.fixture
+    def server(self, monkeypatch):
+        if not MCP_AVAILABLE:
+            pytest.skip(MCP_SKIP_REASON)
+
+        import framework.mcp.agent_builder_server as server
+        from framework.graph import Goal
+
+        session = server.BuildSession("test-agent")
+        session.goal = Goal(id="goal", name="Goal", description="Test goal")
+        monkeypatch.setattr(server, "_session", session)
+        return server
+
+    @staticmethod
+    def _node(node_id, input_keys=(), output_keys=()):
+        from framework.graph import NodeSpec
+
+        return NodeSpec(
+            id=node_id,
+            name=node_id,
+            description=node_id,
+            node_type="event_loop",
+            input_keys=list(input_keys),
+            output_keys=list(output_keys),
+        )
+
+    @staticmethod
+    def _edge(source, target, priority=0):
+        from framework.graph import EdgeSpec
+
+        return EdgeSpec(id=f"{source}_to_{target}", source=source, target=target, priority=priority)
+
+    def test_context_flows_along_forward_edges(self, server):
+        """Outputs propagate transitively to downstream nodes."""
+        import json
+
+        session = server._session
+        session.nodes = [
+            self._node("a", output_keys=["x"]),
+            self._node("b", input_keys=["x"], output_keys=["y"]),
+            self._node("c", input_keys=["x", "y"]),
+        ]
+        session.edges = [self._edge("b", "c"), self._edge("a", "b")]
+
+        result = json.loads(server.validate_graph())
+
+        assert result["valid"] is True
+        assert sorted(result["context_flow"]["c"]) == ["x", "y"]
+        assert result["context_flow"]["a"] == []
+
+    def test_forward_cycle_is_reported(self, server):
+        """Nodes on a cycle of forward edges get a warning instead of context."""
+        import json
+
+        session = server._session
+        session.nodes = [
+            self._node("a", output_keys=["x"]),
+            self._node("b", output_keys=["y"]),
+            self._node("c", input_keys=["y"]),
+        ]
+        session.edges = [self._edge("a", "b"), self._edge("b", "c"), self._edge("c", "b")]
+
+        result = json.loads(server.validate_graph())
+
+        assert any("['b', 'c']" in w and "cycle" in w for w in result["warnings"])
+        assert "b" not in result["context_flow"]
+
+    def test_feedback_edge_does_not_block_context_flow(self, server):
+        """Feedback edges (priority < 0) are excluded from the topological order."""
+        import json
+
+        session = server._session
+        session.nodes = [
+            self._node("a", output_keys=["x"]),
+            self._node("b", input_keys=["x"], output_keys=["y"]),
+        ]
+        session.edges = [self._edge("a", "b"), self._edge("b", "a", priority=-1)]
+
+        result = json.loads(server.validate_graph())
+
+        assert not any("cycle" in w for w in result["warnings"])
+        assert result["context_flow"]["b"] == ["x"]
+
+    def test_summary_mode_reports_validity_only(self, server):
+        """detailed=False agrees with the full report but omits everything else."""
+        import json
+
+        session = server._session
+        session.nodes = [self._node("a"), self._node("b", input_keys=["x"])]
+        session.edges = [self._edge("a", "b")]
+
+        assert json.loads(server.validate_graph(detailed=False)) == {"valid": False}
+        assert json.loads(server.validate_graph())["valid"] is False
+
+        session.nodes[0] = self._node("a", output_keys=["x"])
+        session.response_cache.clear()
+
+        assert json.loads(server.validate_graph(detailed=False)) == {"valid": True}
+
+    def test_cached_result_is_refreshed_after_edit(self, server, tmp_path, monkeypatch):
+        """validate_graph is served from cache until a tool saves the session."""
+        import json
+
+        monkeypatch.chdir(tmp_path)
+        server._session.nodes = [self._node("a", output_keys=["x"])]
+
+        first = server.validate_graph()
+        assert server.validate_graph() is first
+
+        server.add_node("b", "b", "b", "event_loop", '["x"]', "[]", system_prompt="go")
+        server.add_edge("a_to_b", "a", "b")
+
+        result = json.loads(server.validate_graph())
+        assert result["node_count"] == 2
+        assert result["context_flow"]["b"] == ["x"]
+
+
+class TestListSessions:
+    """Tests for agent_builder_server.list_sessions."""
+
+    def test_reflects_session_file_changes(self, tmp_path, monkeypatch):
+        """Cached summaries are refreshed when a session file is rewritten."""
+        if not MCP_AVAILABLE:
+            pytest.skip(MCP_SKIP_REASON)
+
+        import json
+
+        import framework.mcp.agent_builder_server as server
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(server, "_session", None)
+
+        created = json.loads(server.create_session("first"))
+        listed = json.loads(server.list_sessions())
+        assert [s["name"] for s in listed["sessions"]] == ["first"]
+
+        session_file = server.SESSIONS_DIR / f"{created['session_id']}.json"
+        data = json.loads(session_file.read_text())
+        data["name"] = "renamed-session"
+        session_file.write_text(json.dumps(data))
+
+        listed = json.loads(server.list_sessions())
+        assert [s["name"] for s in listed["sessions"]] == ["renamed-session"]
+        assert listed["active_session_id"] == created["session_id"]
+
+
+class TestListTests:
+    """Tests for agent_builder_server.list_tests."""
+
+    def test_reflects_test_file_changes(self, tmp_path):
+        """Cached parses are refreshed when a test file is rewritten."""
+        if not MCP_AVAILABLE:
+            pytest.skip(MCP_SKIP_REASON)
+
+        import json
+        import os
+
+        import framework.mcp.agent_builder_server as server
+
+        tests_dir = tmp_path / "tests"
+        tests_dir.mkdir()
+        test_file = tests_dir / "test_constraints.py"
+        test_file.write_text("def test_first():\n    pass\n")
+
+        listed = json.loads(server.list_tests("goal", str(tmp_path)))
+        assert [t["test_name"] for t in listed["tests"]] == ["test_first"]
+        assert json.loads(server.list_tests("goal", str(tmp_path))) == listed
+
+        test_file.write_text(
+            "def test_first():\n    pass\n\n\nasync def test_second():\n    pass\n"
+        )
+        stat = test_file.stat()
+        os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        listed = json.loads(server.list_tests("goal", str(tmp_path)))
+        assert [t["test_name"] for t in listed["tests"]] == ["test_first", "test_second"]
+        assert listed["by_type"] == {"constraint": 2}
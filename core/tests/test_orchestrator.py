@@ -26,65 +26,71 @@ def _patched(fn):
     return fn
 
 
+def _llm_factory() -> Mock:
+    """Provider factory standing in for LiteLLMProvider."""
+    return Mock(return_value=Mock(spec=LLMProvider))
+
+
 class TestOrchestratorLLMInitialization:
     """Test AgentOrchestrator LLM provider initialization."""
 
     @_patched
     def test_auto_creates_litellm_provider_when_no_llm_passed(self):
-        """Test that LiteLLMProvider is auto-created when no llm is passed."""
-        with patch.object(LiteLLMProvider, "__init__", return_value=None) as mock_init:
-            orchestrator = AgentOrchestrator()
+        """Test that a provider is auto-created when no llm is passed."""
+        factory = _llm_factory()
+        orchestrator = AgentOrchestrator(llm_factory=factory)
 
-            mock_init.assert_called_once_with(
-                model="claude-haiku-4-5-20251001", api_key=None, api_base=None
-            )
-            assert orchestrator._llm is not None
+        factory.assert_called_once_with(
+            model="claude-haiku-4-5-20251001", api_key=None, api_base=None
+        )
+        assert orchestrator._llm is factory.return_value
 
     @_patched
     def test_uses_custom_model_parameter(self):
-        """Test that custom model parameter is passed to LiteLLMProvider."""
-        with patch.object(LiteLLMProvider, "__init__", return_value=None) as mock_init:
-            AgentOrchestrator(model="gpt-4o")
+        """Test that custom model parameter is passed to the provider."""
+        factory = _llm_factory()
+        AgentOrchestrator(model="gpt-4o", llm_factory=factory)
 
-            mock_init.assert_called_once_with(model="gpt-4o", api_key=None, api_base=None)
+        factory.assert_called_once_with(model="gpt-4o", api_key=None, api_base=None)
 
     @_patched
     def test_supports_openai_model_names(self):
         """Test that OpenAI model names are supported."""
-        with patch.object(LiteLLMProvider, "__init__", return_value=None) as mock_init:
-            orchestrator = AgentOrchestrator(model="gpt-4o-mini")
+        factory = _llm_factory()
+        orchestrator = AgentOrchestrator(model="gpt-4o-mini", llm_factory=factory)
 
-            mock_init.assert_called_once_with(model="gpt-4o-mini", api_key=None, api_base=None)
-            assert orchestrator._model == "gpt-4o-mini"
+        factory.assert_called_once_with(model="gpt-4o-mini", api_key=None, api_base=None)
+        assert orchestrator._model == "gpt-4o-mini"
 
     @_patched
     def test_supports_anthropic_model_names(self):
         """Test that Anthropic model names are supported."""
-        with patch.object(LiteLLMProvider, "__init__", return_value=None) as mock_init:
-            orchestrator = AgentOrchestrator(model="claude-3-haiku-20240307")
+        factory = _llm_factory()
+        orchestrator = AgentOrchestrator(model="claude-3-haiku-20240307", llm_factory=factory)
 
-            mock_init.assert_called_once_with(
-                model="claude-3-haiku-20240307", api_key=None, api_base=None
-            )
-            assert orchestrator._model == "claude-3-haiku-20240307"
+        factory.assert_called_once_with(
+            model="claude-3-haiku-20240307", api_key=None, api_base=None
+        )
+        assert orchestrator._model == "claude-3-haiku-20240307"
 
     def test_skips_auto_creation_when_llm_passed(self):
         """Test that auto-creation is skipped when llm is explicitly passed."""
         mock_llm = Mock(spec=LLMProvider)
+        factory = _llm_factory()
 
-        with patch.object(LiteLLMProvider, "__init__", return_value=None) as mock_init:
-            orchestrator = AgentOrchestrator(llm=mock_llm)
+        orchestrator = AgentOrchestrator(llm=mock_llm, llm_factory=factory)
 
-            mock_init.assert_not_called()
-            assert orchestrator._llm is mock_llm
+        factory.assert_not_called()
+        assert orchestrator._llm is mock_llm
 
     @_patched
     def test_model_attribute_stored_correctly(self):
         """Test that _model attribute is stored correctly."""
-        with patch.object(LiteLLMProvider, "__init__", return_value=None):
-            orchestrator = AgentOrchestrator(model="gemini/gemini-1.5-flash")
+        orchestrator = AgentOrchestrator(
+            model="gemini/gemini-1.5-flash", llm_factory=_llm_factory()
+        )
 
-            assert orchestrator._model == "gemini/gemini-1.5-flash"
+        assert orchestrator._model == "gemini/gemini-1.5-flash"
 
 
 class TestOrchestratorLLMProviderType:
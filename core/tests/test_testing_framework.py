@@ -7,6 +7,9 @@
 - Error categorization heuristics
 """
 
+import json
+import os
+
 import pytest
 
 from framework.testing.categorizer import ErrorCategorizer
@@ -354,6 +357,86 @@ def test_get_approved_tests(self, storage):
         approved = storage.get_approved_tests("goal_001")
         assert len(approved) == 2  # approved and modified
 
+    def test_update_tests_bulk_moves_approval_index(self, storage):
+        """Bulk updates rewrite tests and move them between approval indexes."""
+        tests = []
+        for i in range(3):
+            test = Test(
+                id=f"test_{i}",
+                goal_id="goal_001",
+                parent_criteria_id="c1",
+                test_type=TestType.CONSTRAINT,
+                test_name=f"test_{i}",
+                test_code="pass",
+                description="test",
+            )
+            storage.save_test(test)
+            tests.append(test)
+
+        tests[0].approve("user")
+        tests[1].reject("flaky")
+        storage.update_tests_bulk(tests[:2])
+
+        assert storage._get_index("by_approval", "pending") == ["test_2"]
+        assert storage._get_index("by_approval", "approved") == ["test_0"]
+        assert storage._get_index("by_approval", "rejected") == ["test_1"]
+        assert storage.load_test("goal_001", "test_1").approval_status == ApprovalStatus.REJECTED
+
+    def test_save_tests_indexes_every_test(self, storage):
+        """Batch saves index each test exactly as save_test would."""
+        storage.save_tests(
+            Test(
+                id=f"test_{i}",
+                goal_id="goal_001",
+                parent_criteria_id="c1",
+                test_type=TestType.CONSTRAINT,
+                test_name=f"test_{i}",
+                test_code="pass",
+                description="test",
+            )
+            for i in range(3)
+        )
+
+        assert [t.id for t in storage.get_tests_by_goal("goal_001")] == [
+            "test_0",
+            "test_1",
+            "test_2",
+        ]
+        assert storage.get_tests_by_criteria("c1") == ["test_0", "test_1", "test_2"]
+        assert storage._get_index("by_approval", "pending") == ["test_0", "test_1", "test_2"]
+
+    def test_failed_tests_index_follows_last_result(self, storage):
+        """get_failed_tests_by_goal tracks saves, updates and pre-index stores."""
+        tests = [
+            Test(
+                id=f"test_{i}",
+                goal_id="goal_001",
+                parent_criteria_id="c1",
+                test_type=TestType.CONSTRAINT,
+                test_name=f"test_{i}",
+                test_code="pass",
+                description="test",
+            )
+            for i in range(3)
+        ]
+        tests[0].record_result(passed=False)
+        tests[1].record_result(passed=True)
+        storage.save_tests(tests[:2])
+        tests[2].record_result(passed=False)
+        storage.save_test(tests[2])
+
+        assert [t.id for t in storage.get_failed_tests_by_goal("goal_001")] == [
+            "test_0",
+            "test_2",
+        ]
+
+        tests[0].record_result(passed=True)
+        storage.update_test(tests[0])
+        assert [t.id for t in storage.get_failed_tests_by_goal("goal_001")] == ["test_2"]
+
+        (storage.base_path / "indexes" / "failed_by_goal" / "goal_001.json").unlink()
+        assert [t.id for t in storage.get_failed_tests_by_goal("goal_001")] == ["test_2"]
+
     def test_save_and_load_result(self, storage):
         """Test saving and loading test results."""
         result = TestResult(
@@ -460,6 +543,34 @@ def test_categorize_from_stack_trace(self, categorizer):
         )
         assert categorizer.categorize(result) == ErrorCategory.IMPLEMENTATION_ERROR
 
+    def test_categorize_ignores_case_in_ascii_and_unicode_text(self, categorizer):
+        """Patterns match case-insensitively whether or not the text is ASCII."""
+        for message in ("RATE LIMIT hit", "RATE LIMIT hit – réessayez", "RATE LİMİT hit"):
+            result = TestResult(test_id="t1", passed=False, duration_ms=100, error_message=message)
+            assert categorizer.categorize(result) == ErrorCategory.EDGE_CASE
+
+    def test_categorize_wildcard_patterns(self, categorizer):
+        """Patterns with gaps match across arbitrary text between their literals."""
+        result = TestResult(
+            test_id="t1",
+            passed=False,
+            duration_ms=100,
+            error_message="Retry budget of 3 attempts exhausted",
+        )
+        assert categorizer.categorize(result) == ErrorCategory.EDGE_CASE
+
+    def test_repeated_error_text_is_categorized_once(self, categorizer):
+        """Results with the same error text reuse the cached categorization."""
+        for test_id in ("t1", "t2"):
+            result = TestResult(
+                test_id=test_id, passed=False, duration_ms=100, error_message="KeyError: 'x'"
+            )
+            assert categorizer.categorize(result) == ErrorCategory.IMPLEMENTATION_ERROR
+
+        assert categorizer._match_category.cache_info().hits == 1
+        categorizer.clear_cache()
+        assert categorizer._match_category.cache_info().currsize == 0
+
     def test_get_fix_suggestion(self, categorizer):
         """Test fix suggestions for each category."""
         assert "Goal" in categorizer.get_fix_suggestion(ErrorCategory.LOGIC_ERROR)
@@ -537,6 +648,168 @@ def test_analyze_with_result(self, debug_tool, tmp_path):
         assert info.error_category == "implementation_error"
         assert info.suggested_fix is not None
 
+    def test_batch_analysis_matches_single_lookups(self, tmp_path):
+        """analyze_many and get_failure_summary load tests and results in batches."""
+        storage = TestStorage(tmp_path)
+        for i, category in enumerate([ErrorCategory.EDGE_CASE, None]):
+            test = Test(
+                id=f"test_{i}",
+                goal_id="goal_001",
+                parent_criteria_id="c1",
+                test_type=TestType.CONSTRAINT,
+                test_name=f"test_{i}",
+                test_code="pass",
+                description="A test",
+            )
+            test.record_result(passed=False)
+            storage.save_test(test)
+            storage.save_result(
+                test.id,
+                TestResult(
+                    test_id=test.id,
+                    passed=False,
+                    duration_ms=100,
+                    error_message="timeout",
+                    error_category=category,
+                ),
+            )
+        debug_tool = DebugTool(storage)
+
+        infos = debug_tool.analyze_many("goal_001", ["test_1", "missing", "test_0"])
+
+        assert [info.model_dump() for info in infos] == [
+            debug_tool.analyze("goal_001", test_id).model_dump()
+            for test_id in ["test_1", "missing", "test_0"]
+        ]
+        assert infos[0].error_category == "edge_case"
+        summary = debug_tool.get_failure_summary("goal_001")
+        assert summary["by_category"]["edge_case"] == ["test_0"]
+        assert summary["by_category"]["uncategorized"] == ["test_1"]
+
+        counted = debug_tool.get_failure_summary("goal_001", include_ids=False, sample_size=0)
+        assert counted["total_failures"] == 2
+        assert counted["by_category"]["edge_case"] == {"count": 1, "sample_ids": []}
+        assert counted["iteration_suggestions"] == summary["iteration_suggestions"]
+
+    def test_analysis_is_cached_until_result_changes(self, tmp_path):
+        """analyze reuses the on-disk analysis while the test and result are unchanged."""
+        storage = TestStorage(tmp_path)
+        test = Test(
+            id="test_001",
+            goal_id="goal_001",
+            parent_criteria_id="c1",
+            test_type=TestType.CONSTRAINT,
+            test_name="test_something",
+            test_code="pass",
+            description="A test",
+        )
+        storage.save_test(test)
+        storage.save_result(
+            "test_001",
+            TestResult(test_id="test_001", passed=False, duration_ms=1, error_message="timeout"),
+        )
+
+        first = DebugTool(storage).analyze("goal_001", "test_001")
+        cached = DebugTool(storage)
+        cached.categorizer = None  # a cache hit must not categorize again
+        assert cached.analyze("goal_001", "test_001").model_dump() == first.model_dump()
+
+        storage.save_result(
+            "test_001",
+            TestResult(test_id="test_001", passed=False, duration_ms=1, error_message="TypeError"),
+        )
+        fresh = DebugTool(storage).analyze("goal_001", "test_001")
+        assert fresh.error_message == "TypeError"
+        assert fresh.error_category == "implementation_error"
+
+    def test_invalid_cache_entry_is_a_miss(self, tmp_path):
+        """Unusable debug cache entries fall back to a fresh analysis."""
+        storage = TestStorage(tmp_path)
+        storage.save_test(
+            Test(
+                id="test_001",
+                goal_id="goal_001",
+                parent_criteria_id="c1",
+                test_type=TestType.CONSTRAINT,
+                test_name="test_something",
+                test_code="pass",
+                description="A test",
+            )
+        )
+        storage.save_result(
+            "test_001",
+            TestResult(test_id="test_001", passed=False, duration_ms=1, error_message="timeout"),
+        )
+        expected = DebugTool(storage).analyze("goal_001", "test_001").model_dump()
+        cache_file = tmp_path / "debug_cache" / "test_001.json"
+        fingerprint = storage.get_fingerprint("goal_001", "test_001")
+
+        for entry in ([], {"fingerprint": fingerprint}, {"fingerprint": fingerprint, "info": {}}):
+            cache_file.write_text(json.dumps(entry))
+            assert DebugTool(storage).analyze("goal_001", "test_001").model_dump() == expected
+
+    def test_runtime_data_is_loaded_once_per_run(self, tmp_path):
+        """Runtime runs are cached per run ID until clear_runtime_cache()."""
+        from types import SimpleNamespace
+
+        loads = []
+
+        class RuntimeStorage:
+            def load_run(self, run_id):
+                loads.append(run_id)
+                return SimpleNamespace(decisions=[], problems=[]) if run_id != "gone" else None
+
+        debug_tool = DebugTool(TestStorage(tmp_path), runtime_storage=RuntimeStorage())
+
+        for _ in range(3):
+            debug_tool.analyze("goal_001", "test_001", run_id="run_1")
+            debug_tool.analyze("goal_001", "test_001", run_id="gone")
+        assert loads == ["run_1", "gone", "gone", "gone"]
+
+        debug_tool.clear_runtime_cache()
+        debug_tool.analyze("goal_001", "test_001", run_id="run_1")
+        assert loads[-1] == "run_1"
+        assert len(loads) == 5
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+# ============================================================================
+# Approval CLI Tests
+# ============================================================================
+
+
+class TestApprovalEditor:
+    """Tests for running the editor from the approval CLI."""
+
+    @pytest.mark.skipif(not hasattr(os, "posix_spawnp"), reason="needs posix_spawnp")
+    def test_interrupt_stops_and_reaps_editor(self, tmp_path, monkeypatch):
+        """Ctrl-C while waiting terminates the editor instead of leaving it running."""
+        from framework.testing import approval_cli
+
+        editor = tmp_path / "editor"
+        editor.write_text("#!/bin/sh\ntrap '' INT\nsleep 30\n")
+        editor.chmod(0o755)
+
+        pids = []
+        spawn = os.posix_spawnp
+        monkeypatch.setattr(os, "posix_spawnp", lambda *args: pids.append(spawn(*args)) or pids[-1])
+        waitpid = os.waitpid
+        waits = []
+
+        def interrupted_waitpid(pid, options):
+            waits.append(pid)
+            if len(waits) == 1:
+                raise KeyboardInterrupt
+            return waitpid(pid, options)
+
+        monkeypatch.setattr(os, "waitpid", interrupted_waitpid)
+
+        with pytest.raises(KeyboardInterrupt):
+            approval_cli._run_editor(str(editor), str(tmp_path / "test.py"))
+
+        assert waits == [pids[0], pids[0]]
+        with pytest.raises(ChildProcessError):
+            waitpid(pids[0], os.WNOHANG)
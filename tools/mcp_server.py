@@ -27,18 +27,24 @@
 """
 
 import argparse
+import functools
+import importlib.util
 import logging
 import os
 import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
 
 logger = logging.getLogger(__name__)
 
 
-def setup_logger():
+def setup_logger(stdio: bool) -> None:
     """Configure logger for MCP server."""
     if not logger.handlers:
         # For STDIO mode, log to stderr; for HTTP mode, log to stdout
-        stream = sys.stderr if "--stdio" in sys.argv else sys.stdout
+        stream = sys.stderr if stdio else sys.stdout
         handler = logging.StreamHandler(stream)
         formatter = logging.Formatter("[MCP] %(message)s")
         handler.setFormatter(formatter)
@@ -46,57 +52,65 @@ def setup_logger():
         logger.setLevel(logging.INFO)
 
 
-setup_logger()
-
-# Suppress FastMCP banner in STDIO mode
-if "--stdio" in sys.argv:
-    # Monkey-patch rich Console to redirect to stderr
-    import rich.console
+def create_server(stdio: bool) -> "FastMCP":
+    """
+    Build the MCP server with all tools registered.
 
-    _original_console_init = rich.console.Console.__init__
+    FastMCP and the tool modules are imported here rather than at module
+    level, so --help and argument errors return without loading them.
+    """
+    # Suppress FastMCP banner in STDIO mode
+    if stdio:
+        # Monkey-patch rich Console to redirect to stderr
+        import rich.console
 
-    def _patched_console_init(self, *args, **kwargs):
-        kwargs["file"] = sys.stderr  # Force all rich output to stderr
-        _original_console_init(self, *args, **kwargs)
+        _original_console_init = rich.console.Console.__init__
 
-    rich.console.Console.__init__ = _patched_console_init
+        def _patched_console_init(self, *args, **kwargs):
+            kwargs["file"] = sys.stderr  # Force all rich output to stderr
+            _original_console_init(self, *args, **kwargs)
 
-from fastmcp import FastMCP  # noqa: E402
-from starlette.requests import Request  # noqa: E402
-from starlette.responses import PlainTextResponse  # noqa: E402
+        rich.console.Console.__init__ = _patched_console_init
 
-from aden_tools.credentials import CredentialError, CredentialStoreAdapter  # noqa: E402
-from aden_tools.tools import register_all_tools  # noqa: E402
+    from fastmcp import FastMCP
+    from starlette.requests import Request
+    from starlette.responses import PlainTextResponse
 
-credentials = CredentialStoreAdapter.default()
+    from aden_tools.credentials import CredentialError, CredentialStoreAdapter
+    from aden_tools.tools import register_all_tools
 
-# Tier 1: Validate startup-required credentials (if any)
-try:
-    credentials.validate_startup()
-    logger.info("Startup credentials validated")
-except CredentialError as e:
-    # Non-fatal - tools will validate their own credentials when called
-    logger.warning(str(e))
+    credentials = CredentialStoreAdapter.default()
 
-mcp = FastMCP("tools")
+    # Tier 1: Validate startup-required credentials (if any)
+    try:
+        credentials.validate_startup()
+        logger.info("Startup credentials validated")
+    except CredentialError as e:
+        # Non-fatal - tools will validate their own credentials when called
+        logger.warning(str(e))
 
-# Register all tools with the MCP server, passing credential store
-tools = register_all_tools(mcp, credentials=credentials)
-# Only print to stdout in HTTP mode (STDIO mode requires clean stdout for JSON-RPC)
-if "--stdio" not in sys.argv:
-    logger.info(f"Registered {len(tools)} tools: {tools}")
+    mcp = FastMCP("tools")
 
+    # Register all tools with the MCP server, passing credential store
+    tools = register_all_tools(mcp, credentials=credentials)
+    # Only print to stdout in HTTP mode (STDIO mode requires clean stdout for JSON-RPC)
+    if not stdio:
+        logger.info(f"Registered {len(tools)} tools: {tools}")
 
-@mcp.custom_route("/health", methods=["GET"])
-async def health_check(request: Request) -> PlainTextResponse:
-    """Health check endpoint for container orchestration."""
-    return PlainTextResponse("OK")
+    # Probes configured with a trailing slash are served directly rather than
+    # through Starlette's 307 redirect to /health
+    @mcp.custom_route("/health", methods=["GET"])
+    @mcp.custom_route("/health/", methods=["GET"])
+    async def health_check(request: Request) -> PlainTextResponse:
+        """Health check endpoint for container orchestration."""
+        return PlainTextResponse("OK")
 
+    @mcp.custom_route("/", methods=["GET"])
+    async def index(request: Request) -> PlainTextResponse:
+        """Landing page for browser visits."""
+        return PlainTextResponse("Welcome to the Hive MCP Server")
 
-@mcp.custom_route("/", methods=["GET"])
-async def index(request: Request) -> PlainTextResponse:
-    """Landing page for browser visits."""
-    return PlainTextResponse("Welcome to the Hive MCP Server")
+    return mcp
 
 
 def main() -> None:
@@ -120,12 +134,21 @@ def main() -> None:
     )
     args = parser.parse_args()
 
+    setup_logger(args.stdio)
+    mcp = create_server(args.stdio)
     if args.stdio:
         # STDIO mode: only JSON-RPC messages go to stdout
         mcp.run(transport="stdio")
     else:
         logger.info(f"Starting HTTP server on {args.host}:{args.port}")
-        mcp.run(transport="http", host=args.host, port=args.port)
+        # uvicorn already uses httptools when it is installed, but serves on the
+        # loop anyio creates, so uvloop has to be requested here (HTTP only)
+        import anyio
+
+        anyio.run(
+            functools.partial(mcp.run_async, transport="http", host=args.host, port=args.port),
+            backend_options={"use_uvloop": importlib.util.find_spec("uvloop") is not None},
+        )
 
 
 if __name__ == "__main__":
@@ -1,22 +1,272 @@
+import asyncio
+import functools
 import os
 import re
+from collections.abc import Iterator
 
 from mcp.server.fastmcp import FastMCP
 
 from ..security import WORKSPACES_DIR, get_secure_path
 
+# Zero-width assertions make a match depend on the text around it. Only
+# patterns without any of these can be prefiltered by searching a whole
+# file at once: a match inside one line is then also a match in the file.
+_CONTEXT_TOKENS = ("^", "$", "\\A", "\\Z", "\\b", "\\B", "(?=", "(?!", "(?<")
+
+# Larger files are streamed line by line instead of read whole for the prefilter
+_PREFILTER_MAX_BYTES = 8 * 1024 * 1024
+
+# Files whose first bytes are not valid UTF-8 (images, archives, ...) are
+# streamed, which stops at the first undecodable chunk, instead of read whole
+_SNIFF_BYTES = 4096
+
+# Longer matched lines (minified files, data dumps) are cut to this many characters
+MAX_LINE_CONTENT_CHARS = 512
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile(pattern: str) -> re.Pattern[str]:
+    """Compile a search pattern once; agents tend to repeat the same searches."""
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=1024)
+def _required_literal(pattern: str) -> str:
+    """
+    Return the longest run of plain characters that every match contains.
+
+    Only top-level literals qualify, since anything inside a group,
+    alternation or repeat may be skipped. Returns "" when there is no such
+    run, when the pattern ignores case, or when the run starts the pattern,
+    because re already searches for a literal prefix itself.
+    """
+    parsed = re._parser.parse(pattern)
+    if parsed.state.flags & re.IGNORECASE:
+        return ""
+
+    best = run = ""
+    best_start = start = 0
+    for i, (op, value) in enumerate(parsed):
+        if op is not re._constants.LITERAL:
+            run = ""
+            continue
+        if not run:
+            start = i
+        run += chr(value)
+        if len(run) > len(best):
+            best, best_start = run, start
+    return best if best_start > 0 else ""
+
+
+def _iter_files(directory: str, recursive: bool) -> Iterator[str]:
+    """
+    Yield the files in a directory, and in its subdirectories if recursive.
+
+    Files come in os.walk order and with its symlink handling (linked files
+    are searched, linked directories are not entered), but are classified
+    from the directory entries instead of stat-ing each path. Unreadable
+    subdirectories are skipped.
+    """
+    stack = [directory]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
+            if current == directory:
+                if not recursive:
+                    raise
+                return
+            continue
+
+        subdirs = []
+        for entry in entries:
+            if not recursive:
+                if entry.is_file():
+                    yield entry.path
+            elif entry.is_dir():
+                if not entry.is_symlink():
+                    subdirs.append(entry.path)
+            else:
+                yield entry.path
+        stack.extend(reversed(subdirs))
+
+
+def _grep_file(
+    regex: re.Pattern[str],
+    file_path: str,
+    display_path: str,
+    prefilter: bool,
+    literal: str,
+    matches: list[dict],
+    limit: int,
+) -> None:
+    """
+    Append the matching lines of one file to matches, stopping at limit matches.
+
+    With prefilter, files lacking the pattern's required literal are skipped
+    with a plain substring test before the regex runs.
+
+    Raises UnicodeDecodeError after appending the matches that precede
+    undecodable bytes, just like reading the file line by line.
+    """
+    with open(file_path, encoding="utf-8") as f:
+        if (
+            prefilter
+            and os.fstat(f.fileno()).st_size <= _PREFILTER_MAX_BYTES
+            and _is_utf8_prefix(f.buffer.peek(_SNIFF_BYTES)[:_SNIFF_BYTES])
+        ):
+            try:
+                content = f.read()
+            except UnicodeDecodeError:
+                # Rescan line by line so matches before the bad bytes are kept
+                f.seek(0)
+            else:
+                if literal in content:
+                    _grep_text(regex, content, display_path, matches, limit)
+                return
+
+        for i, line in enumerate(f, 1):
+            if regex.search(line):
+                matches.append(_match(display_path, i, line))
+                if len(matches) >= limit:
+                    return
+
+
+def _is_utf8_prefix(head: bytes) -> bool:
+    """Whether head decodes as UTF-8, allowing a character cut off at the end."""
+    try:
+        head.decode("utf-8")
+    except UnicodeDecodeError as e:
+        return e.reason == "unexpected end of data"
+    return True
+
+
+def _grep_text(
+    regex: re.Pattern[str],
+    content: str,
+    display_path: str,
+    matches: list[dict],
+    limit: int,
+) -> None:
+    """
+    Append the matching lines of a prefiltered file's text.
+
+    A search of the whole text finds the leftmost position any line could
+    match at, so the lines before it are skipped and only the line holding
+    the candidate is checked (the candidate itself may span lines).
+    """
+    pos = counted = 0
+    line_number = 1
+    while (match := regex.search(content, pos)) is not None:
+        start = content.rfind("\n", 0, match.start()) + 1
+        if start == len(content):
+            break
+        end = content.find("\n", match.start()) + 1 or len(content)
+        line_number += content.count("\n", counted, start)
+        counted = start
+
+        line = content[start:end]
+        if regex.search(line):
+            matches.append(_match(display_path, line_number, line))
+            if len(matches) >= limit:
+                return
+        if end == len(content):
+            # Last line handled; an empty match at the end would find it again
+            break
+        pos = end
+
+
+def _match(display_path: str, line_number: int, line: str) -> dict:
+    return {
+        "file": display_path,
+        "line_number": line_number,
+        "line_content": line.strip()[:MAX_LINE_CONTENT_CHARS],
+    }
+
+
+def _grep_search(
+    path: str,
+    pattern: str,
+    workspace_id: str,
+    agent_id: str,
+    session_id: str,
+    recursive: bool,
+    max_matches: int,
+) -> dict:
+    """Run a grep_search call; runs in a worker thread, off the event loop."""
+    # 1. Early Regex Validation (Issue #55 Acceptance Criteria)
+    # Using .msg for a cleaner, less noisy error response
+    try:
+        regex = _compile(pattern)
+    except re.error as e:
+        return {"error": f"Invalid regex pattern: {e.msg}"}
+
+    try:
+        secure_path = get_secure_path(path, workspace_id, agent_id, session_id)
+        # Use session dir root for relative path calculations
+        session_root = os.path.join(WORKSPACES_DIR, workspace_id, agent_id, session_id)
+
+        max_matches = max(1, max_matches)
+        matches: list[dict] = []
+        prefilter = not any(token in pattern for token in _CONTEXT_TOKENS)
+        literal = _required_literal(pattern) if prefilter else ""
+
+        if os.path.isfile(secure_path):
+            files = [secure_path]
+        else:
+            files = _iter_files(secure_path, recursive)
+
+        for file_path in files:
+            # Calculate relative path for display
+            display_path = os.path.relpath(file_path, session_root)
+            try:
+                # One match past the limit tells whether results were cut off
+                _grep_file(
+                    regex, file_path, display_path, prefilter, literal, matches, max_matches + 1
+                )
+            except (UnicodeDecodeError, PermissionError):
+                # Skips files that cannot be decoded or lack permissions
+                continue
+            if len(matches) > max_matches:
+                break
+
+        truncated = len(matches) > max_matches
+        del matches[max_matches:]
+
+        return {
+            "success": True,
+            "pattern": pattern,
+            "path": path,
+            "recursive": recursive,
+            "matches": matches,
+            "total_matches": len(matches),
+            "truncated": truncated,
+        }
+
+    # 2. Specific Exception Handling (Issue #55 Requirements)
+    except FileNotFoundError:
+        return {"error": f"Directory or file not found: {path}"}
+    except PermissionError:
+        return {"error": f"Permission denied accessing: {path}"}
+    except Exception as e:
+        # 3. Generic Fallback
+        return {"error": f"Failed to perform grep search: {str(e)}"}
+
 
 def register_tools(mcp: FastMCP) -> None:
     """Register grep search tools with the MCP server."""
 
     @mcp.tool()
-    def grep_search(
+    async def grep_search(
         path: str,
         pattern: str,
         workspace_id: str,
         agent_id: str,
         session_id: str,
         recursive: bool = False,
+        max_matches: int = 1000,
     ) -> dict:
         """
         Search for a pattern in a file or directory within the session sandbox.
@@ -31,70 +281,19 @@ def grep_search(
             agent_id: The ID of the agent
             session_id: The ID of the current session
             recursive: Whether to search recursively in directories (default: False)
+            max_matches: Maximum matches to return (default 1000); "truncated" is
+                True when more were found. Long lines are cut to 512 characters.
 
         Returns:
             Dict with search results and match details, or error dict
         """
-        # 1. Early Regex Validation (Issue #55 Acceptance Criteria)
-        # Using .msg for a cleaner, less noisy error response
-        try:
-            regex = re.compile(pattern)
-        except re.error as e:
-            return {"error": f"Invalid regex pattern: {e.msg}"}
-
-        try:
-            secure_path = get_secure_path(path, workspace_id, agent_id, session_id)
-            # Use session dir root for relative path calculations
-            session_root = os.path.join(WORKSPACES_DIR, workspace_id, agent_id, session_id)
-
-            matches = []
-
-            if os.path.isfile(secure_path):
-                files = [secure_path]
-            elif recursive:
-                files = []
-                for root, _, filenames in os.walk(secure_path):
-                    for filename in filenames:
-                        files.append(os.path.join(root, filename))
-            else:
-                files = [
-                    os.path.join(secure_path, f)
-                    for f in os.listdir(secure_path)
-                    if os.path.isfile(os.path.join(secure_path, f))
-                ]
-
-            for file_path in files:
-                # Calculate relative path for display
-                display_path = os.path.relpath(file_path, session_root)
-                try:
-                    with open(file_path, encoding="utf-8") as f:
-                        for i, line in enumerate(f, 1):
-                            if regex.search(line):
-                                matches.append(
-                                    {
-                                        "file": display_path,
-                                        "line_number": i,
-                                        "line_content": line.strip(),
-                                    }
-                                )
-                except (UnicodeDecodeError, PermissionError):
-                    # Skips files that cannot be decoded or lack permissions
-                    continue
-
-            return {
-                "success": True,
-                "pattern": pattern,
-                "path": path,
-                "recursive": recursive,
-                "matches": matches,
-                "total_matches": len(matches),
-            }
-
-        # 2. Specific Exception Handling (Issue #55 Requirements)
-        except FileNotFoundError:
-            return {"error": f"Directory or file not found: {path}"}
-        except PermissionError:
-            return {"error": f"Permission denied accessing: {path}"}
-        except Exception as e:
-            # 3. Generic Fallback
-            return {"error": f"Failed to perform grep search: {str(e)}"}
+        return await asyncio.to_thread(
+            _grep_search,
+            path,
+            pattern,
+            workspace_id,
+            agent_id,
+            session_id,
+            recursive,
+            max_matches,
+        )
@@ -1,3 +1,4 @@
+import functools
 import os
 
 # Use user home directory for workspaces
@@ -13,6 +14,12 @@ def get_secure_path(path: str, workspace_id: str, agent_id: str, session_id: str
     session_dir = os.path.abspath(os.path.join(WORKSPACES_DIR, workspace_id, agent_id, session_id))
     os.makedirs(session_dir, exist_ok=True)
 
+    return _resolve_in_session(path, session_dir)
+
+
+@functools.lru_cache(maxsize=8192)
+def _resolve_in_session(path: str, session_dir: str) -> str:
+    """Resolve path against session_dir; pure string work, so results are cached."""
     # Normalize whitespace to prevent bypass via leading spaces/tabs
     path = path.strip()
 
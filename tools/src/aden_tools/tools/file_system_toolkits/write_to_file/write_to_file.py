@@ -1,3 +1,4 @@
+import asyncio
 import os
 
 from mcp.server.fastmcp import FastMCP
@@ -5,11 +6,45 @@
 from ..security import get_secure_path
 
 
+def _write_to_file(
+    path: str, content: str, workspace_id: str, agent_id: str, session_id: str, append: bool
+) -> dict:
+    """Write or append to a file; runs in a worker thread, off the event loop."""
+    try:
+        secure_path = get_secure_path(path, workspace_id, agent_id, session_id)
+        if os.linesep != "\n":
+            # Match the newline translation of a text-mode write
+            content = content.replace("\n", os.linesep)
+        data = content.encode("utf-8")
+        flags = os.O_WRONLY | os.O_CREAT | (os.O_APPEND if append else os.O_TRUNC)
+        flags |= getattr(os, "O_BINARY", 0)
+        try:
+            fd = os.open(secure_path, flags, 0o666)
+        except FileNotFoundError:
+            # Only the first write into a new directory pays for creating it
+            os.makedirs(os.path.dirname(secure_path), exist_ok=True)
+            fd = os.open(secure_path, flags, 0o666)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        return {
+            "success": True,
+            "path": path,
+            "mode": "appended" if append else "written",
+            "bytes_written": len(data),
+        }
+    except Exception as e:
+        return {"error": f"Failed to write to file: {str(e)}"}
+
+
 def register_tools(mcp: FastMCP) -> None:
     """Register file write tools with the MCP server."""
 
     @mcp.tool()
-    def write_to_file(
+    async def write_to_file(
         path: str,
         content: str,
         workspace_id: str,
@@ -45,17 +80,6 @@ def write_to_file(
         Returns:
             Dict with success status and path, or error dict
         """
-        try:
-            secure_path = get_secure_path(path, workspace_id, agent_id, session_id)
-            os.makedirs(os.path.dirname(secure_path), exist_ok=True)
-            mode = "a" if append else "w"
-            with open(secure_path, mode, encoding="utf-8") as f:
-                f.write(content)
-            return {
-                "success": True,
-                "path": path,
-                "mode": "appended" if append else "written",
-                "bytes_written": len(content.encode("utf-8")),
-            }
-        except Exception as e:
-            return {"error": f"Failed to write to file: {str(e)}"}
+        return await asyncio.to_thread(
+            _write_to_file, path, content, workspace_id, agent_id, session_id, append
+        )
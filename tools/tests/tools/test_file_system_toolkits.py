@@ -214,9 +214,14 @@ def write_to_file_fn(self, mcp):
         register_tools(mcp)
         return mcp._tool_manager._tools["write_to_file"].fn
 
-    def test_write_new_file(self, write_to_file_fn, mock_workspace, mock_secure_path, tmp_path):
+    @pytest.mark.asyncio
+    async def test_write_new_file(
+        self, write_to_file_fn, mock_workspace, mock_secure_path, tmp_path
+    ):
         """Writing to a new file creates it successfully."""
-        result = write_to_file_fn(path="new_file.txt", content="Test content", **mock_workspace)
+        result = await write_to_file_fn(
+            path="new_file.txt", content="Test content", **mock_workspace
+        )
 
         assert result["success"] is True
         assert result["mode"] == "written"
@@ -227,12 +232,15 @@ def test_write_new_file(self, write_to_file_fn, mock_workspace, mock_secure_path
         assert created_file.exists()
         assert created_file.read_text() == "Test content"
 
-    def test_write_append_mode(self, write_to_file_fn, mock_workspace, mock_secure_path, tmp_path):
+    @pytest.mark.asyncio
+    async def test_write_append_mode(
+        self, write_to_file_fn, mock_workspace, mock_secure_path, tmp_path
+    ):
         """Writing with append=True appends to existing file."""
         test_file = tmp_path / "append_test.txt"
         test_file.write_text("Line 1\n")
 
-        result = write_to_file_fn(
+        result = await write_to_file_fn(
             path="append_test.txt", content="Line 2\n", append=True, **mock_workspace
         )
 
@@ -240,35 +248,42 @@ def test_write_append_mode(self, write_to_file_fn, mock_workspace, mock_secure_p
         assert result["mode"] == "appended"
         assert test_file.read_text() == "Line 1\nLine 2\n"
 
-    def test_write_overwrite_existing(
+    @pytest.mark.asyncio
+    async def test_write_overwrite_existing(
         self, write_to_file_fn, mock_workspace, mock_secure_path, tmp_path
     ):
         """Writing to existing file overwrites it by default."""
         test_file = tmp_path / "overwrite.txt"
         test_file.write_text("Original content")
 
-        result = write_to_file_fn(path="overwrite.txt", content="New content", **mock_workspace)
+        result = await write_to_file_fn(
+            path="overwrite.txt", content="New content", **mock_workspace
+        )
 
         assert result["success"] is True
         assert result["mode"] == "written"
         assert test_file.read_text() == "New content"
 
-    def test_write_creates_parent_directories(
+    @pytest.mark.asyncio
+    async def test_write_creates_parent_directories(
         self, write_to_file_fn, mock_workspace, mock_secure_path, tmp_path
     ):
         """Writing creates parent directories if they don't exist."""
-        result = write_to_file_fn(path="nested/dir/file.txt", content="Test", **mock_workspace)
+        result = await write_to_file_fn(
+            path="nested/dir/file.txt", content="Test", **mock_workspace
+        )
 
         assert result["success"] is True
         created_file = tmp_path / "nested" / "dir" / "file.txt"
         assert created_file.exists()
         assert created_file.read_text() == "Test"
 
-    def test_write_empty_content(
+    @pytest.mark.asyncio
+    async def test_write_empty_content(
         self, write_to_file_fn, mock_workspace, mock_secure_path, tmp_path
     ):
         """Writing empty content creates empty file."""
-        result = write_to_file_fn(path="empty.txt", content="", **mock_workspace)
+        result = await write_to_file_fn(path="empty.txt", content="", **mock_workspace)
 
         assert result["success"] is True
         assert result["bytes_written"] == 0
@@ -442,14 +457,15 @@ def grep_search_fn(self, mcp):
         register_tools(mcp)
         return mcp._tool_manager._tools["grep_search"].fn
 
-    def test_grep_search_single_file(
+    @pytest.mark.asyncio
+    async def test_grep_search_single_file(
         self, grep_search_fn, mock_workspace, mock_secure_path, tmp_path
     ):
         """Searching a single file returns matches."""
         test_file = tmp_path / "search_test.txt"
         test_file.write_text("Line 1\nLine 2 with pattern\nLine 3")
 
-        result = grep_search_fn(path="search_test.txt", pattern="pattern", **mock_workspace)
+        result = await grep_search_fn(path="search_test.txt", pattern="pattern", **mock_workspace)
 
         assert result["success"] is True
         assert result["total_matches"] == 1
@@ -457,20 +473,22 @@ def test_grep_search_single_file(
         assert result["matches"][0]["line_number"] == 2
         assert "pattern" in result["matches"][0]["line_content"]
 
-    def test_grep_search_no_matches(
+    @pytest.mark.asyncio
+    async def test_grep_search_no_matches(
         self, grep_search_fn, mock_workspace, mock_secure_path, tmp_path
     ):
         """Searching with no matches returns empty list."""
         test_file = tmp_path / "test.txt"
         test_file.write_text("Hello World")
 
-        result = grep_search_fn(path="test.txt", pattern="nonexistent", **mock_workspace)
+        result = await grep_search_fn(path="test.txt", pattern="nonexistent", **mock_workspace)
 
         assert result["success"] is True
         assert result["total_matches"] == 0
         assert result["matches"] == []
 
-    def test_grep_search_directory_non_recursive(
+    @pytest.mark.asyncio
+    async def test_grep_search_directory_non_recursive(
         self, grep_search_fn, mock_workspace, mock_secure_path, tmp_path
     ):
         """Searching directory non-recursively only searches immediate files."""
@@ -483,13 +501,16 @@ def test_grep_search_directory_non_recursive(
         nested.mkdir()
         (nested / "nested_file.txt").write_text("pattern in nested")
 
-        result = grep_search_fn(path=".", pattern="pattern", recursive=False, **mock_workspace)
+        result = await grep_search_fn(
+            path=".", pattern="pattern", recursive=False, **mock_workspace
+        )
 
         assert result["success"] is True
         assert result["total_matches"] == 1  # Only finds pattern in root, not in nested
         assert result["recursive"] is False
 
-    def test_grep_search_directory_recursive(
+    @pytest.mark.asyncio
+    async def test_grep_search_directory_recursive(
         self, grep_search_fn, mock_workspace, mock_secure_path, tmp_path
     ):
         """Searching directory recursively finds matches in subdirectories."""
@@ -501,38 +522,101 @@ def test_grep_search_directory_recursive(
         nested.mkdir()
         (nested / "nested_file.txt").write_text("pattern in nested")
 
-        result = grep_search_fn(path=".", pattern="pattern", recursive=True, **mock_workspace)
+        result = await grep_search_fn(path=".", pattern="pattern", recursive=True, **mock_workspace)
 
         assert result["success"] is True
         assert result["total_matches"] == 2  # Finds pattern in both files
         assert result["recursive"] is True
 
-    def test_grep_search_regex_pattern(
+    @pytest.mark.asyncio
+    async def test_grep_search_regex_pattern(
         self, grep_search_fn, mock_workspace, mock_secure_path, tmp_path
     ):
         """Searching with regex pattern finds complex matches."""
         test_file = tmp_path / "regex_test.txt"
         test_file.write_text("foo123bar\nfoo456bar\nbaz789baz\n")
 
-        result = grep_search_fn(path="regex_test.txt", pattern=r"foo\d+bar", **mock_workspace)
+        result = await grep_search_fn(path="regex_test.txt", pattern=r"foo\d+bar", **mock_workspace)
 
         assert result["success"] is True
         assert result["total_matches"] == 2
         assert result["matches"][0]["line_number"] == 1
         assert result["matches"][1]["line_number"] == 2
 
-    def test_grep_search_multiple_matches_per_line(
+    @pytest.mark.asyncio
+    async def test_grep_search_multiple_matches_per_line(
         self, grep_search_fn, mock_workspace, mock_secure_path, tmp_path
     ):
         """Searching returns one match per line even with multiple occurrences."""
         test_file = tmp_path / "multi_match.txt"
         test_file.write_text("hello hello hello\nworld\nhello again")
 
-        result = grep_search_fn(path="multi_match.txt", pattern="hello", **mock_workspace)
+        result = await grep_search_fn(path="multi_match.txt", pattern="hello", **mock_workspace)
 
         assert result["success"] is True
         assert result["total_matches"] == 2  # Line 1 and Line 3
 
+    @pytest.mark.asyncio
+    async def test_grep_search_pattern_with_inner_literal(
+        self, grep_search_fn, mock_workspace, mock_secure_path, tmp_path
+    ):
+        """Files are matched by the full regex, not just its required literal."""
+        (tmp_path / "a.py").write_text("raise ValueError\nError alone\n")
+        (tmp_path / "b.py").write_text("no failures here\n")
+
+        result = await grep_search_fn(path=".", pattern=r"\w+Error", **mock_workspace)
+
+        assert [m["line_content"] for m in result["matches"]] == ["raise ValueError"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("pattern", [".*", ""])
+    async def test_grep_search_empty_match_without_trailing_newline(
+        self, grep_search_fn, mock_workspace, mock_secure_path, tmp_path, pattern
+    ):
+        """A pattern matching the empty string reports each line once."""
+        (tmp_path / "x.py").write_text("one\ntwo")
+
+        result = await grep_search_fn(path="x.py", pattern=pattern, **mock_workspace)
+
+        assert [m["line_content"] for m in result["matches"]] == ["one", "two"]
+        assert result["truncated"] is False
+
+    @pytest.mark.asyncio
+    async def test_grep_search_skips_binary_files(
+        self, grep_search_fn, mock_workspace, mock_secure_path, tmp_path
+    ):
+        """Files that are not valid UTF-8 are skipped without failing the search."""
+        (tmp_path / "image.png").write_bytes(b"\x89PNG pattern\n" + bytes(range(256)))
+        (tmp_path / "notes.txt").write_text("pattern one\n")
+
+        result = await grep_search_fn(path=".", pattern="pattern", **mock_workspace)
+
+        assert result["success"] is True
+        assert [m["line_content"] for m in result["matches"]] == ["pattern one"]
+
+    @pytest.mark.asyncio
+    async def test_grep_search_max_matches_truncates(
+        self, grep_search_fn, mock_workspace, mock_secure_path, tmp_path
+    ):
+        """Matches beyond max_matches are dropped and long lines are shortened."""
+        test_file = tmp_path / "many.txt"
+        test_file.write_text("hit\n" * 5 + "hit" + "x" * 1000 + "\n")
+
+        result = await grep_search_fn(
+            path="many.txt", pattern="hit", max_matches=3, **mock_workspace
+        )
+
+        assert result["total_matches"] == 3
+        assert result["truncated"] is True
+
+        result = await grep_search_fn(
+            path="many.txt", pattern="hit", max_matches=6, **mock_workspace
+        )
+
+        assert result["total_matches"] == 6
+        assert result["truncated"] is False
+        assert len(result["matches"][-1]["line_content"]) == 512
+
 
 class TestExecuteCommandTool:
     """Tests for execute_command_tool."""